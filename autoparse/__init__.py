@@ -3,9 +3,10 @@ autoparse
 *********
 """
 from ._conv import cast
+from ._conv import cast_array
 #: pattern generators
 from . import pattern
 #: text parsers
 from . import find
 
-__all__ = ['pattern', 'find', 'cast']
+__all__ = ['pattern', 'find', 'cast', 'cast_array']
@@ -2,21 +2,47 @@
 """
 
 from collections.abc import Sequence as _Sequence
+import numpy
+
+# Characters that make a string that casts to float fail to cast to int
+_FLOAT_CHARS = frozenset('.eEnN')
 
 
 def cast(seq):
     """ cast each string in a nested sequence to int or float, if possible
     (recursive)
+
+    A sequence of numeric strings, or of rows of them, is cast in bulk.
     """
     if _is_string(seq):
         ret = _cast_string(seq)
     elif _is_sequence(seq):
-        ret = tuple(cast(obj) for obj in seq)
+        ret = _cast_numeric(seq)
+        if ret is None:
+            ret = tuple(cast(obj) for obj in seq)
     else:
         ret = seq
     return ret
 
 
+def cast_array(seq, dtype=float):
+    """ cast a (nested) sequence of numeric strings to a numpy array
+
+    The Fortran `D` exponents are replaced once for the whole block, and
+    the values are converted in a single pass, so this is the fast way to
+    read the values of a large block of captures.
+
+    :param seq: strings, as a flat sequence or nested rows of equal length
+    :type seq: tuple(str) or tuple(tuple(str))
+    :param dtype: numpy data type to cast the strings to
+    :type dtype: type
+    :rtype: numpy.ndarray
+    """
+    strs = numpy.asarray(seq, dtype=str)
+    vals = _normalize_exponents(strs.ravel().tolist())
+    return numpy.array(vals, dtype=dtype).reshape(strs.shape)
+
+
 def _is_string(obj):
     return isinstance(obj, (str, bytes, bytearray))
 
@@ -39,3 +65,55 @@ def _cast_string(string):
             pass
 
     return ret
+
+
+def _cast_numeric(seq):
+    """ cast a sequence of strings, or of rows of them, in bulk
+
+    Strings that `int` can read are cast to int, as they would be one by
+    one; if any string is not numeric, each string is cast on its own.
+    Returns None for any other sequence.
+    """
+
+    if seq and all(type(obj) is str for obj in seq):
+        rows = None
+        strs = seq
+    elif seq and all(type(obj) is tuple and obj and
+                     all(type(sub) is str for sub in obj) for obj in seq):
+        rows = tuple(map(len, seq))
+        strs = [string for row in seq for string in row]
+    else:
+        return None
+
+    num_strs = _normalize_exponents(strs)
+    try:
+        vals = numpy.array(num_strs, dtype=float).tolist()
+        vals = tuple(
+            val if _FLOAT_CHARS.intersection(string) else int(string)
+            for string, val in zip(num_strs, vals))
+    except ValueError:
+        vals = tuple(map(_cast_string, strs))
+
+    if rows is not None:
+        idx = 0
+        row_vals = []
+        for nvals in rows:
+            row_vals.append(vals[idx:idx+nvals])
+            idx += nvals
+        vals = tuple(row_vals)
+
+    return vals
+
+
+def _normalize_exponents(strs):
+    """ replace the Fortran `D` exponents of a list of strings, all at once
+    """
+    block = '\0'.join(strs)
+    if 'D' in block:
+        block = block.replace('D+', 'E+').replace('D-', 'E-')
+        new_strs = block.split('\0')
+        # Only if no string had the separator in it
+        strs = (new_strs if len(new_strs) == len(strs) else
+                [string.replace('D+', 'E+').replace('D-', 'E-')
+                 for string in strs])
+    return list(strs)
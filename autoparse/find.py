@@ -15,6 +15,9 @@ from autoparse._lib import LINESPACES as _LINESPACES
 from autoparse._lib import NUMBER as _NUMBER
 from autoparse._pattern import maybe as _maybe
 
+# Size of the last chunk of a string scanned first by the reverse search
+LAST_CHUNK_SIZE = 2 ** 15
+
 
 def has_match(pattern, string, case=True):
     """ does this string have a pattern match?
@@ -86,6 +89,73 @@ def matcher(pattern, case=True):
     return partial(has_match, pattern, case=case)
 
 
+def scanner(pattern_dct, case=True):
+    """ build a scanner that looks for several patterns at once
+
+    Each pattern is compiled once, along with the literal text that all of
+    its matches start with. Scanners can be added together, as tuples, to
+    combine patterns with different case sensitivities.
+
+    :param pattern_dct: the pattern(s) for each condition, by name; a
+        condition is met if any one of its patterns matches
+    :type pattern_dct: dict[str: str or tuple(str)]
+    :param case: if capitalization matters
+    :type case: bool
+    :return: the name, compiled pattern, and leading literal of each pattern
+    :rtype: tuple
+    """
+    entries = []
+    for name, patterns in pattern_dct.items():
+        if isinstance(patterns, str):
+            patterns = (patterns,)
+        for pattern in patterns:
+            regex = re.compile(pattern, flags=_re_flags(case=case))
+            literal = _literal_prefix(pattern)
+            if not case and not literal.isascii():
+                literal = ''
+            entries.append((name, regex, literal))
+    return tuple(entries)
+
+
+def scan(scanner_, string):
+    """ which conditions of a scanner does this string have a match for?
+
+    The string is lowercased once for all case-insensitive patterns, and a
+    pattern is only searched for, from the first place its leading literal
+    appears, if that literal is found at all.
+
+    :param scanner_: a scanner, from `scanner()`
+    :type scanner_: tuple
+    :param string: string to search
+    :type string: str
+    :return: whether each condition of the scanner has a match
+    :rtype: dict[str: bool]
+    """
+    found_dct = dict.fromkeys((entry[0] for entry in scanner_), False)
+
+    # Lowercasing only keeps the positions of an ASCII string
+    low_string = None
+    is_ascii = string.isascii()
+
+    for name, regex, literal in scanner_:
+        if found_dct[name]:
+            continue
+
+        if regex.flags & re.IGNORECASE:
+            if is_ascii and literal:
+                if low_string is None:
+                    low_string = string.lower()
+                pos = low_string.find(literal.lower())
+            else:
+                pos = 0
+        else:
+            pos = string.find(literal)
+
+        found_dct[name] = pos >= 0 and regex.search(string, pos) is not None
+
+    return found_dct
+
+
 def all_captures(pattern, string, case=True):
     """ capture(s) for all matches of a capturing pattern
 
@@ -153,7 +223,10 @@ def first_capture(pattern, string, case=True):
 
 
 def last_capture(pattern, string, case=True):
-    """ capture(s) from first match for a capturing pattern
+    """ capture(s) from last match for a capturing pattern
+
+    The last of `all_captures`, but found by searching back from the end
+    of the string (see `last_match`).
 
     :param pattern: pattern to search for
     :type pattern: str
@@ -164,8 +237,66 @@ def last_capture(pattern, string, case=True):
     :return: last instance of this pattern
     :rtype: str
     """
-    caps_lst = all_captures(pattern, string, case=case)
-    return caps_lst[-1] if caps_lst else None
+    match = last_match(pattern, string, case=case)
+    if match is None:
+        cap = None
+    else:
+        # Mirror re.findall: the full match without groups, and empty
+        # strings for groups that did not participate in the match
+        caps = match.groups(default='')
+        cap = (match.group(0) if not caps else
+               caps[0] if len(caps) == 1 else caps)
+    return cap
+
+
+def last_match(pattern, string, case=True):
+    """ last match of a pattern, found by searching back from the end of
+    the string
+
+    Chunks at the end of the string, starting at line starts, are scanned
+    forward for their last match, doubling the chunk until it holds a match
+    that is also the last match of the next larger chunk; a match cut short
+    by the chunk start (e.g., part of a multi-line block) gets extended in
+    the larger chunk, so it is not kept. The cost is set by the distance of
+    the last match from the end of the string, not by the string length.
+
+    This is the last match of a forward scan over the whole string unless
+    where one match ends and the next starts depends on text more than a
+    chunk back (e.g., '(\\w+)\\s+(\\w+)' pairing every word in the string),
+    which is not the case for patterns anchored by some header text.
+
+    :param pattern: pattern to search for
+    :type pattern: str
+    :param string: string to search
+    :type string: str
+    :param case: if capitalization matters
+    :type case: bool
+    :return: last match of this pattern
+    :rtype: re.Match
+    """
+    if not pattern or string is None:
+        return None
+
+    regex = re.compile(pattern, flags=_re_flags(case=case))
+
+    size = LAST_CHUNK_SIZE
+    prev_span = None
+    while True:
+        start = max(len(string) - size, 0)
+        start = string.rfind('\n', 0, start) + 1 if start else 0
+
+        match = None
+        for match in regex.finditer(string, start):
+            pass
+
+        span = match.span() if match is not None else None
+        if not start or (span is not None and span == prev_span):
+            break
+
+        prev_span = span
+        size *= 2
+
+    return match
 
 
 def first_named_capture(pattern, string, case=True):
@@ -300,6 +431,61 @@ def _re_sub(pattern, repl, string, case=True):
     return re.sub(pattern, repl, string, count=0, flags=flags)
 
 
+def _literal_prefix(pattern):
+    """ the literal text that every match of a pattern starts with
+    """
+    if _has_top_level_alternation(pattern):
+        return ''
+
+    chars = []
+    idx = 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        if (char == '\\' and idx + 1 < len(pattern)
+                and not pattern[idx+1].isalnum()):
+            chars.append(pattern[idx+1])
+            idx += 2
+        elif char in '.^$*+?{}[]|()\\':
+            # A quantified character may not be there at all
+            if char in '*+?{' and chars:
+                chars.pop()
+            break
+        else:
+            chars.append(char)
+            idx += 1
+
+    return ''.join(chars)
+
+
+def _has_top_level_alternation(pattern):
+    """ is this pattern a set of alternatives, outside of any group?
+    """
+    depth = 0
+    idx = 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        if char == '\\':
+            idx += 1
+        elif char == '[':
+            # Skip the character class, which may start with a literal ]
+            idx += 1
+            if pattern[idx:idx+1] == '^':
+                idx += 1
+            if pattern[idx:idx+1] == ']':
+                idx += 1
+            while idx < len(pattern) and pattern[idx] != ']':
+                idx += 2 if pattern[idx] == '\\' else 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+        idx += 1
+
+    return False
+
+
 def _re_flags(case=True):
     flags = re.MULTILINE
     if not case:
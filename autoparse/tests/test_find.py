@@ -56,6 +56,58 @@ def test__first_capture():
     assert cap == 'Cl'
 
 
+def test__last_match(monkeypatch):
+    """ test autoparse.find.last_match and autoparse.find.last_capture
+    """
+    # Scan back over several chunks, with blocks cut by the chunk starts
+    string = ''.join(
+        f'Step {idx}\n' + XYZ_STRING.replace('0.', f'{idx}.')
+        for idx in range(200))
+    block_ptt = autoparse.pattern.capturing(autoparse.pattern.series(
+        autoparse.pattern.LINE_START + XYZ_LINE_PATTERN,
+        autoparse.pattern.NEWLINE))
+    chunk_size = autoparse.find.LAST_CHUNK_SIZE
+    for ptt in (block_ptt, XYZ_LINE_PATTERN, '(Step) ([0-9]+)', 'Step'):
+        for size in (50, 1000, chunk_size):
+            monkeypatch.setattr(autoparse.find, 'LAST_CHUNK_SIZE', size)
+            match = autoparse.find.last_match(ptt, string)
+            assert match.string is string
+            assert (autoparse.find.last_capture(ptt, string) ==
+                    autoparse.find.all_captures(ptt, string)[-1])
+    monkeypatch.undo()
+
+    assert autoparse.find.last_capture('(Step) 199', string) == 'Step'
+    assert autoparse.find.last_capture('(Step) 200', string) is None
+    assert autoparse.find.last_capture('(cl)', XYZ_STRING, case=False) == 'Cl'
+    assert autoparse.find.last_match('(cl)', XYZ_STRING) is None
+
+
+def test__scan():
+    """ test autoparse.find.scanner and autoparse.find.scan
+    """
+    scanner = autoparse.find.scanner({
+        'cl': autoparse.pattern.escape('Cl') + autoparse.pattern.SPACES,
+        'xyz': (XYZ_LINE_PATTERN, 'xyzk'),
+        'none': ('abc|def', r'Cl\s+-?[0-9]+\.5'),
+    }, case=False) + autoparse.find.scanner({'c': '(?:Cl|C)[ ]'})
+    assert autoparse.find.scan(scanner, XYZ_STRING) == {
+        'cl': True, 'xyz': True, 'none': False, 'c': True}
+    assert autoparse.find.scan(scanner, XYZ_STRING.lower()) == {
+        'cl': True, 'xyz': True, 'none': False, 'c': False}
+    # (a non-ASCII string, with a Kelvin sign that only matches ignoring case)
+    assert autoparse.find.scan(scanner, 'xyz\u212a abc') == {
+        'cl': False, 'xyz': True, 'none': True, 'c': False}
+
+    # Leading literals, if any
+    assert autoparse.find._literal_prefix(
+        autoparse.pattern.escape('Opt. (a) done')) == 'Opt. (a) done'
+    assert autoparse.find._literal_prefix('Opt. (a) done') == 'Opt'
+    assert autoparse.find._literal_prefix('ab*c') == 'a'
+    assert autoparse.find._literal_prefix('a[|]b') == 'a'
+    assert autoparse.find._literal_prefix('ab|c') == ''
+    assert autoparse.find._literal_prefix(r'\sab') == ''
+
+
 def test__remove_empty_lines():
     """ test autoparse.find.remove_empty_lines
     """
@@ -212,6 +264,23 @@ def test__multis():
                      ('H', -0.8823, -1.224388, -0.229636))
 
 
+def test__cast_array():
+    """ test autoparse.cast_array, and the bulk casting of numeric captures
+    """
+    caps = (('1', '2.5D-01', '-3.0D+02'), ('4', '5.0', 'nan'))
+    vals = autoparse.cast(caps)
+    assert vals[0] == (1, 0.25, -300.) and isinstance(vals[0][0], int)
+    assert vals[1][:2] == (4, 5.) and np.isnan(vals[1][2])
+
+    arr = autoparse.cast_array(caps)
+    assert arr.shape == (2, 3) and arr.dtype == float
+    assert np.allclose(arr[0], (1., 0.25, -300.))
+    assert (autoparse.cast_array(('1', '2'), dtype=int) == (1, 2)).all()
+
+    # Non-numeric strings are left as they are
+    assert autoparse.cast(('1D+01', '1D5', 'x')) == (10., '1D5', 'x')
+
+
 STRING_TESTWHERE = [
     'Species CH3C2CH3',
     '      RRHO',
@@ -2,31 +2,7 @@
   Centralized autorun functions
 """
 
-# Useful Running Functions
-from autorun._script import SCRIPT_DCT
-from autorun._run import from_input_string
-from autorun._run import run_script
-from autorun._run import write_input
-from autorun._run import read_output
-from autorun._host import host_node
-from autorun._host import process_id
-from autorun._proc import execute_function_in_parallel
-from autorun._proc import timeout
-
-# Single Program Runners
-from autorun import intder
-from autorun import mess
-from autorun import nst
-from autorun import onedmin
-from autorun import pac99
-from autorun import polyrate
-from autorun import projrot
-from autorun import thermp
-from autorun import varecof
-
-# MultiProgram Runners
-from autorun._multiprog import projected_frequencies
-from autorun._multiprog import thermo
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -54,3 +30,21 @@ __all__ = [
     'projected_frequencies',
     'thermo'
 ]
+
+
+# Submodules and functions are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    # Useful running functions
+    'SCRIPT_DCT': 'autorun._script',
+    'run_script': 'autorun._run',
+    'from_input_string': 'autorun._run',
+    'write_input': 'autorun._run',
+    'read_output': 'autorun._run',
+    'host_node': 'autorun._host',
+    'process_id': 'autorun._host',
+    'execute_function_in_parallel': 'autorun._proc',
+    'timeout': 'autorun._proc',
+    # MultiProgram Runners
+    'projected_frequencies': 'autorun._multiprog',
+    'thermo': 'autorun._multiprog',
+})
@@ -129,8 +129,7 @@ def thermo(thermp_script_str, pac99_script_str, run_dir,
     """
 
     # Obtain the temperatures from the pf.dat file used to fit the thermo
-    temps, _, _, _ = mess_io.reader.pfs.partition_function(pf_str)
-    temps = temps[:-1]
+    temps = tuple(mess_io.reader.pfs.pf_table(pf_str)['temp'][:-1].tolist())
 
     # Run ThermP and read the Heat-of-Formation at 298K
     formula_str = automol.form.string(formula)
@@ -2,6 +2,7 @@
 """
 
 import os
+import time
 import subprocess
 import warnings
 import stat
@@ -10,6 +11,7 @@ import stat
 SCRIPT_NAME = 'run.sh'
 INPUT_NAME = 'run.inp'
 OUTPUT_NAME = 'run.out'
+POLL_INTERVAL = 5.0
 
 
 def from_input_string(script_str, run_dir, input_str,
@@ -141,8 +143,19 @@ def read_output(run_dir, output_names=(OUTPUT_NAME,)):
     return output_strs
 
 
-def run_script(script_str, run_dir, script_name=SCRIPT_NAME):
+def run_script(script_str, run_dir, script_name=SCRIPT_NAME,
+               monitor=None, poll_interval=POLL_INTERVAL):
     """ run a program from a script
+
+        If a monitor function is given, the script is launched in the
+        background and `monitor()` is called every `poll_interval` seconds
+        while it runs, plus once more after it exits, so callers can report
+        progress from the files the program is writing.
+
+        :param monitor: function with no arguments called while running
+        :type monitor: function
+        :param poll_interval: seconds between calls to the monitor
+        :type poll_interval: float
     """
 
     with EnterDirectory(run_dir):
@@ -160,11 +173,21 @@ def run_script(script_str, run_dir, script_name=SCRIPT_NAME):
         # Call the program
         # print('run test',run_dir,script_name)
         # print('script',script_str)
-        try:
-            subprocess.check_call(f'./{script_name:s}')
-        except subprocess.CalledProcessError:
-            msg = f'Program run failed in {run_dir}'
-            warnings.warn(msg)
+        if monitor is None:
+            try:
+                subprocess.check_call(f'./{script_name:s}')
+            except subprocess.CalledProcessError:
+                msg = f'Program run failed in {run_dir}'
+                warnings.warn(msg)
+        else:
+            with subprocess.Popen(f'./{script_name:s}') as proc:
+                while proc.poll() is None:
+                    monitor()
+                    time.sleep(poll_interval)
+            monitor()
+            if proc.returncode != 0:
+                msg = f'Program run failed in {run_dir}'
+                warnings.warn(msg)
         # except subprocess.CalledProcessError as err:
             # As long as the program wrote an output, continue with a warning
             # if all(os.path.isfile(name) for name in output_names):
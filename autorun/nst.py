@@ -3,10 +3,12 @@
 
 import os
 import copy
+import warnings
 import nst_io
 import elstruct
 from autorun._run import from_input_string
 from autorun._script import SCRIPT_DCT
+from autorun._proc import execute_function_in_parallel
 from ioformat import pathtools
 
 
@@ -210,19 +212,23 @@ def hessians_for_nst(run_dir,
                      prog, geo, charge, mults,
                      method, basis, orb_label, ini_kwargs):
     """ Calculate the two spin state hessians using elstruct
+
+        The calculations for each spin state are independent, so they are
+        launched concurrently in the HESS-1, HESS-2 directories, and each
+        Hessian is read as soon as its own calculation finishes.
     """
 
     qc_script_str = _qc_script_str(prog, replace=False)
 
-    hessians = ()
-    for idx, mult in enumerate(mults):
-        _run_dir = os.path.join(run_dir, f'HESS-{idx+1}')
-
-        inp_str = _qc_input_str('hess', prog, geo, charge, mult,
-                                method, basis, orb_label, ini_kwargs[idx])
+    args = (run_dir, qc_script_str,
+            prog, geo, charge, mults,
+            method, basis, orb_label, ini_kwargs)
+    hess_lst = execute_function_in_parallel(
+        _run_hessians, tuple(range(len(mults))), args, nprocs=len(mults))
 
-        output_strs = from_input_string(qc_script_str, _run_dir, inp_str)
-        hessians += (elstruct.reader.hessian(prog, output_strs[0]),)
+    # Put the Hessians back in the order of the spin states
+    hess_dct = dict(hess_lst)
+    hessians = tuple(hess_dct.get(idx) for idx in range(len(mults)))
 
     if any(hess is None for hess in hessians):
         hessians = None
@@ -230,6 +236,37 @@ def hessians_for_nst(run_dir,
     return hessians
 
 
+def _run_hessians(run_dir, qc_script_str,
+                  prog, geo, charge, mults,
+                  method, basis, orb_label, ini_kwargs,
+                  idxs, output_queue):
+    """ Run and read the Hessians for a subset of the spin states;
+        written for use with execute_function_in_parallel
+
+        A spin state whose program could not be run, or wrote no output, gets
+        a None Hessian. The Hessians are put on the queue the parent process
+        waits on even if a calculation raises.
+    """
+
+    hess_dct = dict.fromkeys(idxs)
+    try:
+        for idx in idxs:
+            _run_dir = os.path.join(run_dir, f'HESS-{idx+1}')
+            inp_str = _qc_input_str('hess', prog, geo, charge, mults[idx],
+                                    method, basis, orb_label, ini_kwargs[idx])
+            try:
+                output_strs = from_input_string(
+                    qc_script_str, _run_dir, inp_str)
+            except OSError as err:
+                warnings.warn(f'Program run failed in {_run_dir}: {err}')
+                continue
+
+            if output_strs[0] is not None:
+                hess_dct[idx] = elstruct.reader.hessian(prog, output_strs[0])
+    finally:
+        output_queue.put(tuple(hess_dct.items()))
+
+
 # General runners
 def direct(run_dir, nst_job,
            qc_prog, geo, zero_ene,
@@ -0,0 +1,67 @@
+""" test autorun.nst
+"""
+
+import tempfile
+import multiprocessing
+import pytest
+from autorun import nst
+
+
+GEO = (('H', (0.0, 0.0, 0.0)),)
+MULTS = (2, 4)
+HESS = ((0.1, 0.0, 0.0), (0.0, 0.2, 0.0), (0.0, 0.0, 0.3))
+# A script writing the Hessian of a Gaussian output for the H atom
+HESS_SCRIPT_STR = (
+    '#!/usr/bin/env bash\n'
+    "cat > run.out << 'EOF'\n"
+    ' Force constants in Cartesian coordinates: \n'
+    '                1             2             3 \n'
+    '      1  0.100000D+00\n'
+    '      2  0.000000D+00  0.200000D+00\n'
+    '      3  0.000000D+00  0.000000D+00  0.300000D+00\n'
+    'EOF\n')
+
+
+def _run_hessians(script_str):
+    """ run autorun.nst._run_hessians for both spin states with a script
+    """
+    run_dir = tempfile.mkdtemp()
+    output_queue = multiprocessing.Queue()
+    nst._run_hessians(
+        run_dir, script_str, 'gaussian09', GEO, 0, MULTS,
+        'b3lyp', 'sto-3g', 'UU', ({}, {}), (0, 1), output_queue)
+    return output_queue.get(timeout=10)
+
+
+def test__run_hessians():
+    """ test that autorun.nst._run_hessians reads the Hessian of each spin
+        state
+    """
+    assert _run_hessians(HESS_SCRIPT_STR) == ((0, HESS), (1, HESS))
+
+
+def test__run_hessians_failure():
+    """ test that autorun.nst._run_hessians still puts a result on the
+        queue when a calculation fails
+    """
+
+    # A program that could not be run, or that wrote no output
+    with pytest.warns(UserWarning, match='Program run failed'):
+        assert _run_hessians('') == ((0, None), (1, None))
+    with pytest.warns(UserWarning, match='Program run failed'):
+        assert _run_hessians('#!/usr/bin/env bash\nexit 1\n') == (
+            (0, None), (1, None))
+
+    # A calculation that raises
+    run_dir = tempfile.mkdtemp()
+    output_queue = multiprocessing.Queue()
+    with pytest.raises(AssertionError):
+        nst._run_hessians(
+            run_dir, HESS_SCRIPT_STR, 'not-a-program', GEO, 0, MULTS,
+            'b3lyp', 'sto-3g', 'UU', ({}, {}), (0, 1), output_queue)
+    assert output_queue.get(timeout=10) == ((0, None), (1, None))
+
+
+if __name__ == '__main__':
+    test__run_hessians()
+    test__run_hessians_failure()
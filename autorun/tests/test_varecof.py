@@ -0,0 +1,43 @@
+""" test autorun.varecof
+"""
+
+import os
+import tempfile
+from autorun import varecof
+
+
+LOG_STR = 'line 1\nline 2\nline 3\n'
+
+
+def test__sampling_monitor():
+    """ test autorun.varecof.sampling_monitor on a log that is still being
+        written
+    """
+
+    run_dir = tempfile.mkdtemp()
+    os.mkdir(os.path.join(run_dir, 'scratch'))
+    metrics_lst = []
+    monitor = varecof.sampling_monitor(run_dir, metrics_lst.append)
+
+    # Nothing written yet
+    monitor()
+    assert metrics_lst[-1] == {'nlines': 0, 'last_line': None, 'nscratch': 0}
+
+    # A partially written last line is only read once it is complete
+    with open(os.path.join(run_dir, 'varecof.out'), 'w',
+              encoding='utf-8') as out_obj:
+        out_obj.write(LOG_STR[:10])
+        out_obj.flush()
+        monitor()
+        assert metrics_lst[-1] == {
+            'nlines': 1, 'last_line': 'line 1', 'nscratch': 0}
+
+        out_obj.write(LOG_STR[10:])
+    os.mkdir(os.path.join(run_dir, 'scratch', 'sample1'))
+    monitor()
+    assert metrics_lst[-1] == {
+        'nlines': 3, 'last_line': 'line 3', 'nscratch': 1}
+
+
+if __name__ == '__main__':
+    test__sampling_monitor()
@@ -2,6 +2,7 @@
 """
 
 import os
+import io
 import shutil
 import stat
 import ioformat
@@ -9,6 +10,7 @@ import automol
 import varecof_io
 from autorun._run import run_script
 from autorun._run import from_input_string
+from autorun._run import POLL_INTERVAL
 from autorun._script import SCRIPT_DCT
 
 
@@ -48,6 +50,9 @@ POT_OUTPUT_NAMES = (
 
 OUTPUT_NAMES = ('flux.out',)
 DIVSUR_OUTPUT_NAMES1 = ('divsur.out',)
+SAMPLING_OUTPUT_NAME = 'varecof.out'
+MCFLUX_OUTPUT_NAME = 'mc_flux.out'
+MCFLUX_HEADER = '              0    0.00000e-00'
 
 # Default dictionary of parameters for VRC-TST
 VRC_DCT = {
@@ -71,8 +76,15 @@ VRC_DCT = {
 
 # Specialized runners
 def flux_file(multi_script_str, conv_multi_script_str, mcflux_script_str,
-              run_dir, input_strs_dct, nprocs=1):
+              run_dir, input_strs_dct, nprocs=1,
+              progress_callback=None, poll_interval=POLL_INTERVAL):
     """  Calculate the flux file
+
+         If a progress callback is given, it is called periodically while
+         the multi sampler runs with a dictionary of the current metrics:
+         `nlines`, the number of lines written to varecof.out so far,
+         `last_line`, the last of them (None before any is written), and
+         `nscratch`, the number of entries in the scratch directory.
     """
 
     # Write all of the input strings
@@ -93,11 +105,14 @@ def flux_file(multi_script_str, conv_multi_script_str, mcflux_script_str,
     else:
         os.mkdir(scratch_path)
 
-    # Run VaReCoF
+    # Run VaReCoF, watching the sampling output as it is written
     print('\nSampling at all the dividing surfaces...')
     multi_script_str = multi_script_str.format(nprocs)
+    monitor = (sampling_monitor(run_dir, progress_callback)
+               if progress_callback is not None else None)
     run_script(multi_script_str, run_dir,
-               script_name=MULTI_SCRIPT_NAME)
+               script_name=MULTI_SCRIPT_NAME,
+               monitor=monitor, poll_interval=poll_interval)
 
     # Run convert script to get tst.out file
     print('\nGenerating tst.out file '
@@ -111,12 +126,78 @@ def flux_file(multi_script_str, conv_multi_script_str, mcflux_script_str,
     run_script(mcflux_script_str, run_dir,
                script_name=MCFLUX_SCRIPT_NAME)
 
-    flux_str = ioformat.pathtools.read_file(run_dir, 'mc_flux.out')
-
     # Fix the flux file to make the top line: 0.000 0.00
-    flux_lines = flux_str.splitlines()
-    flux_lines[0] = '              0    0.00000e-00'
-    flux_str = '\n'.join(flux_lines)
+    flux_str = fix_flux_header(run_dir)
+
+    return flux_str
+
+
+def sampling_monitor(run_dir, progress_callback):
+    """ Build a function that reads whatever the VaReCoF multi sampler has
+        appended to varecof.out since it was last called, and passes the
+        sampling metrics (see `flux_file`) to the progress callback.
+
+        :param run_dir: directory where VaReCoF is running
+        :type run_dir: str
+        :param progress_callback: function called with the metrics dict
+        :type progress_callback: function
+        :rtype: function
+    """
+
+    # Use absolute paths since the monitor is called from within run_dir
+    out_path = os.path.abspath(os.path.join(run_dir, SAMPLING_OUTPUT_NAME))
+    scratch_path = os.path.abspath(os.path.join(run_dir, 'scratch'))
+
+    metrics_dct = {'nlines': 0, 'last_line': None, 'nscratch': 0}
+    offset = 0
+
+    def _monitor():
+        nonlocal offset
+        new_str, offset = ioformat.pathtools.read_new_lines(out_path, offset)
+        new_lines = new_str.splitlines()
+        if new_lines:
+            metrics_dct['nlines'] += len(new_lines)
+            metrics_dct['last_line'] = new_lines[-1]
+        metrics_dct['nscratch'] = (len(os.listdir(scratch_path))
+                                   if os.path.isdir(scratch_path) else 0)
+
+        progress_callback(dict(metrics_dct))
+
+    return _monitor
+
+
+def fix_flux_header(run_dir, flux_name=MCFLUX_OUTPUT_NAME):
+    """ Rewrite the mc_flux output file so that its top line is the zero
+        energy point, streaming the file line-by-line into a new copy
+        rather than reading and splitting the whole thing.
+
+        :param run_dir: directory where mc_flux was run
+        :type run_dir: str
+        :param flux_name: name of the mc_flux output file
+        :type flux_name: str
+        :returns: the fixed flux file string
+        :rtype: str
+    """
+
+    flux_path = os.path.join(run_dir, flux_name)
+    if not os.path.isfile(flux_path):
+        return None
+
+    tmp_path = flux_path + '.tmp'
+    flux_sio = io.StringIO()
+    with open(flux_path, mode='r', encoding='utf-8') as flux_obj, \
+            open(tmp_path, mode='w', encoding='utf-8') as tmp_obj:
+        for idx, line in enumerate(flux_obj):
+            if idx == 0:
+                line = MCFLUX_HEADER + '\n'
+            tmp_obj.write(line)
+            flux_sio.write(line)
+    os.replace(tmp_path, flux_path)
+
+    # Drop the final newline, as for '\n'.join(lines)
+    flux_str = flux_sio.getvalue()
+    if flux_str.endswith('\n'):
+        flux_str = flux_str[:-1]
 
     return flux_str
 
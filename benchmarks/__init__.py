@@ -0,0 +1,10 @@
+""" Benchmarks of the readers and writers on large synthetic inputs
+
+    The benchmarks follow the conventions of airspeed velocity (asv): each
+    class has `params`, a `setup` that builds the input, and `time_*` and
+    `peakmem_*` methods. They can also be run, and compared to a stored
+    baseline, without asv:
+
+        python -m benchmarks.run --save      # store the baseline
+        python -m benchmarks.run             # flag regressions against it
+"""
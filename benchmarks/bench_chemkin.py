@@ -0,0 +1,37 @@
+""" Benchmarks of the Chemkin mechanism parser, for mechanisms of growing
+    size
+"""
+
+from benchmarks import generators
+
+
+class Reactions:
+    """ chemkin_io.parser.mechanism.reactions on a mechanism of N reactions
+    """
+
+    params = [100, 1000, 5000]
+    param_names = ['nrxns']
+
+    def setup(self, nrxns):
+        """ Build the mechanism
+
+            (The parser depends on autoreact; without it, the benchmark is
+            skipped)
+        """
+        try:
+            # pylint: disable=import-outside-toplevel
+            from chemkin_io.parser import mechanism
+        except ImportError as err:
+            raise NotImplementedError(str(err)) from err
+        self.reactions_ = mechanism.reactions
+        self.mech_str = generators.chemkin_mechanism(nrxns)
+
+    def time_reactions(self, _):
+        """ Time the parsing of the reactions
+        """
+        self.reactions_(self.mech_str)
+
+    def peakmem_reactions(self, _):
+        """ Peak memory of the parsing of the reactions
+        """
+        self.reactions_(self.mech_str)
@@ -0,0 +1,54 @@
+""" Benchmarks of the Gaussian readers, for molecules and optimizations of
+    growing size
+"""
+
+import elstruct.reader
+from benchmarks import generators
+
+
+class Hessian:
+    """ elstruct.reader.hessian (through autoread.matrix.read) on the
+        Hessian of N atoms
+    """
+
+    params = [10, 40, 100]
+    param_names = ['natoms']
+
+    def setup(self, natoms):
+        """ Build the log
+        """
+        self.out_str = generators.gaussian_log(natoms, 1)
+
+    def time_hessian(self, _):
+        """ Time the reading of the Hessian
+        """
+        elstruct.reader.hessian('gaussian16', self.out_str)
+
+    def peakmem_hessian(self, _):
+        """ Peak memory of the reading of the Hessian
+        """
+        elstruct.reader.hessian('gaussian16', self.out_str)
+
+
+class OptTrajectory:
+    """ elstruct.reader.opt_trajectory on an optimization of 20 atoms and N
+        steps
+    """
+
+    params = [10, 100, 1000]
+    param_names = ['nsteps']
+
+    def setup(self, nsteps):
+        """ Build the log
+        """
+        self.out_str = generators.gaussian_log(20, nsteps)
+
+    def time_opt_trajectory(self, _):
+        """ Time the reading of the trajectory
+        """
+        elstruct.reader.opt_trajectory('gaussian16', self.out_str)
+
+    def peakmem_opt_trajectory(self, _):
+        """ Peak memory of the reading of the trajectory
+        """
+        elstruct.reader.opt_trajectory('gaussian16', self.out_str)
@@ -0,0 +1,56 @@
+""" Benchmarks of the import of the packages, and of a first reader call, as
+    paid by a short-lived worker process
+"""
+
+import os
+import sys
+import subprocess
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def _run_python(statement):
+    """ Run a statement in a fresh interpreter
+    """
+    subprocess.run([sys.executable, '-c', statement], cwd=ROOT_PATH,
+                   check=True)
+
+
+class Imports:
+    """ The import of a package, in a fresh interpreter (so the time
+        includes the start of the interpreter)
+    """
+
+    params = ['ioformat', 'elstruct', 'elstruct.reader', 'mess_io',
+              'mess_io.reader', 'chemkin_io', 'autorun']
+    param_names = ['package']
+
+    def setup(self, _):
+        """ Nothing to build
+        """
+
+    def time_import(self, pkg):
+        """ Time the import of the package
+        """
+        _run_python(f'import {pkg}')
+
+
+class ReaderCall:
+    """ The import of elstruct.reader and a first call of one of its
+        readers, in a fresh interpreter
+    """
+
+    params = ['has_error_message', 'status_report']
+    param_names = ['reader']
+
+    def setup(self, _):
+        """ Nothing to build
+        """
+
+    def time_first_call(self, reader):
+        """ Time the import and call
+        """
+        args = ("'gaussian16', 'scf_noconv', ''"
+                if reader == 'has_error_message' else "'gaussian16', ''")
+        _run_python(f'import elstruct.reader\n'
+                    f'elstruct.reader.{reader}({args})')
@@ -0,0 +1,57 @@
+""" Benchmarks of the MESS readers: the rate constants of a rate output and
+    the hot branching fractions of a log, for networks of growing size
+"""
+
+import mess_io.reader
+from benchmarks import generators
+
+
+class RateConstants:
+    """ mess_io.reader.rates.get_rxn_ktp_dct on a network of N wells
+    """
+
+    params = [4, 16, 48]
+    param_names = ['nwells']
+
+    def setup(self, nwells):
+        """ Build the rate output
+        """
+        self.out_str = generators.mess_rate_output(nwells)
+
+    def time_get_rxn_ktp_dct(self, _):
+        """ Time the reading of the rate constants
+        """
+        mess_io.reader.rates.get_rxn_ktp_dct(self.out_str)
+
+    def peakmem_get_rxn_ktp_dct(self, _):
+        """ Peak memory of the reading of the rate constants
+        """
+        mess_io.reader.rates.get_rxn_ktp_dct(self.out_str)
+
+
+class HotBranching:
+    """ mess_io.reader.hoten.extract_hot_branching on a network of N wells
+    """
+
+    params = [4, 16, 48]
+    param_names = ['nwells']
+
+    def setup(self, nwells):
+        """ Build the log
+        """
+        wells, prds = generators.mess_species(nwells)
+        self.log_str = generators.mess_hot_log(nwells)
+        self.hot_ene_dct = {well: 0.0 for well in wells}
+        self.spc_lst = list(wells + prds)
+
+    def time_extract_hot_branching(self, _):
+        """ Time the reading of the branching fractions of all hot wells
+        """
+        mess_io.reader.hoten.extract_hot_branching(
+            self.log_str, self.hot_ene_dct, self.spc_lst)
+
+    def peakmem_extract_hot_branching(self, _):
+        """ Peak memory of the reading of the branching fractions
+        """
+        mess_io.reader.hoten.extract_hot_branching(
+            self.log_str, self.hot_ene_dct, self.spc_lst)
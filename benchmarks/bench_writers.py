@@ -0,0 +1,83 @@
+""" Benchmarks of the MESS writers, which fill their Mako templates with
+    ioformat.build_mako_str, for inputs of growing size
+"""
+
+import mess_io.writer
+from elstruct.tests import _outputs
+from benchmarks import generators
+
+
+def _species_data(natoms):
+    """ The geometry, frequencies and anharmonicity matrix of N atoms
+    """
+    nums, xyzs = generators.gaussian_atoms(natoms)
+    symbs = tuple(_outputs.SYMB_DCT[num] for num in nums)
+    geo = tuple(zip(symbs, xyzs))
+    nfreqs = max(3 * natoms - 6, 1)
+    freqs = [100. + 30. * idx for idx in range(nfreqs)]
+    xmat = [[-1. - 0.01 * (idx + jdx) for jdx in range(nfreqs)]
+            for idx in range(nfreqs)]
+    return geo, freqs, xmat
+
+
+class Species:
+    """ The Core and Species sections of a molecule of N atoms, with its
+        anharmonicity matrix
+    """
+
+    params = [5, 20, 60]
+    param_names = ['natoms']
+
+    def setup(self, natoms):
+        """ Build the species data
+        """
+        self.geo, self.freqs, self.xmat = _species_data(natoms)
+
+    def _write(self):
+        core_str = mess_io.writer.core_rigidrotor(
+            self.geo, 1.0, xmat=self.xmat, freqs=self.freqs)
+        return mess_io.writer.molecule(
+            core_str, ((0., 1),), freqs=self.freqs, xmat=self.xmat)
+
+    def time_molecule(self, _):
+        """ Time the writing of the species
+        """
+        self._write()
+
+    def peakmem_molecule(self, _):
+        """ Peak memory of the writing of the species
+        """
+        self._write()
+
+
+class Wells:
+    """ The Well sections of a network of N wells
+    """
+
+    params = [10, 100, 400]
+    param_names = ['nwells']
+
+    def setup(self, nwells):
+        """ Build the data of each well
+        """
+        geo, freqs, xmat = _species_data(6)
+        core_str = mess_io.writer.core_rigidrotor(
+            geo, 1.0, xmat=xmat, freqs=freqs)
+        self.spc_str = mess_io.writer.molecule(
+            core_str, ((0., 1),), freqs=freqs, xmat=xmat)
+        self.wells = generators.mess_species(nwells)[0]
+
+    def _write(self):
+        return '\n'.join(
+            mess_io.writer.well(well, self.spc_str, zero_ene=-10.0 * idx)
+            for idx, well in enumerate(self.wells))
+
+    def time_well(self, _):
+        """ Time the writing of the wells
+        """
+        self._write()
+
+    def peakmem_well(self, _):
+        """ Peak memory of the writing of the wells
+        """
+        self._write()
@@ -0,0 +1,265 @@
+""" Generators of large synthetic input files, in the layout of the outputs
+    of the programs, scaled to any size
+
+    Each generator is seeded, so that the same arguments always give the
+    same string. The outputs of the electronic structure programs are those
+    of the elstruct reader tests, scaled to more atoms and steps.
+"""
+
+import random
+from elstruct.tests import _outputs
+
+TEMPS = (500., 650., 800., 950., 1100., 1250., 1400., 1550., 1700., 1850.,
+         2000.)
+PRESSURES = (0.1, 1., 10., 100.)
+MESS_RULE = '_' * 86 + '\n'
+# Atomic numbers the Gaussian geometries are built from
+ATOM_NUMS = (6, 1, 1, 8)
+
+
+# MESS
+def mess_species(nwells):
+    """ The well and bimolecular product labels of a MESS network with a
+        number of wells (and half as many products).
+
+        :param nwells: number of wells
+        :type nwells: int
+        :rtype: (tuple(str), tuple(str))
+    """
+    wells = tuple(f'W{idx+1}' for idx in range(nwells))
+    prds = tuple(f'P{idx+1}' for idx in range(max(nwells // 2, 1)))
+    return wells, prds
+
+
+def mess_rate_output(nwells, temps=TEMPS, pressures=PRESSURES, seed=0):
+    """ A MESS rate output for a network of wells, with its energy tables
+        and the Pressure-Species and Temperature-Species rate tables of
+        every species, at every pressure and in the high-pressure limit.
+
+        :param nwells: number of wells
+        :type nwells: int
+        :param temps: temperatures, in K
+        :type temps: tuple(float)
+        :param pressures: pressures, in atm
+        :type pressures: tuple(float)
+        :param seed: seed of the random rate constants
+        :type seed: int
+        :rtype: str
+    """
+
+    rng = random.Random(seed)
+    wells, prds = mess_species(nwells)
+    spcs = wells + prds
+
+    def _kt(rct, prd):
+        if rct == prd or (rct in prds and prd in prds) or rng.random() < 0.2:
+            return '***'
+        scale = -12 if rct in prds else 4
+        return f'{10 ** (scale + 4 * rng.random()):.3g}'
+
+    def _row(first, vals, width=10):
+        return f'{first:>{width}s}' + ''.join(
+            f' {val:>11s}' for val in vals) + '\n'
+
+    out_str = (
+        'Wells (G - ground energy, D - dissociation limit, kcal/mol):\n' +
+        _row('W', ('G', 'D')) +
+        ''.join(_row(well, (f'{-40 * rng.random():.3g}',
+                            f'{10 * rng.random():.3g}')) for well in wells) +
+        '\nBimolecular Products (G - ground energy, kcal/mol):\n' +
+        _row('P', ('G',)) +
+        ''.join(_row(prd, (f'{-20 * rng.random():.3g}',)) for prd in prds) +
+        '\n' + MESS_RULE + '\n'
+        'Unimolecular Rate Units: 1/sec;  Bimolecular Rate Units: cm^3/sec\n'
+        '\n' + MESS_RULE + '\n')
+
+    # The high-pressure rate constants, which are repeated in the tables at
+    # each pressure
+    high_dct = {(rct, prd): [_kt(rct, prd) for _ in temps]
+                for rct in spcs for prd in spcs}
+
+    out_str += (
+        'High Pressure Rate Coefficients (Temperature-Species Rate '
+        'Tables):\n\n')
+    for rct in spcs:
+        out_str += f'Reactant = {rct}\n' + _row('T(K)', spcs, width=7)
+        for tidx, temp in enumerate(temps):
+            out_str += _row(f'{temp:g}', [high_dct[(rct, prd)][tidx]
+                                          for prd in spcs], width=7)
+        out_str += '\n'
+
+    pdep_dct = {
+        (rct, prd, pidx): [
+            '***' if kt == '***' else f'{float(kt) * rng.random():.3g}'
+            for kt in high_dct[(rct, prd)]]
+        for rct in spcs for prd in spcs for pidx in range(len(pressures))}
+
+    out_str += '\n' + MESS_RULE + '\nPressure-Species Rate Tables:\n\n'
+    for rct in spcs:
+        oth_spcs = tuple(spc for spc in spcs if spc != rct)
+        for tidx, temp in enumerate(temps):
+            out_str += (
+                f'Reactant = {rct}   Temperature = {temp:g} K\n\n' +
+                _row('P(atm)', oth_spcs + ('Loss',), width=9))
+            for pidx, pressure in enumerate(pressures):
+                out_str += _row(f'{pressure:g}', [
+                    pdep_dct[(rct, prd, pidx)][tidx] for prd in oth_spcs] +
+                    ['1'], width=9)
+            out_str += _row('O-O', [high_dct[(rct, prd)][tidx]
+                                    for prd in oth_spcs] + ['1'], width=9)
+            out_str += '\n'
+
+    out_str += '\n' + MESS_RULE + '\nTemperature-Species Rate Tables:\n\n'
+    for rct in spcs:
+        oth_spcs = tuple(spc for spc in spcs if spc != rct)
+        for pidx, pressure in enumerate(pressures):
+            out_str += (
+                f'Reactant = {rct}   Pressure = {pressure:g} atm\n\n' +
+                _row('T(K)', oth_spcs + ('Loss', 'Capture'), width=7))
+            for tidx, temp in enumerate(temps):
+                out_str += _row(f'{temp:g}', [
+                    pdep_dct[(rct, prd, pidx)][tidx] for prd in oth_spcs] +
+                    ['1', '1'], width=7)
+            out_str += '\n'
+
+    out_str += '\n' + MESS_RULE + '\nTemperature-Pressure Rate Tables:\n\n'
+
+    return out_str
+
+
+def mess_hot_log(nwells, nenes=100, temps=TEMPS, pressures=PRESSURES,
+                 seed=0):
+    """ A MESS log with the hot energies branching fractions of every well
+        of a network, at every pressure and temperature.
+
+        :param nwells: number of wells
+        :type nwells: int
+        :param nenes: number of energies of each hot well
+        :type nenes: int
+        :param temps: temperatures, in K
+        :type temps: tuple(float)
+        :param pressures: pressures, in atm
+        :type pressures: tuple(float)
+        :param seed: seed of the random branching fractions
+        :type seed: int
+        :rtype: str
+    """
+
+    rng = random.Random(seed)
+    wells, prds = mess_species(nwells)
+    spcs = wells + prds
+
+    # The same fractions at each temperature and pressure, as they are
+    # read independently anyways
+    rows = []
+    for well in wells:
+        for idx in range(nenes):
+            bfs = [rng.random() for _ in spcs]
+            tot = sum(bfs)
+            rows.append(
+                f'{well:>10s} {80. - 0.8 * idx:9.3g}' +
+                ''.join(f' {bf / tot:9.3g}' for bf in bfs) + '         1\n')
+    block_str = (
+        '      hot energies branching fractions:\n'
+        '       WellE, kcal/mol' + ''.join(f' {spc:>9s}' for spc in spcs) +
+        '     total\n' + ''.join(rows) +
+        '      prompt isomerization/dissociation:\n')
+
+    return ''.join(
+        f'      Pressure = {pressure:g} atm\t  Temperature = {temp:g} K\n'
+        + block_str + '\n'
+        for pressure in pressures for temp in temps)
+
+
+# Chemkin
+def chemkin_mechanism(nrxns, seed=0):
+    """ A Chemkin mechanism with a number of reactions, a fifth of them
+        pressure-dependent through PLOG expressions and a tenth of them
+        duplicated.
+
+        :param nrxns: number of reactions
+        :type nrxns: int
+        :param seed: seed of the random rate parameters
+        :type seed: int
+        :rtype: str
+    """
+
+    rng = random.Random(seed)
+    nspcs = max(int(nrxns ** 0.5) * 2, 4)
+    spcs = tuple(f'S{idx+1}' for idx in range(nspcs))
+
+    def _arr():
+        return (f'{10 ** (8 + 6 * rng.random()):10.3E} '
+                f'{4 * rng.random() - 1:8.3f} {40000 * rng.random():10.1f}')
+
+    # (each reaction is unique, so that only the DUP ones are duplicates)
+    rxns = set()
+    rxn_strs = []
+    for idx in range(nrxns):
+        rxn = None
+        while rxn is None or rxn in rxns:
+            rct1, rct2, prd1, prd2 = rng.sample(spcs, 4)
+            rxn = f'{rct1}+{rct2}=>{prd1}+{prd2}'
+        rxns.add(rxn)
+        if idx % 5 == 0:
+            rxn_strs.append(f'{rxn:<40s} {_arr()}\n' + ''.join(
+                f'    PLOG /{pressure:10.3E} {_arr()} /\n'
+                for pressure in PRESSURES))
+        elif idx % 10 == 1:
+            rxn_strs.append(
+                f'{rxn:<40s} {_arr()}\nDUP\n{rxn:<40s} {_arr()}\nDUP\n')
+        else:
+            rxn_strs.append(f'{rxn:<40s} {_arr()}\n')
+
+    return (
+        'ELEMENTS\nC H O N\nEND\n\nSPECIES\n' + '\n'.join(spcs) + '\nEND\n\n'
+        'REACTIONS     CAL/MOLE     MOLES\n\n' + ''.join(rxn_strs) +
+        '\nEND\n\n')
+
+
+# Gaussian
+def gaussian_atoms(natoms):
+    """ The atomic numbers and coordinates (in Angstrom) of a chain of atoms
+
+        :param natoms: number of atoms
+        :type natoms: int
+        :rtype: (tuple(int), tuple(tuple(float)))
+    """
+    nums = tuple(ATOM_NUMS[idx % len(ATOM_NUMS)] for idx in range(natoms))
+    xyzs = tuple((1.2 * idx, 0.3 * (idx % 3), 0.2 * (idx % 2))
+                 for idx in range(natoms))
+    return nums, xyzs
+
+
+def gaussian_log(natoms, nsteps, seed=0):
+    """ A Gaussian log of an optimization of a number of atoms, with the
+        orientations, energy and convergence table of each step, followed by
+        the Hessian of a frequency calculation at the final geometry.
+
+        :param natoms: number of atoms
+        :type natoms: int
+        :param nsteps: number of optimization steps
+        :type nsteps: int
+        :param seed: seed of the random Hessian
+        :type seed: int
+        :rtype: str
+    """
+
+    rng = random.Random(seed)
+    nums, xyzs = gaussian_atoms(natoms)
+    out_str = _outputs.opt_output_string(
+        'gaussian16', nsteps, nums=nums, xyzs=xyzs)
+
+    # The lower triangle of the Hessian, in blocks of five columns
+    dim = 3 * natoms
+    out_str += ' Force constants in Cartesian coordinates: \n'
+    for start in range(0, dim, 5):
+        cols = range(start, min(start + 5, dim))
+        out_str += ''.join(f'{col+1:14d}' for col in cols) + ' \n'
+        for row in range(start, dim):
+            out_str += f' {row+1:6d}' + ''.join(
+                f'{rng.uniform(-0.5, 0.5):14.6E}'.replace('E', 'D')
+                for col in cols if col <= row) + '\n'
+    out_str += ' Final forces over variables, Energy=-1.000000000000D+02\n'
+
+    return out_str
@@ -0,0 +1,262 @@
+""" Run the benchmarks and compare them to a stored baseline
+
+    Each benchmark is timed as the best of several repeats (each of enough
+    calls to last at least `SAMPLE_TIME`) and its peak memory measured with
+    tracemalloc; the results are stored in (or compared to) a JSON file of
+    {benchmark name: value}.
+
+        python -m benchmarks.run [--save] [--quick] [--baseline FILE]
+
+    No baseline is stored in the repository, as the values depend on the
+    machine: it must first be created on the machine the benchmarks are
+    compared on, by running them with --save (e.g., on the reference
+    commit). Without a baseline, the results are only printed.
+
+    The run exits with status 1 if a benchmark fails, or if it is slower,
+    or uses more memory, than the baseline by more than the tolerances.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+import contextlib
+import tracemalloc
+
+MODULES = ('bench_mess', 'bench_chemkin', 'bench_elstruct', 'bench_writers',
+           'bench_imports')
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+PREFIXES = ('time_', 'peakmem_')
+TIME_TOL = 0.5
+PEAKMEM_TOL = 0.2
+SAMPLE_TIME = 0.02
+
+
+def benchmark_classes(modules=MODULES):
+    """ The benchmark classes of each module, in order
+
+        :param modules: names of the benchmark modules
+        :type modules: tuple(str)
+        :rtype: tuple((str, type))
+    """
+    classes = []
+    for mod_name in modules:
+        mod = importlib.import_module(f'benchmarks.{mod_name}')
+        for name, cls in vars(mod).items():
+            if (isinstance(cls, type) and cls.__module__ == mod.__name__ and
+                    any(attr.startswith(PREFIXES) for attr in vars(cls))):
+                classes.append((f'{mod_name}.{name}', cls))
+    return tuple(classes)
+
+
+def measure(func, kind, repeat=5):
+    """ Measure the time (in s) or peak memory (in bytes) of a call
+
+        :param func: the function to call, without arguments
+        :type func: callable
+        :param kind: 'time' or 'peakmem'
+        :type kind: str
+        :param repeat: number of samples the best time is taken from
+        :type repeat: int
+        :rtype: float
+    """
+    assert kind in ('time', 'peakmem'), kind
+
+    if kind == 'time':
+        # The first, calibrating, call also warms up any caches
+        start = time.perf_counter()
+        func()
+        ncalls = max(int(SAMPLE_TIME / (time.perf_counter() - start)), 1)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(ncalls):
+                func()
+            times.append((time.perf_counter() - start) / ncalls)
+        val = min(times)
+    else:
+        tracemalloc.start()
+        func()
+        val = float(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return val
+
+
+def run(classes, quick=False, repeat=5, select=None):
+    """ Run the benchmarks of each class, for each of its parameters
+
+        Benchmarks whose setup raises NotImplementedError (for instance, for
+        a missing optional dependency) are skipped, as with asv. Those whose
+        setup or call raises any other exception are recorded as failed, and
+        the others are still run.
+
+        :param classes: the benchmark classes, with their names
+        :type classes: tuple((str, type))
+        :param quick: only run the smallest parameter of each class?
+        :type quick: bool
+        :param repeat: number of samples the best time is taken from
+        :type repeat: int
+        :param select: only run benchmarks whose names contain this string
+        :type select: str
+        :returns: the results, the names of the skipped benchmarks, and the
+            errors of the failed ones
+        :rtype: (dict[str: float], tuple(str), dict[str: str])
+    """
+
+    res_dct = {}
+    skipped = []
+    err_dct = {}
+    for cls_name, cls in classes:
+        params = getattr(cls, 'params', [None])
+        params = params[:1] if quick else params
+        methods = sorted(attr for attr in vars(cls)
+                         if attr.startswith(PREFIXES))
+        for param in params:
+            names = [f'{cls_name}.{meth}({param})' for meth in methods]
+            if select is not None:
+                meths_names = [(meth, name) for meth, name
+                               in zip(methods, names) if select in name]
+            else:
+                meths_names = list(zip(methods, names))
+            if not meths_names:
+                continue
+
+            bench = cls()
+            try:
+                bench.setup(param)
+            except NotImplementedError as err:
+                print(f'skipped {cls_name}({param}): {err}')
+                skipped.extend(name for _, name in meths_names)
+                continue
+            except Exception as err:  # pylint: disable=broad-except
+                err_dct.update((name, _format_error(err))
+                               for _, name in meths_names)
+                continue
+
+            # (the readers' warnings are not printed with the results)
+            for meth, name in meths_names:
+                kind = meth.split('_', 1)[0]
+                func = getattr(bench, meth)
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        res_dct[name] = measure(
+                            lambda func=func: func(param), kind,
+                            repeat=repeat)
+                except Exception as err:  # pylint: disable=broad-except
+                    err_dct[name] = _format_error(err)
+
+    return res_dct, tuple(skipped), err_dct
+
+
+def regressions(res_dct, base_dct, time_tol=TIME_TOL, peakmem_tol=PEAKMEM_TOL):
+    """ The benchmarks that are worse than their baseline values by more
+        than the tolerances (as fractions of the baseline values)
+
+        Benchmarks without a baseline value are not compared.
+
+        :param res_dct: the results {name: value}
+        :type res_dct: dict[str: float]
+        :param base_dct: the baseline {name: value}
+        :type base_dct: dict[str: float]
+        :param time_tol: tolerance on the times
+        :type time_tol: float
+        :param peakmem_tol: tolerance on the peak memories
+        :type peakmem_tol: float
+        :returns: the results and baseline values of the regressions
+        :rtype: dict[str: (float, float)]
+    """
+    reg_dct = {}
+    for name, val in res_dct.items():
+        if name in base_dct:
+            kind = name.rsplit('.', 1)[1].split('_', 1)[0]
+            tol = time_tol if kind == 'time' else peakmem_tol
+            if val > base_dct[name] * (1. + tol):
+                reg_dct[name] = (val, base_dct[name])
+    return reg_dct
+
+
+def _format_error(err):
+    """ Format the exception raised by a benchmark
+    """
+    return f'{type(err).__name__}: {err}'
+
+
+def _format_value(name, val):
+    """ Format a time (in ms) or a peak memory (in MiB)
+    """
+    if val is None:
+        return '-'
+    if '.time_' in name:
+        return f'{val * 1e3:.2f} ms'
+    return f'{val / 2 ** 20:.2f} MiB'
+
+
+def main(argv=None):
+    """ Run the benchmarks; save them as the baseline or compare them to it
+
+        :param argv: command-line arguments
+        :type argv: list(str)
+        :returns: the exit status
+        :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('--save', action='store_true',
+                        help='store the results as the baseline')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='the baseline file (default: %(default)s)')
+    parser.add_argument('--quick', action='store_true',
+                        help='only run the smallest size of each benchmark')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='samples the best time is taken from')
+    parser.add_argument('--select', default=None,
+                        help='only run the benchmarks matching this string')
+    parser.add_argument('--time-tol', type=float, default=TIME_TOL,
+                        help='allowed fractional slowdown')
+    parser.add_argument('--peakmem-tol', type=float, default=PEAKMEM_TOL,
+                        help='allowed fractional increase of peak memory')
+    args = parser.parse_args(argv)
+
+    res_dct, _, err_dct = run(benchmark_classes(), quick=args.quick,
+                              repeat=args.repeat, select=args.select)
+
+    if args.save:
+        base_dct = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as base_file:
+                base_dct = json.load(base_file)
+        base_dct.update(res_dct)
+        with open(args.baseline, 'w', encoding='utf-8') as base_file:
+            json.dump(base_dct, base_file, indent=1, sort_keys=True)
+        base_dct = {}
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as base_file:
+            base_dct = json.load(base_file)
+    else:
+        print(f'No baseline at {args.baseline}; run with --save to store one')
+        base_dct = {}
+
+    reg_dct = regressions(res_dct, base_dct, time_tol=args.time_tol,
+                          peakmem_tol=args.peakmem_tol)
+    width = max(map(len, [*res_dct, *err_dct]), default=0)
+    for name, val in res_dct.items():
+        flag = '  REGRESSION' if name in reg_dct else ''
+        print(f'{name:<{width}s} {_format_value(name, val):>12s} '
+              f'{_format_value(name, base_dct.get(name)):>12s}{flag}')
+
+    for name, err in err_dct.items():
+        print(f'{name:<{width}s} FAILED: {err}')
+
+    if args.save:
+        print(f'Saved the baseline to {args.baseline}')
+
+    return 1 if reg_dct or err_dct else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
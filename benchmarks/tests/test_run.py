@@ -0,0 +1,105 @@
+""" test the benchmark inputs and runner
+"""
+
+import numpy
+import mess_io.reader
+import elstruct.reader
+from benchmarks import generators
+from benchmarks import run
+
+
+def test__generators():
+    """ test that the generated inputs are read in full
+    """
+
+    wells, prds = generators.mess_species(6)
+    assert (len(wells), len(prds)) == (6, 3)
+
+    rxn_ktp_dct = mess_io.reader.rates.get_rxn_ktp_dct(
+        generators.mess_rate_output(6))
+    assert rxn_ktp_dct
+    for rxn, ktp_dct in rxn_ktp_dct.items():
+        assert rxn[0][0] in wells + prds
+        assert set(ktp_dct) <= set(generators.PRESSURES) | {'high'}
+
+    hot_dct = mess_io.reader.hoten.extract_hot_branching(
+        generators.mess_hot_log(6, nenes=10), {'W1': 0.0}, wells + prds)
+    assert hot_dct['W1'][1.0][500.].shape == (10, 9)
+
+    out_str = generators.gaussian_log(7, 4)
+    hess = elstruct.reader.hessian('gaussian16', out_str)
+    assert numpy.shape(hess) == (21, 21)
+    assert numpy.allclose(hess, numpy.transpose(hess))
+    traj = elstruct.reader.opt_trajectory('gaussian16', out_str)
+    assert traj.coords.shape == (4, 7, 3)
+
+    mech_str = generators.chemkin_mechanism(50)
+    assert mech_str.count('PLOG') == 10 * len(generators.PRESSURES)
+    assert mech_str.count('DUP') == 10
+
+
+def test__run():
+    """ test the benchmark runner and the flagging of regressions
+    """
+
+    classes = run.benchmark_classes()
+    assert 'bench_mess.RateConstants' in dict(classes)
+    assert 'bench_imports.Imports' in dict(classes)
+
+    res_dct, _, err_dct = run.run(classes, quick=True, repeat=1,
+                                  select='Wells')
+    assert not err_dct
+    assert set(res_dct) == {'bench_writers.Wells.peakmem_well(10)',
+                            'bench_writers.Wells.time_well(10)'}
+    assert all(val > 0. for val in res_dct.values())
+
+    base_dct = {'a.time_x(1)': 1.0, 'a.peakmem_x(1)': 1.0,
+                'a.time_y(1)': 1.0}
+    res_dct = {'a.time_x(1)': 1.4, 'a.peakmem_x(1)': 1.4,
+               'a.time_y(1)': 2.0, 'a.time_z(1)': 9.0}
+    assert run.regressions(res_dct, base_dct) == {
+        'a.peakmem_x(1)': (1.4, 1.0), 'a.time_y(1)': (2.0, 1.0)}
+
+
+class _Failing:
+    """ benchmarks failing in their setup or in one of their calls
+    """
+
+    params = [1, 2]
+
+    def setup(self, param):
+        """ fail for the second parameter
+        """
+        if param == 2:
+            raise ValueError('bad setup')
+
+    def time_ok(self, _):
+        """ succeed
+        """
+
+    def time_bad(self, _):
+        """ fail
+        """
+        raise KeyError('bad call')
+
+
+def test__run_failures(monkeypatch):
+    """ test that the benchmark runner records the failed benchmarks, runs
+        the others, and exits with a non-zero status
+    """
+
+    classes = (('a.Failing', _Failing),)
+    res_dct, skipped, err_dct = run.run(classes, repeat=1)
+    assert set(res_dct) == {'a.Failing.time_ok(1)'}
+    assert not skipped
+    assert err_dct == {'a.Failing.time_bad(1)': "KeyError: 'bad call'",
+                       'a.Failing.time_bad(2)': 'ValueError: bad setup',
+                       'a.Failing.time_ok(2)': 'ValueError: bad setup'}
+
+    monkeypatch.setattr(run, 'benchmark_classes', lambda: classes)
+    assert run.main(['--baseline', 'not-a-baseline.json']) == 1
+
+
+if __name__ == '__main__':
+    test__generators()
+    test__run()
@@ -2,11 +2,14 @@
 Modules for parsing and writing Chemkin files
 """
 
-from chemkin_io import parser
-from chemkin_io import writer
+from ioformat import lazy_load
 
 
 __all__ = [
     'parser',
     'writer'
 ]
+
+
+# Submodules are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__)
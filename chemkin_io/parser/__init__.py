@@ -2,10 +2,7 @@
 Modules for parsing Chemkin files
 """
 
-from chemkin_io.parser import mechanism
-from chemkin_io.parser import reaction
-from chemkin_io.parser import species
-from chemkin_io.parser import thermo
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -14,3 +11,7 @@ __all__ = [
     'species',
     'thermo',
 ]
+
+
+# Submodules are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__)
@@ -2,15 +2,7 @@
 Modules for writing Chemkin files
 """
 
-from chemkin_io.writer import mechanism
-from chemkin_io.writer import reaction
-from chemkin_io.writer import thermo
-from chemkin_io.writer import transport
-from chemkin_io.writer import comments
-from chemkin_io.writer import spc
-from chemkin_io.writer import pesgroups
-from chemkin_io.writer import _util
-from chemkin_io.writer._util import format_rxn_name
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -24,3 +16,9 @@ __all__ = [
     '_util',
     'format_rxn_name',
 ]
+
+
+# Submodules and functions are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'format_rxn_name': 'chemkin_io.writer._util',
+})
@@ -1,24 +1,6 @@
 """ electronic structure interfaces """
 
-from elstruct import writer
-from elstruct import reader
-from elstruct import run
-from elstruct import option
-from elstruct import util
-from elstruct.par import Error
-from elstruct.par import Success
-from elstruct.par import Job
-from elstruct.par import Option
-from elstruct.par import Program
-from elstruct.par import Reference
-from elstruct.par import Method
-from elstruct.par import Basis
-from elstruct.par import programs
-from elstruct.par import program_methods
-from elstruct.par import program_dft_methods
-from elstruct.par import program_nondft_methods
-from elstruct.par import program_method_orbital_types
-from elstruct.par import program_bases
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -42,3 +24,22 @@ __all__ = [
     'program_method_orbital_types',
     'program_bases',
 ]
+
+
+# Submodules and functions are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'Error': 'elstruct.par',
+    'Success': 'elstruct.par',
+    'Job': 'elstruct.par',
+    'Option': 'elstruct.par',
+    'Program': 'elstruct.par',
+    'Reference': 'elstruct.par',
+    'Method': 'elstruct.par',
+    'Basis': 'elstruct.par',
+    'programs': 'elstruct.par',
+    'program_methods': 'elstruct.par',
+    'program_dft_methods': 'elstruct.par',
+    'program_nondft_methods': 'elstruct.par',
+    'program_method_orbital_types': 'elstruct.par',
+    'program_bases': 'elstruct.par',
+})
@@ -5,13 +5,18 @@ thought: we could have default values specified through the keys like so:
 """
 
 from string import Formatter as _Formatter
+import collections
+import functools
 import re
+import types
 import yaml
 
 
 FORMAT = '<{}>[{}]'
 PATTERN = r'<(.*)>(\[.*\])'
 
+OptionSpec = collections.namedtuple('OptionSpec', ('name', 'keys', 'values'))
+
 
 def create(name_, keys_=()):
     """ Create an option specifier.
@@ -45,19 +50,38 @@ def specify(osp_, *args, **kwargs):
     return osp
 
 
+@functools.lru_cache(maxsize=None)
+def parse(osp_):
+    """ parse an option specifier (either), once for each specifier
+
+        The regex and YAML parsing of a specifier string is cached, so the
+        writers pay for it once however many inputs use the option.
+
+        :param osp_: option specifier
+        :type osp_: str
+        :returns: the name, the keys (of a template), and the values (of a
+            string or valueless template, otherwise None)
+        :rtype: OptionSpec
+    """
+    assert is_valid(osp_)
+    val_str = _value_string(osp_)
+    keys_ = _value_string_keys(val_str)
+    vals = (_load_values(val_str) if not keys_ or is_valueless(osp_) else
+            None)
+    return OptionSpec(name(osp_), keys_, vals)
+
+
 def is_valid(osp_):
     """ is this an option specifier? (either)
     """
-    match = re.fullmatch(PATTERN, osp_)
-    return match is not None
+    return _match_groups(osp_) is not None
 
 
 def name(osp_):
     """ get the name from an option specifier (either)
     """
     assert is_valid(osp_)
-    match = re.fullmatch(PATTERN, osp_)
-    name_, _ = match.groups()
+    name_, _ = _match_groups(osp_)
     return name_
 
 
@@ -66,7 +90,7 @@ def is_valueless(osp_):
     """
     assert is_valid(osp_)
     val_str = _value_string(osp_)
-    return not yaml.load(val_str, Loader=yaml.FullLoader)
+    return not _load_values(val_str)
 
 
 def is_template(osp_):
@@ -90,18 +114,42 @@ def values(osp):
     """
     assert (not is_template(osp)) or is_valueless(osp)
     val_str = _value_string(osp)
-    return tuple(yaml.load(val_str, Loader=yaml.FullLoader))
+    return _load_values(val_str)
 
 
 def _value_string(osp_):
     """ get the value string from an option specifier (either)
     """
     assert is_valid(osp_)
-    match = re.fullmatch(PATTERN, osp_)
-    _, val_str = match.groups()
+    _, val_str = _match_groups(osp_)
     return val_str
 
 
+@functools.lru_cache(maxsize=None)
+def _match_groups(osp_):
+    match = re.fullmatch(PATTERN, osp_)
+    return match.groups() if match is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_values(val_str):
+    return _freeze(yaml.load(val_str, Loader=yaml.FullLoader))
+
+
+def _freeze(val):
+    """ make the (cached, so shared) values loaded by YAML immutable, with
+        lists as tuples and mappings (e.g., from `<x>[a: 1]`) as read-only
+        views
+    """
+    if isinstance(val, list):
+        val = tuple(map(_freeze, val))
+    elif isinstance(val, dict):
+        val = types.MappingProxyType(
+            {key: _freeze(sub_val) for key, sub_val in val.items()})
+    return val
+
+
+@functools.lru_cache(maxsize=None)
 def _value_string_keys(val_str):
     return tuple(fpar[1] for fpar in _Formatter().parse(val_str)
                  if fpar[1] is not None)
@@ -1,7 +1,8 @@
 """ elstruct parameters
 """
 
-from automol.util import sort_by_list
+import types
+import functools
 from elstruct import pclass
 from elstruct import option
 
@@ -16,6 +17,14 @@ def standard_case(name):
     return name.lower()
 
 
+@functools.lru_cache(maxsize=None)
+def _row_names(cls):
+    """ Set of the names (first entries) of the rows of a parameter class,
+        built once per class
+    """
+    return frozenset(row[0] for row in pclass.all_values(cls))
+
+
 class Module():
     """ elstruct module names """
     WRITER = 'writer'
@@ -50,7 +59,14 @@ def is_program(prog):
         :type prog: str
         :rtype: bool
     """
-    return standard_case(prog) in programs()
+    return standard_case(prog) in _program_set()
+
+
+@functools.lru_cache(maxsize=None)
+def _program_set():
+    """ Set of supported programs, built once
+    """
+    return frozenset(programs())
 
 
 class Reference():
@@ -349,9 +365,8 @@ class Method():
         """
 
         name = standard_case(name)
-        names = [row[0] for row in pclass.all_values(cls)]
 
-        return name in names
+        return name in _row_names(cls)
 
     @classmethod
     def is_correlated(cls, name):
@@ -364,9 +379,8 @@ class Method():
         """
 
         name = standard_case(name)
-        corr_names = [row[0] for row in pclass.all_values(cls.Corr)]
 
-        return name in corr_names
+        return name in _row_names(cls.Corr)
 
     @classmethod
     def is_multiref(cls, name):
@@ -379,9 +393,8 @@ class Method():
         """
 
         name = standard_case(name)
-        multiref_names = [row[0] for row in pclass.all_values(cls.MultiRef)]
 
-        return name in multiref_names
+        return name in _row_names(cls.MultiRef)
 
     @staticmethod
     def is_casscf(name):
@@ -406,9 +419,8 @@ class Method():
         """
 
         name = standard_case(name)
-        dft_names = [row[0] for row in pclass.all_values(cls.Dft)]
 
-        return name in dft_names
+        return name in _row_names(cls.Dft)
 
     @staticmethod
     def is_nonstandard_dft(name):
@@ -451,6 +463,8 @@ class Method():
                    cls.ModPrefix.DF[0],
                    cls.ModPrefix.L_PNO[0],
                    cls.ModPrefix.REL_DKH[0])
+        # pylint: disable=import-outside-toplevel
+        from automol.util import sort_by_list
         return sort_by_list(pfx_lst, ord_lst)
 
     @classmethod
@@ -512,11 +526,20 @@ def program_methods_info(prog):
         :type prog: str
         :rtype: dict[str: str]
     """
-    prog = standard_case(prog)
-    return {row[0]: row[1][prog] for row in pclass.all_values(Method)
-            if prog in row[1]}
+    return dict(_program_methods_info(standard_case(prog)))
 
 
+@functools.lru_cache(maxsize=None)
+def _program_methods_info(prog):
+    """ Read-only method information for a (standard case) program name,
+        built once per program
+    """
+    return types.MappingProxyType(
+        {row[0]: row[1][prog] for row in pclass.all_values(Method)
+         if prog in row[1]})
+
+
+@functools.lru_cache(maxsize=None)
 def program_methods(prog):
     """ List methods available for a given program.
 
@@ -524,9 +547,10 @@ def program_methods(prog):
         :type prog: str
         :rtype: tuple(str)
     """
-    return tuple(sorted(program_methods_info(prog)))
+    return tuple(sorted(_program_methods_info(standard_case(prog))))
 
 
+@functools.lru_cache(maxsize=None)
 def program_dft_methods(prog):
     """ List density functional theory methods available for a given program.
 
@@ -539,6 +563,7 @@ def program_dft_methods(prog):
                  if Method.is_standard_dft(method))
 
 
+@functools.lru_cache(maxsize=None)
 def program_nondft_methods(prog):
     """ List Hartree-Fock wavefunction methods available for a given program.
 
@@ -569,7 +594,7 @@ def program_method_name(prog, method, singlet=True):
         method = Method.nonstandard_dft_name(method)
     else:
         method = standard_case(method)
-        prog_method_dct = program_methods_info(prog)
+        prog_method_dct = _program_methods_info(prog)
         assert method in prog_method_dct
         name = (prog_method_dct[method][0] if singlet else
                 prog_method_dct[method][1])
@@ -593,7 +618,7 @@ def program_method_orbital_types(prog, method, singlet):
 
     prog = standard_case(prog)
     method = standard_case(method)
-    prog_method_dct = program_methods_info(prog)
+    prog_method_dct = _program_methods_info(prog)
     assert method in prog_method_dct
     orb_types = (prog_method_dct[method][2] if singlet else
                  prog_method_dct[method][3])
@@ -613,7 +638,7 @@ def is_program_method(prog, method):
     prog = standard_case(prog)
     method = standard_case(method)
 
-    return method in program_methods(prog)
+    return method in _program_methods_info(prog)
 
 
 def is_program_method_orbital_type(prog, method, singlet, orb_type):
@@ -947,8 +972,7 @@ class Basis():
             :type name: str
         """
         name = standard_case(name)
-        names = [row[0] for row in pclass.all_values(cls)]
-        return name in names
+        return name in _row_names(cls)
 
     is_standard_basis = contains
 
@@ -978,9 +1002,17 @@ def program_bases(prog):
         :type prog: str
         :rtype: dict[str: str]
     """
-    prog = standard_case(prog)
-    return {row[0]: row[1][prog] for row in pclass.all_values(Basis)
-            if prog in row[1]}
+    return dict(_program_bases(standard_case(prog)))
+
+
+@functools.lru_cache(maxsize=None)
+def _program_bases(prog):
+    """ Read-only basis set names for a (standard case) program name,
+        built once per program
+    """
+    return types.MappingProxyType(
+        {row[0]: row[1][prog] for row in pclass.all_values(Basis)
+         if prog in row[1]})
 
 
 def program_basis_name(prog, basis):
@@ -998,7 +1030,7 @@ def program_basis_name(prog, basis):
         basis = Basis.nonstandard_basis_name(basis)
     else:
         basis = standard_case(basis)
-        prog_bases = program_bases(prog)
+        prog_bases = _program_bases(prog)
         assert basis in prog_bases
         name = prog_bases[basis]
         basis = basis if name is None else name
@@ -1018,7 +1050,7 @@ def is_program_basis(prog, basis):
     prog = standard_case(prog)
     basis = standard_case(basis)
 
-    return basis in program_bases(prog)
+    return basis in _program_bases(prog)
 
 
 class Job():
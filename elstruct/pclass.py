@@ -1,10 +1,15 @@
 """ functions for working with parameter classes
+
+    Parameter classes are constant, so the values of each class are only
+    collected on the first call and cached after that.
 """
 
 import inspect
 import itertools
+import functools
 
 
+@functools.lru_cache(maxsize=None)
 def values(cls):
     """ List the values of a parameter class.
 
@@ -17,6 +22,7 @@ def values(cls):
     return vals
 
 
+@functools.lru_cache(maxsize=None)
 def all_values(cls):
     """ Recursively list the values of a parameter class tree.
 
@@ -1,49 +1,7 @@
 """ Electronic structure program output reading module
 """
 
-# energy
-from elstruct.reader._reader import programs
-from elstruct.reader._reader import energy
-# gradient
-from elstruct.reader._reader import gradient_programs
-from elstruct.reader._reader import gradient
-# hessian
-from elstruct.reader._reader import hessian_programs
-from elstruct.reader._reader import hessian
-from elstruct.reader._reader import harmonic_frequencies_programs
-from elstruct.reader._reader import harmonic_frequencies
-from elstruct.reader._reader import normal_coordinates_programs
-from elstruct.reader._reader import normal_coordinates
-# irc
-from elstruct.reader._reader import irc_programs
-from elstruct.reader._reader import irc_points
-from elstruct.reader._reader import irc_path
-# optimization
-from elstruct.reader._reader import opt_geometry_programs
-from elstruct.reader._reader import opt_geometry
-from elstruct.reader._reader import opt_zmatrix_programs
-from elstruct.reader._reader import opt_zmatrix
-from elstruct.reader._reader import inp_zmatrix_programs
-from elstruct.reader._reader import inp_zmatrix
-from elstruct.reader._reader import opt_zmatrices_programs
-from elstruct.reader._reader import opt_zmatrices
-# vpt2
-from elstruct.reader._reader import vpt2_programs
-from elstruct.reader._reader import vpt2
-# properties
-from elstruct.reader._reader import dipole_moment_programs
-from elstruct.reader._reader import dipole_moment
-from elstruct.reader._reader import polarizability_programs
-from elstruct.reader._reader import polarizability
-# status
-from elstruct.reader._reader import has_error_message
-from elstruct.reader._reader import has_normal_exit_message
-from elstruct.reader._reader import error_list
-from elstruct.reader._reader import success_list
-from elstruct.reader._reader import check_convergence_messages
-# version
-from elstruct.reader._reader import program_name
-from elstruct.reader._reader import program_version
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -64,9 +22,16 @@ __all__ = [
     'irc_programs',
     'irc_points',
     'irc_path',
+    'irc_trajectory_programs',
+    'irc_trajectory',
+    'IrcTrajectory',
+    'trajectory_geometries',
     # optimization
     'opt_geometry_programs',
     'opt_geometry',
+    'opt_trajectory_programs',
+    'opt_trajectory',
+    'OptTrajectory',
     'opt_zmatrix_programs',
     'opt_zmatrix',
     'inp_zmatrix_programs',
@@ -76,6 +41,11 @@ __all__ = [
     # vpt2
     'vpt2_programs',
     'vpt2',
+    'SymmetricTensor',
+    'symmetric_tensor',
+    'tensor_order',
+    'tensor_full_array',
+    'tensor_contraction',
     # properties
     'dipole_moment_programs',
     'dipole_moment',
@@ -83,11 +53,77 @@ __all__ = [
     'polarizability',
     # status
     'has_error_message',
+    'has_success_message',
     'has_normal_exit_message',
     'error_list',
     'success_list',
     'check_convergence_messages',
+    'status_report',
+    'OutputTail',
     # version
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    # energy
+    'programs': 'elstruct.reader._reader',
+    'energy': 'elstruct.reader._reader',
+    # gradient
+    'gradient_programs': 'elstruct.reader._reader',
+    'gradient': 'elstruct.reader._reader',
+    # hessian
+    'hessian_programs': 'elstruct.reader._reader',
+    'hessian': 'elstruct.reader._reader',
+    'harmonic_frequencies_programs': 'elstruct.reader._reader',
+    'harmonic_frequencies': 'elstruct.reader._reader',
+    'normal_coordinates_programs': 'elstruct.reader._reader',
+    'normal_coordinates': 'elstruct.reader._reader',
+    # irc
+    'irc_programs': 'elstruct.reader._reader',
+    'irc_points': 'elstruct.reader._reader',
+    'irc_path': 'elstruct.reader._reader',
+    'irc_trajectory_programs': 'elstruct.reader._reader',
+    'irc_trajectory': 'elstruct.reader._reader',
+    'IrcTrajectory': 'elstruct.reader._traj',
+    'trajectory_geometries': 'elstruct.reader._traj',
+    # optimization
+    'opt_geometry_programs': 'elstruct.reader._reader',
+    'opt_geometry': 'elstruct.reader._reader',
+    'opt_trajectory_programs': 'elstruct.reader._reader',
+    'opt_trajectory': 'elstruct.reader._reader',
+    'OptTrajectory': 'elstruct.reader._traj',
+    'opt_zmatrix_programs': 'elstruct.reader._reader',
+    'opt_zmatrix': 'elstruct.reader._reader',
+    'inp_zmatrix_programs': 'elstruct.reader._reader',
+    'inp_zmatrix': 'elstruct.reader._reader',
+    'opt_zmatrices_programs': 'elstruct.reader._reader',
+    'opt_zmatrices': 'elstruct.reader._reader',
+    # vpt2
+    'vpt2_programs': 'elstruct.reader._reader',
+    'vpt2': 'elstruct.reader._reader',
+    'SymmetricTensor': 'elstruct.reader._tensor',
+    'symmetric_tensor': 'elstruct.reader._tensor',
+    'tensor_order': 'elstruct.reader._tensor',
+    'tensor_full_array': 'elstruct.reader._tensor',
+    'tensor_contraction': 'elstruct.reader._tensor',
+    # properties
+    'dipole_moment_programs': 'elstruct.reader._reader',
+    'dipole_moment': 'elstruct.reader._reader',
+    'polarizability_programs': 'elstruct.reader._reader',
+    'polarizability': 'elstruct.reader._reader',
+    # status
+    'has_error_message': 'elstruct.reader._reader',
+    'has_success_message': 'elstruct.reader._reader',
+    'has_normal_exit_message': 'elstruct.reader._reader',
+    'error_list': 'elstruct.reader._reader',
+    'success_list': 'elstruct.reader._reader',
+    'check_convergence_messages': 'elstruct.reader._reader',
+    'status_report': 'elstruct.reader._reader',
+    'OutputTail': 'elstruct.reader._tail',
+    # version
+    'program_name': 'elstruct.reader._reader',
+    'program_version': 'elstruct.reader._reader',
+})
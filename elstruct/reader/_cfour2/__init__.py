@@ -1,15 +1,6 @@
 """ cfour 2.0 output reading module """
-from elstruct.reader._cfour2.energ import energy
-from elstruct.reader._cfour2.surface import gradient
-from elstruct.reader._cfour2.molecule import opt_geometry
-from elstruct.reader._cfour2.molecule import opt_zmatrix
-from elstruct.reader._cfour2.status import has_normal_exit_message
-from elstruct.reader._cfour2.status import error_list
-from elstruct.reader._cfour2.status import success_list
-from elstruct.reader._cfour2.status import has_error_message
-from elstruct.reader._cfour2.status import check_convergence_messages
-from elstruct.reader._cfour2.version import program_name
-from elstruct.reader._cfour2.version import program_version
+
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -21,7 +12,27 @@ __all__ = [
     'error_list',
     'success_list',
     'has_error_message',
+    'has_success_message',
     'check_convergence_messages',
+    'status_report',
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._cfour2.energ',
+    'gradient': 'elstruct.reader._cfour2.surface',
+    'opt_geometry': 'elstruct.reader._cfour2.molecule',
+    'opt_zmatrix': 'elstruct.reader._cfour2.molecule',
+    'has_normal_exit_message': 'elstruct.reader._cfour2.status',
+    'error_list': 'elstruct.reader._cfour2.status',
+    'success_list': 'elstruct.reader._cfour2.status',
+    'has_error_message': 'elstruct.reader._cfour2.status',
+    'has_success_message': 'elstruct.reader._cfour2.status',
+    'check_convergence_messages': 'elstruct.reader._cfour2.status',
+    'status_report': 'elstruct.reader._cfour2.status',
+    'program_name': 'elstruct.reader._cfour2.version',
+    'program_version': 'elstruct.reader._cfour2.version',
+})
@@ -6,6 +6,17 @@ import autoparse.find as apf
 import elstruct.par
 
 
+SCF_CONV_PTT = 'SCF has converged.'
+CC_CONV_PTTS = (
+    app.escape('timing for (T)'),
+    'A miracle come to pass. The CC iterations have converged.')
+OPT_CONV_PTT = app.escape(
+    'Convergence criterion satisfied.  Optimization completed.')
+SCF_NOCONV_PTT = 'SCF failed to converge'
+CC_NOCONV_PTT = app.escape('CC did not converge !!!')
+OPT_NOCONV_PTT = app.escape('*Maximum number of optimization steps exceeded.')
+
+
 # Exit message for the program
 def has_normal_exit_message(output_str):
     """ Assess whether the output file string contains the
@@ -33,9 +44,7 @@ def _has_scf_convergence_message(output_str):
         :rtype: bool
     """
 
-    pattern = 'SCF has converged.'
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(SCF_CONV_PTT, output_str, case=False)
 
 
 def _has_cc_convergence_message(output_str):
@@ -47,14 +56,9 @@ def _has_cc_convergence_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.escape('timing for (T)')
-    match = apf.has_match(pattern, output_str, case=False)
-    if match is None:
-        pattern = (
-            'A miracle come to pass. The CC iterations have converged.')
-        match = apf.has_match(pattern, output_str, case=False)
+    pattern = app.one_of_these(CC_CONV_PTTS)
 
-    return match
+    return apf.has_match(pattern, output_str, case=False)
 
 
 def _has_opt_convergence_message(output_str):
@@ -66,10 +70,7 @@ def _has_opt_convergence_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.escape(
-        'Convergence criterion satisfied.  Optimization completed.')
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(OPT_CONV_PTT, output_str, case=False)
 
 
 # Parsers for various error messages
@@ -82,9 +83,7 @@ def _has_scf_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = 'SCF failed to converge'
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(SCF_NOCONV_PTT, output_str, case=False)
 
 
 def _has_cc_nonconvergence_error_message(output_str):
@@ -96,9 +95,7 @@ def _has_cc_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.escape('CC did not converge !!!')
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(CC_NOCONV_PTT, output_str, case=False)
 
 
 def _has_opt_nonconvergence_error_message(output_str):
@@ -110,9 +107,7 @@ def _has_opt_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.escape('*Maximum number of optimization steps exceeded.')
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(OPT_NOCONV_PTT, output_str, case=False)
 
 
 ERROR_READER_DCT = {
@@ -129,6 +124,16 @@ SUCCESS_READER_DCT = {
     elstruct.par.Success.OPT_CONV: _has_opt_convergence_message,
 }
 
+# Looks for all of the error and success messages at once
+STATUS_SCANNER = apf.scanner({
+    elstruct.par.Error.SCF_NOCONV: SCF_NOCONV_PTT,
+    elstruct.par.Error.CC_NOCONV: CC_NOCONV_PTT,
+    elstruct.par.Error.OPT_NOCONV: OPT_NOCONV_PTT,
+    elstruct.par.Success.SCF_CONV: SCF_CONV_PTT,
+    elstruct.par.Success.CC_CONV: CC_CONV_PTTS,
+    elstruct.par.Success.OPT_CONV: OPT_CONV_PTT,
+}, case=False)
+
 
 def error_list():
     """ Constructs a list of errors that be identified from the output file.
@@ -162,6 +167,36 @@ def has_error_message(error, output_str):
     return err_val
 
 
+def has_success_message(success, output_str):
+    """ Assess whether the output file string contains the success message
+        for one of the procedures in the job.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: bool
+    """
+
+    assert success in success_list()
+
+    return SUCCESS_READER_DCT[success](output_str)
+
+
+def status_report(output_str):
+    """ Assess which of the error and success messages the output file
+        string contains, looking for all of them in one scan of the output.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :returns: whether there is a message for each error and success
+        :rtype: dict[str: bool]
+    """
+
+    report = dict.fromkeys(error_list() + success_list(), False)
+    report.update(apf.scan(STATUS_SCANNER, output_str))
+
+    return report
+
+
 def check_convergence_messages(error, success, output_str):
     """ Assess whether the output file string contains messages
         denoting all of the requested procedures in the job have converged.
@@ -1,12 +1,31 @@
 """ molecular geometry and structure readers
 """
 
+import re
 import numbers
 from phydat import ptab
 import autoread as ar
 import autoparse.pattern as app
 import autoparse.find as apf
 import automol
+from elstruct.reader._traj import step_positions
+from elstruct.reader._traj import first_value
+from elstruct.reader._traj import table_rows
+from elstruct.reader._traj import fill_opt_trajectory
+
+
+# Lines of the optimization output read by `opt_trajectory`, by the text
+# that marks them
+OPT_LINE_KEY_DCT = {
+    'Input orientation:': 'inp_geo',
+    'Standard orientation:': 'std_geo',
+    'Z-Matrix orientation:': 'zma_geo',
+    'SCF Done:': 'ene',
+    'Maximum Force': 'force',
+    'Maximum Displacement': 'disp',
+}
+OPT_LINE_REGEX = re.compile(
+    app.one_of_these(list(map(app.escape, OPT_LINE_KEY_DCT))))
 
 
 def opt_geometry(output_str):
@@ -46,6 +65,38 @@ def opt_geometry(output_str):
     return geo
 
 
+def opt_trajectory(output_str):
+    """ Reads the geometry, SCF energy, and largest force and displacement
+        of each step of an optimization, scanning the output only once.
+        The standard orientation of each step is taken, if printed.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: OptTrajectory
+    """
+
+    geo_rows_lst, step_vals_lst = [], []
+    for step_dct in step_positions(output_str, OPT_LINE_REGEX,
+                                   OPT_LINE_KEY_DCT):
+        geo_key = next((key for key in ('std_geo', 'zma_geo', 'inp_geo')
+                        if key in step_dct), None)
+        geo_rows_lst.append(
+            table_rows(output_str, step_dct[geo_key], 4, 6) if geo_key else
+            [])
+        step_vals_lst.append((
+            first_value(output_str, step_dct.get('ene'), after='='),
+            first_value(output_str, step_dct.get('force')),
+            first_value(output_str, step_dct.get('disp'))))
+
+    traj = fill_opt_trajectory(
+        geo_rows_lst, step_vals_lst, symb_col=1, xyz_col=3)
+    if traj is not None:
+        traj = traj._replace(
+            symbs=tuple(ptab.to_symbol(int(num)) for num in traj.symbs))
+
+    return traj
+
+
 def opt_zmatrix(output_str):
     """ Reads the optimized Z-Matrix from the output file string.
         Returns the Z-Matrix in Bohr and Radians.
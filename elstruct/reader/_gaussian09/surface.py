@@ -1,6 +1,7 @@
 """ potential energy surface information readers
 """
 
+import re
 import itertools
 import numpy
 from phydat import phycon, ptab
@@ -9,6 +10,29 @@ import pyparsing as pp
 import autoread as ar
 import autoparse.pattern as app
 import autoparse.find as apf
+from autoparse import cast_array
+from elstruct.reader._traj import IrcTrajectory
+from elstruct.reader._traj import trajectory_geometries
+
+
+# Lines of the IRC output read by `irc_trajectory`, by the text that marks
+# them; the text is looked for with a plain alternation, which `re` matches
+# much faster than one made of named groups
+IRC_LINE_KEY_DCT = {
+    'Input orientation:': 'inp_geo',
+    'CURRENT STRUCTURE': 'cur_geo',
+    'SCF Done:': 'ene',
+    'Forces (Hartrees/Bohr)': 'grad',
+    'Force constants in Cartesian coordinates:': 'hess',
+    'Path Number:': 'path',
+    'NET REACTION COORDINATE UP TO THIS POINT =': 'rxn',
+    'Point Number  1 in': 'start',
+    'OF POINTS ALONG THE PATH': 'end',
+}
+IRC_LINE_REGEX = re.compile(
+    app.one_of_these(list(map(app.escape, IRC_LINE_KEY_DCT))))
+# Number of lines between the header of each table and its rows
+IRC_TABLE_NSKIP_DCT = {'inp_geo': 4, 'cur_geo': 5, 'grad': 2}
 
 
 def gradient(output_str):
@@ -133,56 +157,123 @@ def irc_points(output_str):
         :rtype: (geom data structure, tuple(tuple(float)), tuple(tuple(float)))
     """
 
-    # Lines
-    output_lines = output_str.splitlines()
+    traj = irc_trajectory(output_str)
+    geoms = list(trajectory_geometries(traj)) if traj is not None else []
 
-    # Obtain all of the info for the points off the saddle point
-    # Find the lines with point number to get the strings
-    section_starts = []
-    for i, line in enumerate(output_lines):
-        if 'Point Number  1 in' in line:
-            section_starts.append(i)
+    return geoms, [], []
+
+
+def irc_trajectory(output_str):
+    """ Reads the points along the Intrinsic Reaction Coordinate, in the order
+        they appear in the output string, scanning the output only once.
+
+        The saddle point comes first, read from the output before the first
+        point on the path; each later point is read from the output up to
+        the end of that point. The last geometry of each point is taken,
+        along with the SCF energy and forces of its last step, and the
+        reaction coordinate is negative along the reverse path.
+        The gradients and Hessians are only given if every point has them.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: IrcTrajectory
+    """
+
+    # Positions of the lines read for each point, found in one scan
+    pt_dcts = [{}]
+    for match in IRC_LINE_REGEX.finditer(output_str):
+        key = IRC_LINE_KEY_DCT[match.group(0)]
+        if key == 'start' and len(pt_dcts) > 1:
+            continue
+        if key in ('start', 'end'):
+            pt_dcts.append({})
+        elif key in ('ene', 'path', 'rxn'):
+            # The value is the first one after the text (and any =)
+            line_end = output_str.find('\n', match.end())
+            line = output_str[match.end():line_end if line_end >= 0 else None]
+            vals = line.split('=')[-1].split()
+            if vals:
+                pt_dcts[-1][key] = vals[0]
+        else:
+            # (the Hessian is read along with its header)
+            pt_dcts[-1][key] = match.start() if key == 'hess' else match.end()
+    # (the output after the end of the last point is not part of the path)
+    if len(pt_dcts) > 1:
+        pt_dcts.pop()
+
+    # The saddle point geometry is the input one
+    pt_dcts[0].pop('cur_geo', None)
+    geo_rows_lst = [
+        _point_table_rows(output_str, pt_dct, 'cur_geo') or
+        _point_table_rows(output_str, pt_dct, 'inp_geo')
+        for pt_dct in pt_dcts]
+    nums = next((tuple(int(row[1]) for row in rows)
+                 for rows in geo_rows_lst if rows), None)
+    if nums is None:
+        return None
+
+    natms = len(nums)
+    nan_xyzs = (('nan',) * 3,) * natms
+    coords = cast_array([
+        tuple(row[-3:] for row in rows) if len(rows) == natms else nan_xyzs
+        for rows in geo_rows_lst]) * phycon.ANG2BOHR
+
+    enes = cast_array([pt_dct.get('ene', 'nan') for pt_dct in pt_dcts])
+    rxn_coords = cast_array(
+        ['0.0'] + [pt_dct.get('rxn', 'nan') for pt_dct in pt_dcts[1:]])
+    rxn_coords[[pt_dct.get('path') == '2' for pt_dct in pt_dcts]] *= -1.0
+
+    grads = None
+    if all('grad' in pt_dct for pt_dct in pt_dcts):
+        grad_rows_lst = [_point_table_rows(output_str, pt_dct, 'grad')
+                         for pt_dct in pt_dcts]
+        if all(len(rows) == natms for rows in grad_rows_lst):
+            grads = -cast_array([
+                tuple(row[-3:] for row in rows) for rows in grad_rows_lst])
+
+    hessians = None
+    if all('hess' in pt_dct for pt_dct in pt_dcts):
+        hessians = [hessian(output_str[pt_dct['hess']:])
+                    for pt_dct in pt_dcts]
+        hessians = (numpy.array(hessians)
+                    if all(hess is not None for hess in hessians) else None)
+
+    symbs = tuple(map(ptab.to_symbol, nums))
+
+    return IrcTrajectory(symbs, coords, enes, rxn_coords, grads, hessians)
+
+
+def _point_table_rows(output_str, pt_dct, key):
+    """ Reads the rows of numbers of a table of an IRC point, if it has one.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :param pt_dct: positions of the lines read for the point, by key
+        :type pt_dct: dict[str: int]
+        :param key: key of the table in `IRC_TABLE_NSKIP_DCT`
+        :type key: str
+        :rtype: tuple(tuple(str))
+    """
+
+    if key not in pt_dct:
+        return ()
+
+    pos = pt_dct[key]
+    for _ in range(IRC_TABLE_NSKIP_DCT[key] + 1):
+        pos = output_str.find('\n', pos) + 1
+        if not pos:
+            return ()
+
+    rows = []
+    while pos:
+        end = output_str.find('\n', pos)
+        row = (output_str[pos:end] if end >= 0 else output_str[pos:]).split()
+        if len(row) < 5 or not row[0].isdigit():
             break
-    for i, line in enumerate(output_lines):
-        if 'OF POINTS ALONG THE PATH' in line:
-            section_starts.append(i)
-
-    # Get the TS info first
-    sadpt_str = '\n'.join(output_lines[0:section_starts[0]])
-    sadpt_geom = sadpt_geometry(sadpt_str)
-    # sadpt_grad = gradient(sadpt_str)
-    # sadpt_hess = hessian(sadpt_str)
-
-    # Now start getting other points by getting a list of each string with info
-    pt_strs = []
-    for i in range(1, len(section_starts)):
-        start_line = section_starts[i-1]
-        end_line = section_starts[i]
-        pt_strs.append('\n'.join(output_lines[start_line+1:end_line]))
-
-    # Obtain the grads and hessians
-    geoms = []
-    grads = []
-    hessians = []
-    for string in pt_strs:
-        geoms.append(irc_geometry(string))
-        # pt_grad = gradient(string)
-        # pt_hess = hessian(string)
-        # if pt_grad is not None:
-        #     grads.append(pt_grad)
-        # if pt_hess is not None:
-        #     hessians.append(pt_hess)
-
-    # Combine with the 0 index info
-    geoms = [sadpt_geom] + geoms
-    if grads:
-        grads = [] + grads
-        # grads = [sadpt_grad] + grads
-    if hessians:
-        hessians = [] + hessians
-        # hessians = [sadpt_hess] + hessians
-
-    return geoms, grads, hessians
+        rows.append(row)
+        pos = end + 1
+
+    return tuple(rows)
 
 
 def sadpt_geometry(sadpt_str):
@@ -254,17 +345,15 @@ def irc_path(output_str):
         :rtype: tuple(automol geom data structure)
     """
 
-    # Reads the coordiantes
-    coordinates = _read_irc_reaction_path_summary(output_str, 'coord')
+    # Reads the energies (relative to the ts/sadpt) and coordinates
+    pt_energies, coordinates = _read_irc_reaction_path_summary(output_str)
 
-    # Reads the energies (the ts/sadpt)
     ptt = (
         'Energies reported relative to the TS energy of' +
         app.SPACES +
         app.capturing(app.FLOAT)
     )
     ts_energy = apf.last_capture(ptt, output_str)
-    pt_energies = _read_irc_reaction_path_summary(output_str, 'energy')
     if ts_energy and pt_energies:
         energies = [float(ts_energy) + ene for ene in pt_energies]
 
@@ -276,43 +365,32 @@ def irc_path(output_str):
     return (coordinates, energies)
 
 
-def _read_irc_reaction_path_summary(output_str, read_val):
-    """ Reads the values for the Intrinsic Reaction Path from the table.
+def _read_irc_reaction_path_summary(output_str):
+    """ Reads the energies and coordinates of the Intrinsic Reaction Path
+        from the table, in one pass over its rows.
 
         :param output_str: string of the program's output file
         :type output_str: str
-        :param read_val: value to read from table
-        :type read_val: str
-        :rtype: tuple(automol geom data structure)
+        :rtype: (tuple(float), tuple(float))
     """
 
-    assert read_val in ('energy', 'coord')
-
     block = apf.last_capture(
         (app.escape('Summary of reaction path following') +
          app.capturing(app.one_or_more(app.WILDCARD, greedy=False)) +
          app.escape('Total number of points:') + app.SPACES + app.INTEGER),
         output_str)
 
-    if read_val == 'energy':
-        pattern = (
-            app.INTEGER + app.SPACES +
-            app.capturing(app.FLOAT) +
-            app.SPACES +
-            app.FLOAT
-        )
-    elif read_val == 'coord':
-        pattern = (
-            app.INTEGER + app.SPACES +
-            app.FLOAT +
-            app.SPACES +
-            app.capturing(app.FLOAT)
-        )
+    pattern = (
+        app.INTEGER + app.SPACES +
+        app.capturing(app.FLOAT) +
+        app.SPACES +
+        app.capturing(app.FLOAT)
+    )
 
-    captures = apf.all_captures(pattern, block)
-    if captures is not None:
-        values = [float(capture) for capture in captures]
+    captures = apf.all_captures(pattern, block) if block is not None else None
+    if captures:
+        energies, coordinates = cast_array(captures).T.tolist()
     else:
-        values = None
+        energies, coordinates = None, None
 
-    return values
+    return energies, coordinates
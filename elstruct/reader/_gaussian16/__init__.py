@@ -1,26 +1,6 @@
 """ Gaussian16 output reading module """
 
-from elstruct.reader._gaussian16.energ import energy
-from elstruct.reader._gaussian16.surface import gradient
-from elstruct.reader._gaussian16.surface import hessian
-from elstruct.reader._gaussian16.surface import harmonic_frequencies
-from elstruct.reader._gaussian16.surface import normal_coordinates
-from elstruct.reader._gaussian16.surface import irc_points
-from elstruct.reader._gaussian16.surface import irc_path
-from elstruct.reader._gaussian16.molecule import opt_geometry
-from elstruct.reader._gaussian16.molecule import opt_zmatrix
-from elstruct.reader._gaussian16.molecule import inp_zmatrix
-from elstruct.reader._gaussian16.molecule import opt_zmatrices
-from elstruct.reader._gaussian16._vpt2 import vpt2
-from elstruct.reader._gaussian16.prop import dipole_moment
-from elstruct.reader._gaussian16.prop import polarizability
-from elstruct.reader._gaussian16.status import has_normal_exit_message
-from elstruct.reader._gaussian16.status import error_list
-from elstruct.reader._gaussian16.status import success_list
-from elstruct.reader._gaussian16.status import has_error_message
-from elstruct.reader._gaussian16.status import check_convergence_messages
-from elstruct.reader._gaussian16.version import program_name
-from elstruct.reader._gaussian16.version import program_version
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -31,7 +11,9 @@ __all__ = [
     'normal_coordinates',
     'irc_points',
     'irc_path',
+    'irc_trajectory',
     'opt_geometry',
+    'opt_trajectory',
     'opt_zmatrix',
     'inp_zmatrix',
     'opt_zmatrices',
@@ -42,7 +24,39 @@ __all__ = [
     'error_list',
     'success_list',
     'has_error_message',
+    'has_success_message',
     'check_convergence_messages',
+    'status_report',
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._gaussian16.energ',
+    'gradient': 'elstruct.reader._gaussian16.surface',
+    'hessian': 'elstruct.reader._gaussian16.surface',
+    'harmonic_frequencies': 'elstruct.reader._gaussian16.surface',
+    'normal_coordinates': 'elstruct.reader._gaussian16.surface',
+    'irc_points': 'elstruct.reader._gaussian16.surface',
+    'irc_path': 'elstruct.reader._gaussian16.surface',
+    'irc_trajectory': 'elstruct.reader._gaussian16.surface',
+    'opt_geometry': 'elstruct.reader._gaussian16.molecule',
+    'opt_trajectory': 'elstruct.reader._gaussian16.molecule',
+    'opt_zmatrix': 'elstruct.reader._gaussian16.molecule',
+    'inp_zmatrix': 'elstruct.reader._gaussian16.molecule',
+    'opt_zmatrices': 'elstruct.reader._gaussian16.molecule',
+    'vpt2': 'elstruct.reader._gaussian16._vpt2',
+    'dipole_moment': 'elstruct.reader._gaussian16.prop',
+    'polarizability': 'elstruct.reader._gaussian16.prop',
+    'has_normal_exit_message': 'elstruct.reader._gaussian16.status',
+    'error_list': 'elstruct.reader._gaussian16.status',
+    'success_list': 'elstruct.reader._gaussian16.status',
+    'has_error_message': 'elstruct.reader._gaussian16.status',
+    'has_success_message': 'elstruct.reader._gaussian16.status',
+    'check_convergence_messages': 'elstruct.reader._gaussian16.status',
+    'status_report': 'elstruct.reader._gaussian16.status',
+    'program_name': 'elstruct.reader._gaussian16.version',
+    'program_version': 'elstruct.reader._gaussian16.version',
+})
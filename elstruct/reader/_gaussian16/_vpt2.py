@@ -2,10 +2,11 @@
 """
 
 from phydat import phycon
-import automol
 import autoread as ar
 import autoparse.pattern as app
 import autoparse.find as apf
+from autoparse import cast_array
+from elstruct.reader._tensor import symmetric_tensor
 
 
 def anharmonic_frequencies(output_str):
@@ -190,9 +191,12 @@ def cubic_force_constants(output_str):
         from the output file string. Returns the constants in _.
         Hartree*amu(-3/2)*Bohr(-3)
 
+        The constants are returned as a sparse symmetric tensor, holding
+        the value for each unique set of normal mode indices.
+
         :param output_str: string of the program's output file
         :type output_str: str
-        :rtype: tuple(tuple(float))
+        :rtype: SymmetricTensor
     """
 
     block = apf.last_capture(
@@ -217,7 +221,7 @@ def cubic_force_constants(output_str):
 
     caps = apf.all_captures(pattern, block)
     if caps:
-        cfc_mat = _fc_mat(caps)
+        cfc_mat = _fc_tensor(caps)
     else:
         cfc_mat = None
 
@@ -229,9 +233,12 @@ def quartic_force_constants(output_str):
         from the output file string. Returns the constants in _.
         Hartree*amu(2)*Bohr(-4)
 
+        The constants are returned as a sparse symmetric tensor, holding
+        the value for each unique set of normal mode indices.
+
         :param output_str: string of the program's output file
         :type output_str: str
-        :rtype: tuple(tuple(float))
+        :rtype: SymmetricTensor
     """
 
     block = apf.last_capture(
@@ -264,31 +271,27 @@ def quartic_force_constants(output_str):
 
     caps = apf.all_captures(pattern, block)
     if caps:
-        qfc_mat = _fc_mat(caps)
+        qfc_mat = _fc_tensor(caps)
     else:
         qfc_mat = None
 
     return qfc_mat
 
 
-def _fc_mat(fc_caps):
+def _fc_tensor(fc_caps):
     """ caps: (
-            ((idx1, idx2, ..., idxn), val1),
-            ((idx1, idx2, ..., idxn), val2),
+            (idx1, idx2, ..., idxn, val1),
+            (idx1, idx2, ..., idxn, val2),
             ...,
-            ((idx1, idx2, ..., idxn), valn),
+            (idx1, idx2, ..., idxn, valn),
+        with the indices counted from 1
     """
 
-    # Convert the types of the force constant data
-    fc_idxs, fc_vals = [], []
-    for caps in fc_caps:
-        fc_idxs.append(tuple(int(val)-1 for val in caps[:-1]))
-        fc_vals.append(float(caps[-1]))
-
-    fc_mat = automol.util.highd_mat.build_full_array(
-        fc_idxs, fc_vals, fill_perms=True)
+    # Convert the types of the force constant data, all at once
+    fc_idxs = cast_array([caps[:-1] for caps in fc_caps], dtype=int) - 1
+    fc_vals = cast_array([caps[-1] for caps in fc_caps])
 
-    return fc_mat
+    return symmetric_tensor(fc_idxs, fc_vals)
 
 
 def vpt2(output_str):
@@ -6,6 +6,25 @@ import autoparse.find as apf
 import elstruct.par
 
 
+SCF_CONV_PTTS = (
+    ('Initial convergence to {} achieved.  Increase integral accuracy.' +
+     app.LINE_FILL + app.NEWLINE + app.LINE_FILL + app.escape('SCF Done:')
+     ).format(app.EXPONENTIAL_FLOAT_D),
+    app.escape('Rotation gradient small -- convergence achieved.'))
+OPT_CONV_PTT = (
+    app.escape('Optimization completed.') +
+    app.LINE_FILL + app.NEWLINE + app.LINE_FILL +
+    app.escape('-- Stationary point found.'))
+IRC_CONV_PTT = app.escape('Reaction path calculation complete.')
+SCF_NOCONV_PTT = app.padded(app.NEWLINE).join([
+    app.escape('Convergence criterion not met.'),
+    app.escape('SCF Done:')])
+OPT_NOCONV_PTT = app.padded(app.NEWLINE).join([
+    app.escape('Optimization stopped.'),
+    app.escape('-- Number of steps exceeded,')])
+IRC_NOCONV_PTT = app.escape('Maximum number of corrector steps exceeded')
+
+
 # Exit message for the program
 def has_normal_exit_message(output_str):
     """ Assess whether the output file string contains the
@@ -31,13 +50,7 @@ def _has_scf_convergence_message(output_str):
         :rtype: bool
     """
 
-    scf_str1 = (
-        'Initial convergence to {} achieved.  Increase integral accuracy.' +
-        app.LINE_FILL + app.NEWLINE + app.LINE_FILL + app.escape('SCF Done:')
-    ).format(app.EXPONENTIAL_FLOAT_D)
-    scf_str2 = app.escape('Rotation gradient small -- convergence achieved.')
-
-    pattern = app.one_of_these([scf_str1, scf_str2])
+    pattern = app.one_of_these(SCF_CONV_PTTS)
 
     return apf.has_match(pattern, output_str, case=False)
 
@@ -51,13 +64,7 @@ def _has_opt_convergence_message(output_str):
         :rtype: bool
     """
 
-    pattern = (
-        app.escape('Optimization completed.') +
-        app.LINE_FILL + app.NEWLINE + app.LINE_FILL +
-        app.escape('-- Stationary point found.')
-    )
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(OPT_CONV_PTT, output_str, case=False)
 
 
 def _has_irc_convergence_message(output_str):
@@ -70,9 +77,7 @@ def _has_irc_convergence_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.escape('Reaction path calculation complete.')
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(IRC_CONV_PTT, output_str, case=False)
 
 
 # Parsers for various error messages
@@ -85,12 +90,7 @@ def _has_scf_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.padded(app.NEWLINE).join([
-        app.escape('Convergence criterion not met.'),
-        app.escape('SCF Done:')
-    ])
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(SCF_NOCONV_PTT, output_str, case=False)
 
 
 def _has_opt_nonconvergence_error_message(output_str):
@@ -102,12 +102,7 @@ def _has_opt_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.padded(app.NEWLINE).join([
-        app.escape('Optimization stopped.'),
-        app.escape('-- Number of steps exceeded,')
-    ])
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(OPT_NOCONV_PTT, output_str, case=False)
 
 
 def _has_irc_nonconvergence_error_message(output_str):
@@ -120,9 +115,7 @@ def _has_irc_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.escape('Maximum number of corrector steps exceeded')
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(IRC_NOCONV_PTT, output_str, case=False)
 
 
 ERROR_READER_DCT = {
@@ -139,6 +132,16 @@ SUCCESS_READER_DCT = {
     elstruct.par.Success.IRC_CONV: _has_irc_convergence_message
 }
 
+# Looks for all of the error and success messages at once
+STATUS_SCANNER = apf.scanner({
+    elstruct.par.Error.SCF_NOCONV: SCF_NOCONV_PTT,
+    elstruct.par.Error.OPT_NOCONV: OPT_NOCONV_PTT,
+    elstruct.par.Error.IRC_NOCONV: IRC_NOCONV_PTT,
+    elstruct.par.Success.SCF_CONV: SCF_CONV_PTTS,
+    elstruct.par.Success.OPT_CONV: OPT_CONV_PTT,
+    elstruct.par.Success.IRC_CONV: IRC_CONV_PTT,
+}, case=False)
+
 
 def error_list():
     """ Constructs a list of errors that be identified from the output file.
@@ -172,6 +175,36 @@ def has_error_message(error, output_str):
     return err_val
 
 
+def has_success_message(success, output_str):
+    """ Assess whether the output file string contains the success message
+        for one of the procedures in the job.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: bool
+    """
+
+    assert success in success_list()
+
+    return SUCCESS_READER_DCT[success](output_str)
+
+
+def status_report(output_str):
+    """ Assess which of the error and success messages the output file
+        string contains, looking for all of them in one scan of the output.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :returns: whether there is a message for each error and success
+        :rtype: dict[str: bool]
+    """
+
+    report = dict.fromkeys(error_list() + success_list(), False)
+    report.update(apf.scan(STATUS_SCANNER, output_str))
+
+    return report
+
+
 def check_convergence_messages(error, success, output_str):
     """ Assess whether the output file string contains messages
         denoting all of the requested procedures in the job have converged.
@@ -1,20 +1,6 @@
 """ Molpro2015 output reading module """
 
-from elstruct.reader._molpro2015.energ import energy
-from elstruct.reader._molpro2015.surface import gradient
-from elstruct.reader._molpro2015.surface import hessian
-from elstruct.reader._molpro2015.surface import harmonic_frequencies
-from elstruct.reader._molpro2015.surface import normal_coordinates
-from elstruct.reader._molpro2015.molecule import opt_geometry
-from elstruct.reader._molpro2015.molecule import opt_zmatrix
-from elstruct.reader._molpro2015.molecule import inp_zmatrix
-from elstruct.reader._molpro2015.status import has_normal_exit_message
-from elstruct.reader._molpro2015.status import error_list
-# from elstruct.reader._molpro2015.status import success_list
-from elstruct.reader._molpro2015.status import has_error_message
-from elstruct.reader._molpro2015.status import check_convergence_messages
-from elstruct.reader._molpro2015.version import program_name
-from elstruct.reader._molpro2015.version import program_version
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -27,9 +13,33 @@ __all__ = [
     'opt_zmatrix',
     'has_normal_exit_message',
     'error_list',
-    # 'success_list',
+    'success_list',
     'has_error_message',
+    'has_success_message',
     'check_convergence_messages',
+    'status_report',
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._molpro2015.energ',
+    'gradient': 'elstruct.reader._molpro2015.surface',
+    'hessian': 'elstruct.reader._molpro2015.surface',
+    'harmonic_frequencies': 'elstruct.reader._molpro2015.surface',
+    'normal_coordinates': 'elstruct.reader._molpro2015.surface',
+    'opt_geometry': 'elstruct.reader._molpro2015.molecule',
+    'opt_zmatrix': 'elstruct.reader._molpro2015.molecule',
+    'inp_zmatrix': 'elstruct.reader._molpro2015.molecule',
+    'has_normal_exit_message': 'elstruct.reader._molpro2015.status',
+    'error_list': 'elstruct.reader._molpro2015.status',
+    'success_list': 'elstruct.reader._molpro2015.status',
+    'has_error_message': 'elstruct.reader._molpro2015.status',
+    'has_success_message': 'elstruct.reader._molpro2015.status',
+    'check_convergence_messages': 'elstruct.reader._molpro2015.status',
+    'status_report': 'elstruct.reader._molpro2015.status',
+    'program_name': 'elstruct.reader._molpro2015.version',
+    'program_version': 'elstruct.reader._molpro2015.version',
+})
@@ -6,6 +6,25 @@ import autoparse.find as apf
 import elstruct.par
 
 
+MCSCF_NOCONV_PTTS = (
+    app.escape('The problem occurs in Multi'),
+    app.escape('The problem occurs in cipro'))
+SCF_CONV_PTTS = (
+    ('Initial convergence to {} achieved.  Increase integral accuracy.' +
+     app.LINE_FILL + app.NEWLINE + app.LINE_FILL + app.escape('SCF Done:')
+     ).format(app.EXPONENTIAL_FLOAT_D),
+    app.escape('Rotation gradient small -- convergence achieved.'),
+) + MCSCF_NOCONV_PTTS
+OPT_CONV_PTT = (
+    app.escape('Optimization completed.') +
+    app.LINE_FILL + app.NEWLINE + app.LINE_FILL +
+    app.escape('-- Stationary point found.'))
+SCF_NOCONV_PTT = app.escape('No convergence') + app.not_followed_by(
+    app.padded('in max. number of iterations'))
+OPT_NOCONV_PTT = app.escape('No convergence in max. number of iterations')
+LIN_DEP_BASIS_PTT = 'ERROR: BASIS LINEARLY DEPENDENT OR WRONG S'
+
+
 # Exit message for the program
 def has_normal_exit_message(output_str):
     """ Assess whether the output file string contains the
@@ -34,15 +53,7 @@ def _has_scf_convergence_message(output_str):
         :rtype: bool
     """
 
-    scf_str1 = (
-        'Initial convergence to {} achieved.  Increase integral accuracy.' +
-        app.LINE_FILL + app.NEWLINE + app.LINE_FILL + app.escape('SCF Done:')
-    ).format(app.EXPONENTIAL_FLOAT_D)
-    scf_str2 = app.escape('Rotation gradient small -- convergence achieved.')
-    scf_str3 = app.escape('The problem occurs in Multi')
-    scf_str4 = app.escape('The problem occurs in cipro')
-
-    pattern = app.one_of_these([scf_str1, scf_str2, scf_str3, scf_str4])
+    pattern = app.one_of_these(SCF_CONV_PTTS)
 
     return apf.has_match(pattern, output_str, case=False)
 
@@ -56,13 +67,7 @@ def _has_opt_convergence_message(output_str):
         :rtype: bool
     """
 
-    pattern = (
-        app.escape('Optimization completed.') +
-        app.LINE_FILL + app.NEWLINE + app.LINE_FILL +
-        app.escape('-- Stationary point found.')
-    )
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(OPT_CONV_PTT, output_str, case=False)
 
 
 # Parsers for various error messages
@@ -75,10 +80,7 @@ def _has_scf_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.escape('No convergence') + app.not_followed_by(
-        app.padded('in max. number of iterations'))
-
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(SCF_NOCONV_PTT, output_str, case=False)
 
 
 def _has_mcscf_nonconvergence_error_message(output_str):
@@ -94,10 +96,7 @@ def _has_mcscf_nonconvergence_error_message(output_str):
         :rtype: bool
     """
 
-    pattern = app.one_of_these([
-        app.escape('The problem occurs in Multi'),
-        app.escape('The problem occurs in cipro')
-    ])
+    pattern = app.one_of_these(MCSCF_NOCONV_PTTS)
     return apf.has_match(pattern, output_str, case=True)
 
 
@@ -114,8 +113,7 @@ def _has_opt_nonconvergence_error_message(output_str):
     if _has_scf_nonconvergence_error_message(output_str):
         error = True
     else:
-        pattern = app.escape('No convergence in max. number of iterations')
-        error = apf.has_match(pattern, output_str, case=False)
+        error = apf.has_match(OPT_NOCONV_PTT, output_str, case=False)
     return error
 
 
@@ -128,8 +126,7 @@ def _has_linear_dependence_error_message(output_str):
         :type output_str: str
         :rtype: bool
     """
-    pattern = 'ERROR: BASIS LINEARLY DEPENDENT OR WRONG S'
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(LIN_DEP_BASIS_PTT, output_str, case=False)
 
 
 ERROR_READER_DCT = {
@@ -145,6 +142,18 @@ SUCCESS_READER_DCT = {
     elstruct.par.Success.OPT_CONV: _has_opt_convergence_message
 }
 
+# Looks for all of the error and success messages at once
+# (the optimization also fails if the SCF does)
+STATUS_SCANNER = apf.scanner({
+    elstruct.par.Error.SCF_NOCONV: SCF_NOCONV_PTT,
+    elstruct.par.Error.OPT_NOCONV: (SCF_NOCONV_PTT, OPT_NOCONV_PTT),
+    elstruct.par.Error.LIN_DEP_BASIS: LIN_DEP_BASIS_PTT,
+    elstruct.par.Success.SCF_CONV: SCF_CONV_PTTS,
+    elstruct.par.Success.OPT_CONV: OPT_CONV_PTT,
+}, case=False) + apf.scanner({
+    elstruct.par.Error.MCSCF_NOCONV: MCSCF_NOCONV_PTTS,
+}, case=True)
+
 
 def error_list():
     """ Constructs a list of errors that be identified from the output file.
@@ -178,6 +187,36 @@ def has_error_message(error, output_str):
     return err_val
 
 
+def has_success_message(success, output_str):
+    """ Assess whether the output file string contains the success message
+        for one of the procedures in the job.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: bool
+    """
+
+    assert success in success_list()
+
+    return SUCCESS_READER_DCT[success](output_str)
+
+
+def status_report(output_str):
+    """ Assess which of the error and success messages the output file
+        string contains, looking for all of them in one scan of the output.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :returns: whether there is a message for each error and success
+        :rtype: dict[str: bool]
+    """
+
+    report = dict.fromkeys(error_list() + success_list(), False)
+    report.update(apf.scan(STATUS_SCANNER, output_str))
+
+    return report
+
+
 def check_convergence_messages(error, success, output_str):
     """ Assess whether the output file string contains messages
         denoting all of the requested procedures in the job have converged.
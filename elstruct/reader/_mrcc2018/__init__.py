@@ -1,13 +1,6 @@
 """ mrcc 2018 output reading module """
-from elstruct.reader._mrcc2018.energ import energy
-from elstruct.reader._mrcc2018.surface import gradient
-from elstruct.reader._mrcc2018.prop import dipole_moment
-from elstruct.reader._mrcc2018.status import has_normal_exit_message
-from elstruct.reader._mrcc2018.status import error_list
-from elstruct.reader._mrcc2018.status import has_error_message
-from elstruct.reader._mrcc2018.status import check_convergence_messages
-from elstruct.reader._mrcc2018.version import program_name
-from elstruct.reader._mrcc2018.version import program_version
+
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -18,6 +11,22 @@ __all__ = [
     'error_list',
     'has_error_message',
     'check_convergence_messages',
+    'status_report',
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._mrcc2018.energ',
+    'gradient': 'elstruct.reader._mrcc2018.surface',
+    'dipole_moment': 'elstruct.reader._mrcc2018.prop',
+    'has_normal_exit_message': 'elstruct.reader._mrcc2018.status',
+    'error_list': 'elstruct.reader._mrcc2018.status',
+    'has_error_message': 'elstruct.reader._mrcc2018.status',
+    'check_convergence_messages': 'elstruct.reader._mrcc2018.status',
+    'status_report': 'elstruct.reader._mrcc2018.status',
+    'program_name': 'elstruct.reader._mrcc2018.version',
+    'program_version': 'elstruct.reader._mrcc2018.version',
+})
@@ -5,6 +5,11 @@ import autoparse.find as apf
 import elstruct.par
 
 
+SCF_NOCONV_PTT = app.padded(app.NEWLINE).join([
+    app.escape('THE SCF ITERATION HAS NOT CONVERGED,'),
+    app.escape('IN MAXIMAL NUMBER OF STEPS SET BY USER!')])
+
+
 def has_normal_exit_message(output_str):
     """ does this output string have a normal exit message?
     """
@@ -15,11 +20,7 @@ def has_normal_exit_message(output_str):
 def _has_scf_nonconvergence_error_message(output_str):
     """ does this output string have an SCF non-convergence message?
     """
-    pattern = app.padded(app.NEWLINE).join([
-        app.escape('THE SCF ITERATION HAS NOT CONVERGED,'),
-        app.escape('IN MAXIMAL NUMBER OF STEPS SET BY USER!')
-    ])
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(SCF_NOCONV_PTT, output_str, case=False)
 
 
 ERROR_READER_DCT = {
@@ -31,6 +32,11 @@ ERROR_READER_DCT = {
     elstruct.par.Error.LIN_DEP_BASIS: False
 }
 
+# Looks for all of the error and success messages at once
+STATUS_SCANNER = apf.scanner({
+    elstruct.par.Error.SCF_NOCONV: SCF_NOCONV_PTT,
+}, case=False)
+
 
 def error_list():
     """ list of errors that be identified from the output file
@@ -53,6 +59,15 @@ def has_error_message(error, output_str):
     return err_val
 
 
+def status_report(output_str):
+    """ which error messages does this output string have?
+    (looks for all of them in one scan of the output)
+    """
+    report = dict.fromkeys(error_list(), False)
+    report.update(apf.scan(STATUS_SCANNER, output_str))
+    return report
+
+
 def check_convergence_messages(error, success, output_str):
     """ check if error messages should trigger job success or failure
     """
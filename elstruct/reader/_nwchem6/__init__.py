@@ -1,9 +1,6 @@
 """ nwchem6 output reading module """
-from elstruct.reader._nwchem6.energ import energy
-from elstruct.reader._nwchem6.surface import gradient
-from elstruct.reader._nwchem6.molecule import opt_geometry
-from elstruct.reader._nwchem6.version import program_name
-from elstruct.reader._nwchem6.version import program_version
+
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -13,3 +10,13 @@ __all__ = [
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._nwchem6.energ',
+    'gradient': 'elstruct.reader._nwchem6.surface',
+    'opt_geometry': 'elstruct.reader._nwchem6.molecule',
+    'program_name': 'elstruct.reader._nwchem6.version',
+    'program_version': 'elstruct.reader._nwchem6.version',
+})
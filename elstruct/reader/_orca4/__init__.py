@@ -1,15 +1,6 @@
 """ orca4 output reading module """
-from elstruct.reader._orca4.energ import energy
-from elstruct.reader._orca4.surface import gradient
-from elstruct.reader._orca4.surface import hessian
-from elstruct.reader._orca4.molecule import opt_geometry
-from elstruct.reader._orca4.prop import dipole_moment
-from elstruct.reader._orca4.status import has_normal_exit_message
-from elstruct.reader._orca4.status import error_list
-from elstruct.reader._orca4.status import has_error_message
-from elstruct.reader._orca4.status import check_convergence_messages
-from elstruct.reader._orca4.version import program_name
-from elstruct.reader._orca4.version import program_version
+
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -22,6 +13,24 @@ __all__ = [
     'error_list',
     'has_error_message',
     'check_convergence_messages',
+    'status_report',
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._orca4.energ',
+    'gradient': 'elstruct.reader._orca4.surface',
+    'hessian': 'elstruct.reader._orca4.surface',
+    'opt_geometry': 'elstruct.reader._orca4.molecule',
+    'dipole_moment': 'elstruct.reader._orca4.prop',
+    'has_normal_exit_message': 'elstruct.reader._orca4.status',
+    'error_list': 'elstruct.reader._orca4.status',
+    'has_error_message': 'elstruct.reader._orca4.status',
+    'check_convergence_messages': 'elstruct.reader._orca4.status',
+    'status_report': 'elstruct.reader._orca4.status',
+    'program_name': 'elstruct.reader._orca4.version',
+    'program_version': 'elstruct.reader._orca4.version',
+})
@@ -5,6 +5,12 @@ import autoparse.find as apf
 import elstruct.par
 
 
+SCF_NOCONV_PTT = 'This wavefunction IS NOT CONVERGED!'
+CC_NOCONV_PTT = '--- The Coupled-Cluster iterations have NOT converged ---'
+OPT_NOCONV_PTT = ('The optimization has not yet converged - ' +
+                  'more geometry cycles are needed')
+
+
 def has_normal_exit_message(output_str):
     """ does this output string have a normal exit message?
     """
@@ -15,23 +21,19 @@ def has_normal_exit_message(output_str):
 def _has_scf_nonconvergence_error_message(output_str):
     """ does this output string have an SCF non-convergence message?
     """
-    pattern = 'This wavefunction IS NOT CONVERGED!'
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(SCF_NOCONV_PTT, output_str, case=False)
 
 
 def _has_cc_nonconvergence_error_message(output_str):
     """ does this output string have a CC non-convergence message?
     """
-    pattern = '--- The Coupled-Cluster iterations have NOT converged ---'
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(CC_NOCONV_PTT, output_str, case=False)
 
 
 def _has_opt_nonconvergence_error_message(output_str):
     """ does this output string have an optimization non-convergence message?
     """
-    pattern = ('The optimization has not yet converged - ' +
-               'more geometry cycles are needed')
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(OPT_NOCONV_PTT, output_str, case=False)
 
 
 ERROR_READER_DCT = {
@@ -43,6 +45,13 @@ ERROR_READER_DCT = {
     elstruct.par.Error.LIN_DEP_BASIS: (lambda _: False),
 }
 
+# Looks for all of the error and success messages at once
+STATUS_SCANNER = apf.scanner({
+    elstruct.par.Error.SCF_NOCONV: SCF_NOCONV_PTT,
+    elstruct.par.Error.CC_NOCONV: CC_NOCONV_PTT,
+    elstruct.par.Error.OPT_NOCONV: OPT_NOCONV_PTT,
+}, case=False)
+
 
 def error_list():
     """ list of errors that be identified from the output file
@@ -65,6 +74,15 @@ def has_error_message(error, output_str):
     return err_val
 
 
+def status_report(output_str):
+    """ which error messages does this output string have?
+    (looks for all of them in one scan of the output)
+    """
+    report = dict.fromkeys(error_list(), False)
+    report.update(apf.scan(STATUS_SCANNER, output_str))
+    return report
+
+
 def check_convergence_messages(error, success, output_str):
     """ check if error messages should trigger job success or failure
     """
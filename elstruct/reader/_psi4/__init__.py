@@ -1,21 +1,6 @@
 """ psi4 output reading module """
-from elstruct.reader._psi4.energ import energy
-from elstruct.reader._psi4.surface import gradient
-from elstruct.reader._psi4.surface import hessian
-from elstruct.reader._psi4.surface import harmonic_frequencies
-from elstruct.reader._psi4.surface import irc_points
-from elstruct.reader._psi4.surface import irc_path
-from elstruct.reader._psi4.molecule import opt_geometry
-from elstruct.reader._psi4.molecule import opt_zmatrix
-from elstruct.reader._psi4.molecule import inp_zmatrix
-from elstruct.reader._psi4.prop import dipole_moment
-from elstruct.reader._psi4.prop import polarizability
-from elstruct.reader._psi4.status import has_normal_exit_message
-from elstruct.reader._psi4.status import error_list
-from elstruct.reader._psi4.status import has_error_message
-from elstruct.reader._psi4.status import check_convergence_messages
-from elstruct.reader._psi4.version import program_name
-from elstruct.reader._psi4.version import program_version
+
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -32,8 +17,36 @@ __all__ = [
     'polarizability',
     'has_normal_exit_message',
     'error_list',
+    'success_list',
     'has_error_message',
+    'has_success_message',
     'check_convergence_messages',
+    'status_report',
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._psi4.energ',
+    'gradient': 'elstruct.reader._psi4.surface',
+    'hessian': 'elstruct.reader._psi4.surface',
+    'harmonic_frequencies': 'elstruct.reader._psi4.surface',
+    'irc_points': 'elstruct.reader._psi4.surface',
+    'irc_path': 'elstruct.reader._psi4.surface',
+    'opt_geometry': 'elstruct.reader._psi4.molecule',
+    'opt_zmatrix': 'elstruct.reader._psi4.molecule',
+    'inp_zmatrix': 'elstruct.reader._psi4.molecule',
+    'dipole_moment': 'elstruct.reader._psi4.prop',
+    'polarizability': 'elstruct.reader._psi4.prop',
+    'has_normal_exit_message': 'elstruct.reader._psi4.status',
+    'error_list': 'elstruct.reader._psi4.status',
+    'success_list': 'elstruct.reader._psi4.status',
+    'has_error_message': 'elstruct.reader._psi4.status',
+    'has_success_message': 'elstruct.reader._psi4.status',
+    'check_convergence_messages': 'elstruct.reader._psi4.status',
+    'status_report': 'elstruct.reader._psi4.status',
+    'program_name': 'elstruct.reader._psi4.version',
+    'program_version': 'elstruct.reader._psi4.version',
+})
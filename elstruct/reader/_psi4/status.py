@@ -5,6 +5,16 @@ import autoparse.find as apf
 import elstruct.par
 
 
+SCF_CONV_PTTS = ('Energy and wave function converged',)
+OPT_CONV_PTT = app.escape('**** Optimization is complete!')
+SCF_NOCONV_PTTS = (
+    app.escape('PsiException: Could not converge SCF iterations'),
+    app.escape('Failed to converge.'))
+OPT_NOCONV_PTT = app.escape('PsiException: Could not converge geometry '
+                            'optimization')
+SYMM_NOFIND_PTT = app.escape('Unrecognized point group bits:')
+
+
 # Exit message for the program
 def has_normal_exit_message(output_str):
     """ does this output string have a normal exit message?
@@ -17,42 +27,34 @@ def has_normal_exit_message(output_str):
 def _has_scf_convergence_message(output_str):
     """ does this output string have a convergence success message?
     """
-    scf_str1 = 'Energy and wave function converged'
-    pattern = app.one_of_these([scf_str1])
+    pattern = app.one_of_these(SCF_CONV_PTTS)
     return apf.has_match(pattern, output_str, case=True)
 
 
 def _has_opt_convergence_message(output_str):
     """ does this output string have a convergence success message?
     """
-    pattern = app.escape('**** Optimization is complete!')
-    return apf.has_match(pattern, output_str, case=True)
+    return apf.has_match(OPT_CONV_PTT, output_str, case=True)
 
 
 # Parsers for various error messages
 def _has_scf_nonconvergence_error_message(output_str):
     """ does this output string have an SCF non-convergence message?
     """
-    pattern = app.one_of_these([
-        app.escape('PsiException: Could not converge SCF iterations'),
-        app.escape('Failed to converge.')
-    ])
+    pattern = app.one_of_these(SCF_NOCONV_PTTS)
     return apf.has_match(pattern, output_str, case=False)
 
 
 def _has_opt_nonconvergence_error_message(output_str):
     """ does this output string have an optimization non-convergence message?
     """
-    pattern = app.escape('PsiException: Could not converge geometry '
-                         'optimization')
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(OPT_NOCONV_PTT, output_str, case=False)
 
 
 def _has_symmetry_detection_error_message(output_str):
     """ does this output string have an optimization non-convergence message?
     """
-    pattern = app.escape('Unrecognized point group bits:')
-    return apf.has_match(pattern, output_str, case=False)
+    return apf.has_match(SYMM_NOFIND_PTT, output_str, case=False)
 
 
 ERROR_READER_DCT = {
@@ -70,6 +72,16 @@ SUCCESS_READER_DCT = {
     elstruct.par.Success.OPT_CONV: _has_opt_convergence_message,
 }
 
+# Looks for all of the error and success messages at once
+STATUS_SCANNER = apf.scanner({
+    elstruct.par.Error.SCF_NOCONV: SCF_NOCONV_PTTS,
+    elstruct.par.Error.OPT_NOCONV: OPT_NOCONV_PTT,
+    elstruct.par.Error.SYMM_NOFIND: SYMM_NOFIND_PTT,
+}, case=False) + apf.scanner({
+    elstruct.par.Success.SCF_CONV: SCF_CONV_PTTS,
+    elstruct.par.Success.OPT_CONV: OPT_CONV_PTT,
+}, case=True)
+
 
 def error_list():
     """ list of errors that be identified from the output file
@@ -98,6 +110,30 @@ def has_error_message(error, output_str):
     return err_val
 
 
+def has_success_message(success, output_str):
+    """ does this output string have a success message?
+    """
+
+    assert success in success_list()
+
+    success_reader = SUCCESS_READER_DCT[success]
+    if isinstance(success_reader, bool):
+        success_val = False
+    else:
+        success_val = success_reader(output_str)
+
+    return success_val
+
+
+def status_report(output_str):
+    """ which error and success messages does this output string have?
+    (looks for all of them in one scan of the output)
+    """
+    report = dict.fromkeys(error_list() + success_list(), False)
+    report.update(apf.scan(STATUS_SCANNER, output_str))
+    return report
+
+
 def check_convergence_messages(error, success, output_str):
     """ check if error messages should trigger job success or failure
     """
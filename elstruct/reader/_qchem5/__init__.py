@@ -1,21 +1,6 @@
 """ QChem5 output reading module """
 
-from elstruct.reader._qchem5.energ import energy
-from elstruct.reader._qchem5.surface import gradient
-from elstruct.reader._qchem5.surface import hessian
-from elstruct.reader._qchem5.surface import harmonic_frequencies
-from elstruct.reader._qchem5.surface import normal_coordinates
-from elstruct.reader._qchem5.molecule import opt_geometry
-from elstruct.reader._qchem5.molecule import opt_zmatrix
-from elstruct.reader._qchem5.molecule import inp_zmatrix
-from elstruct.reader._qchem5.prop import dipole_moment
-from elstruct.reader._qchem5.status import has_normal_exit_message
-from elstruct.reader._qchem5.status import error_list
-from elstruct.reader._qchem5.status import success_list
-from elstruct.reader._qchem5.status import has_error_message
-from elstruct.reader._qchem5.status import check_convergence_messages
-from elstruct.reader._qchem5.version import program_name
-from elstruct.reader._qchem5.version import program_version
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -32,7 +17,30 @@ __all__ = [
     'error_list',
     'success_list',
     'has_error_message',
+    'has_success_message',
     'check_convergence_messages',
     'program_name',
     'program_version'
 ]
+
+
+# Functions are imported from the submodules on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'energy': 'elstruct.reader._qchem5.energ',
+    'gradient': 'elstruct.reader._qchem5.surface',
+    'hessian': 'elstruct.reader._qchem5.surface',
+    'harmonic_frequencies': 'elstruct.reader._qchem5.surface',
+    'normal_coordinates': 'elstruct.reader._qchem5.surface',
+    'opt_geometry': 'elstruct.reader._qchem5.molecule',
+    'opt_zmatrix': 'elstruct.reader._qchem5.molecule',
+    'inp_zmatrix': 'elstruct.reader._qchem5.molecule',
+    'dipole_moment': 'elstruct.reader._qchem5.prop',
+    'has_normal_exit_message': 'elstruct.reader._qchem5.status',
+    'error_list': 'elstruct.reader._qchem5.status',
+    'success_list': 'elstruct.reader._qchem5.status',
+    'has_error_message': 'elstruct.reader._qchem5.status',
+    'has_success_message': 'elstruct.reader._qchem5.status',
+    'check_convergence_messages': 'elstruct.reader._qchem5.status',
+    'program_name': 'elstruct.reader._qchem5.version',
+    'program_version': 'elstruct.reader._qchem5.version',
+})
@@ -112,7 +112,9 @@ for METHOD in METHODS:
     if Method.is_standard_dft(METHOD):
         ENERGY_READER_DCT[(METHOD, frozenset({}))] = _scf_energy
 
-# Add DFT methods to the reader dictionary
+# Only keep the readers of the methods that are set up for the program
+ENERGY_READER_DCT = {key: reader for key, reader in ENERGY_READER_DCT.items()
+                     if key[0] in METHODS}
 READ_METHODS = set(method[0] for method in ENERGY_READER_DCT)
 assert READ_METHODS <= set(METHODS)
 
@@ -83,3 +83,14 @@ def opt_zmatrix(output_str):
         zma = None
 
     return zma
+
+
+def inp_zmatrix(output_str):  # pylint: disable=unused-argument
+    """ Reads the input Z-Matrix from the output file string; not yet
+        implemented for QChem.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+    """
+    raise NotImplementedError(
+        'The QChem reader of the input Z-Matrix is not implemented')
@@ -126,6 +126,20 @@ def has_error_message(error, output_str):
     return err_val
 
 
+def has_success_message(success, output_str):
+    """ Assess whether the output file string contains the success message
+        for one of the procedures in the job.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: bool
+    """
+
+    assert success in success_list()
+
+    return SUCCESS_READER_DCT[success](output_str)
+
+
 def check_convergence_messages(error, success, output_str):
     """ Assess whether the output file string contains messages
         denoting all of the requested procedures in the job have converged.
@@ -86,6 +86,17 @@ def harmonic_frequencies(output_str):
     return freqs
 
 
+def normal_coordinates(output_str):  # pylint: disable=unused-argument
+    """ Reads the displacement along the normal modes from the output file
+        string; not yet implemented for QChem.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+    """
+    raise NotImplementedError(
+        'The QChem reader of the normal coordinates is not implemented')
+
+
 def _general_xyz_tensor(output_str):
     """ Reads the general tensor that could be used for lots of things
 
@@ -10,7 +10,6 @@
 """
 
 import numpy
-import automol
 from elstruct.reader import program_modules as pm
 
 
@@ -188,6 +187,30 @@ def irc_path(prog, output_str):
         output_str)
 
 
+def irc_trajectory_programs():
+    """ Constructs a list of program modules implementing
+        Intrinsic Reaction Coordinate trajectory readers.
+    """
+    return pm.program_modules_with_function(pm.Job.IRC_TRAJ)
+
+
+def irc_trajectory(prog, output_str):
+    """ Reads the points along the Intrinsic Reaction Coordinate from the
+        output string, as arrays of their coordinates, energies, reaction
+        coordinates, gradients, and Hessians.
+
+        :param prog: electronic structure program to use as a backend
+        :type prog: str
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: IrcTrajectory
+    """
+    return pm.call_module_function(
+        prog, pm.Job.IRC_TRAJ,
+        # *args
+        output_str)
+
+
 def opt_geometry_programs():
     """ Constructs a list of program modules implementing
         optimized geometry output readers.
@@ -207,6 +230,8 @@ def opt_geometry(prog, output_str):
         :param output_str: string of the program's output file
         :type output_str: str
     """
+    import automol  # pylint: disable=import-outside-toplevel
+
     try:
         geo = _opt_geometry(prog, output_str)
         geo = automol.geom.without_dummy_atoms(geo)
@@ -231,6 +256,30 @@ def _opt_geometry(prog, output_str):
         output_str)
 
 
+def opt_trajectory_programs():
+    """ Constructs a list of program modules implementing
+        optimization trajectory readers.
+    """
+    return pm.program_modules_with_function(pm.Job.OPT_TRAJ)
+
+
+def opt_trajectory(prog, output_str):
+    """ Reads every step of an optimization from the output string, as
+        arrays of their coordinates, energies, and largest forces and
+        displacements.
+
+        :param prog: electronic structure program to use as a backend
+        :type prog: str
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :rtype: OptTrajectory
+    """
+    return pm.call_module_function(
+        prog, pm.Job.OPT_TRAJ,
+        # *args
+        output_str)
+
+
 def opt_zmatrix_programs():
     """ Contucts a list of program modules implementing
         optimized Z-Matrix output readers.
@@ -415,6 +464,23 @@ def has_error_message(prog, error, output_str):
         error, output_str)
 
 
+def has_success_message(prog, success, output_str):
+    """ Assess whether the output file string contains the success message
+        for one of the procedures in the job.
+
+        :param prog: electronic structure program to use as a backend
+        :type prog: str
+        :param success: a key indicating the type of success message
+        :type success: str
+        :param output_str: string of the program's output file
+        :type output_str: str
+    """
+    return pm.call_module_function(
+        prog, pm.Job.SUCCESS_MSG,
+        # *args
+        success, output_str)
+
+
 def check_convergence_messages(prog, error, success, output_str):
     """ Assess whether the output file string contains messages
         denoting all of the requested procedures in the job have converged.
@@ -434,6 +500,23 @@ def check_convergence_messages(prog, error, success, output_str):
         error, success, output_str)
 
 
+def status_report(prog, output_str):
+    """ Assess which of the error and success messages the output file
+        string contains, looking for all of them in one scan of the output.
+
+        :param prog: electronic structure program to use as a backend
+        :type prog: str
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :returns: whether there is a message for each error and success
+        :rtype: dict[str: bool]
+    """
+    return pm.call_module_function(
+        prog, pm.Job.STATUS_REPORT,
+        # *args
+        output_str)
+
+
 # Versions
 def program_name(prog, output_str):
     """ Reads the name of the electronic structure code from the output file.
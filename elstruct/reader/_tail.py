@@ -0,0 +1,142 @@
+""" Incremental reading of the output of a running job
+"""
+
+import autoparse.pattern as app
+import autoparse.find as apf
+from ioformat import pathtools
+from elstruct import par
+from elstruct.reader import program_modules as pm
+from elstruct.reader import _reader
+
+
+# Number of lines from the previous read that are scanned again with the
+# new lines, so that messages split across two reads are still found
+OVERLAP_NLINES = 50
+
+GAUSSIAN_STEP_PTT = (
+    'Step number' + app.SPACES + app.capturing(app.UNSIGNED_INTEGER) +
+    app.SPACES + 'out of a maximum of')
+ORCA_STEP_PTT = (
+    'GEOMETRY OPTIMIZATION CYCLE' + app.SPACES +
+    app.capturing(app.UNSIGNED_INTEGER))
+OPT_STEP_PTT_DCT = {
+    par.Program.GAUSSIAN03: GAUSSIAN_STEP_PTT,
+    par.Program.GAUSSIAN09: GAUSSIAN_STEP_PTT,
+    par.Program.GAUSSIAN16: GAUSSIAN_STEP_PTT,
+    par.Program.ORCA4: ORCA_STEP_PTT,
+}
+
+
+class OutputTail():
+    """ Follows the output file of a running job, reading only the lines
+        written since the last read.
+
+        Each update reads the newly appended lines, along with the last
+        lines of the previous read, and updates the status of the job:
+        which error and success messages have appeared, whether the program
+        exited normally, the latest energy, and the optimization step.
+
+        :param prog: electronic structure program writing the output
+        :type prog: str
+        :param path: path to the output file
+        :type path: str
+        :param method: electronic structure method to read the energy of
+        :type method: str
+    """
+
+    def __init__(self, prog, path, method=None):
+        self.prog = prog
+        self.path = path
+        self.method = method
+
+        # Byte offset of the first line not yet read
+        self.offset = 0
+
+        self.errors = dict.fromkeys(
+            (_reader.error_list(prog)
+             if pm.has_function(prog, pm.Job.ERR_MSG) else ()), False)
+        self.successes = dict.fromkeys(
+            (_reader.success_list(prog)
+             if pm.has_function(prog, pm.Job.SUCCESS_LST) else ()), False)
+        self.normal_exit = False
+        self.energy = None
+        self.opt_step = None
+
+        self._overlap_str = ''
+
+    def update(self):
+        """ Read the complete lines appended to the output file since the
+            last update.
+
+            An output that does not exist yet has no new lines. An output
+            that has become shorter, as it was rewritten by a restarted job,
+            is read again from its start.
+
+            :returns: the errors whose messages appeared in these lines
+            :rtype: tuple(str)
+        """
+
+        new_str, offset = pathtools.read_new_lines(self.path, self.offset)
+        if offset < self.offset:
+            # Forget the status read from the previous output
+            vars(self).update(vars(OutputTail(
+                self.prog, self.path, method=self.method)))
+        self.offset = offset
+
+        return self.read(new_str) if new_str else ()
+
+    def read(self, new_str):
+        """ Read lines of output that follow those already read.
+
+            :param new_str: newly written (complete) lines of the output
+            :type new_str: str
+            :returns: the errors whose messages appeared in these lines
+            :rtype: tuple(str)
+        """
+
+        prog = self.prog
+        window_str = self._overlap_str + new_str
+
+        report = (_reader.status_report(prog, window_str)
+                  if pm.has_function(prog, pm.Job.STATUS_REPORT) else {})
+
+        new_errors = tuple(
+            error for error, found in self.errors.items()
+            if not found and report.get(error, False))
+        self.errors.update(dict.fromkeys(new_errors, True))
+
+        for success, found in self.successes.items():
+            if not found:
+                self.successes[success] = report.get(success, False)
+
+        if not self.normal_exit and pm.has_function(prog, pm.Job.EXIT_MSG):
+            self.normal_exit = _reader.has_normal_exit_message(
+                prog, window_str)
+
+        if self.method is not None:
+            ene = _reader.energy(prog, self.method, window_str)
+            if ene is not None:
+                self.energy = ene
+
+        if prog in OPT_STEP_PTT_DCT:
+            step = apf.last_capture(OPT_STEP_PTT_DCT[prog], window_str)
+            if step is not None:
+                self.opt_step = max(int(step), self.opt_step or 0)
+
+        self._overlap_str = ''.join(
+            window_str.splitlines(True)[-OVERLAP_NLINES:])
+
+        return new_errors
+
+    def converged(self, error, success=None):
+        """ Assess whether the procedure of the job has converged so far,
+            as `check_convergence_messages` does for the full output: there
+            is no error message for it, or there is also a success message.
+
+            :param error: a key indicating the type of error message
+            :type error: str
+            :param success: a key indicating the type of success message
+            :type success: str
+            :rtype: bool
+        """
+        return not self.errors[error] or self.successes.get(success, False)
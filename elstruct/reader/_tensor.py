@@ -0,0 +1,134 @@
+""" Sparse storage of symmetric tensors, such as the cubic and quartic force
+    constants of a VPT2 calculation: only the value for each unique set of
+    indices is kept, and the full array is built only when asked for.
+"""
+
+import math
+import itertools
+import collections
+import numpy
+
+
+# dim: size of each dimension of the tensor
+# idxs: (nterms, order) array of the unique sets of indices, each in
+#       ascending order, in lexicographic order
+# vals: (nterms,) array of the value for each set of indices
+SymmetricTensor = collections.namedtuple(
+    'SymmetricTensor', ('dim', 'idxs', 'vals'))
+
+
+def symmetric_tensor(idxs, vals, dim=None):
+    """ Build a sparse symmetric tensor from the values for sets of indices.
+
+        Each set of indices stands for all of its permutations; if several
+        permutations of the same indices are given, the last value is kept.
+
+        :param idxs: indices of the values, (nterms, order)
+        :type idxs: tuple(tuple(int)) or numpy.ndarray
+        :param vals: values at these indices
+        :type vals: tuple(float) or numpy.ndarray
+        :param dim: size of each dimension (default: the largest index + 1)
+        :type dim: int
+        :rtype: SymmetricTensor
+    """
+
+    vals = numpy.asarray(vals, dtype=float)
+    idxs = numpy.sort(
+        numpy.asarray(idxs, dtype=int).reshape(len(vals), -1), axis=1)
+
+    if dim is None:
+        dim = int(idxs.max()) + 1 if idxs.size else 0
+    assert not idxs.size or (idxs.min() >= 0 and idxs.max() < dim), (
+        f'Tensor indices out of range for dimension {dim}')
+
+    # Find the unique sets of indices by their flat index in the full array,
+    # searching the reversed terms so that the last value of each is kept
+    keys = numpy.ravel_multi_index(tuple(idxs[::-1].T), (dim,) * idxs.shape[1])
+    _, rev_pos = numpy.unique(keys, return_index=True)
+    idxs = idxs[::-1][rev_pos]
+    vals = vals[::-1][rev_pos]
+
+    return SymmetricTensor(dim, idxs, vals)
+
+
+def tensor_order(tensor):
+    """ The number of indices of a sparse symmetric tensor.
+
+        :param tensor: sparse symmetric tensor
+        :type tensor: SymmetricTensor
+        :rtype: int
+    """
+    return tensor.idxs.shape[1]
+
+
+def tensor_full_array(tensor):
+    """ Build the full array of a sparse symmetric tensor, with the value
+        of each set of indices filled in for all of its permutations.
+
+        :param tensor: sparse symmetric tensor
+        :type tensor: SymmetricTensor
+        :rtype: numpy.ndarray
+    """
+
+    order = tensor_order(tensor)
+    arr = numpy.zeros((tensor.dim,) * order)
+    for perm in itertools.permutations(range(order)):
+        arr[tuple(tensor.idxs[:, perm].T)] = tensor.vals
+
+    return arr
+
+
+def tensor_contraction(tensor, vec, nfree=0):
+    """ Contract all but `nfree` indices of a sparse symmetric tensor with
+        a vector, as the full array would be contracted, without building it.
+
+        For the cubic force constants F and a displacement q along the
+        normal modes, nfree=0 gives sum_ijk F_ijk q_i q_j q_k, and nfree=1
+        gives the vector sum_jk F_ijk q_j q_k.
+
+        :param tensor: sparse symmetric tensor
+        :type tensor: SymmetricTensor
+        :param vec: vector to contract the indices with, (dim,)
+        :type vec: tuple(float) or numpy.ndarray
+        :param nfree: number of indices left uncontracted
+        :type nfree: int
+        :rtype: float or numpy.ndarray
+    """
+
+    order = tensor_order(tensor)
+    assert 0 <= nfree <= order, (
+        f'Cannot leave {nfree} of the {order} tensor indices free')
+    vec = numpy.asarray(vec, dtype=float)
+
+    # Each distinct permutation of a set of indices is counted once: the
+    # position permutations repeat it once per order of the equal indices
+    wvals = tensor.vals / _equal_index_permutation_counts(tensor.idxs)
+
+    # Permutations of the contracted positions all give the same terms
+    nsame = math.factorial(order - nfree)
+
+    out = numpy.zeros((tensor.dim,) * nfree)
+    for free_pos in itertools.permutations(range(order), nfree):
+        con_pos = [pos for pos in range(order) if pos not in free_pos]
+        terms = nsame * wvals * numpy.prod(
+            vec[tensor.idxs[:, con_pos]], axis=1)
+        if nfree:
+            numpy.add.at(out, tuple(tensor.idxs[:, free_pos].T), terms)
+        else:
+            out += terms.sum()
+
+    return out if nfree else float(out)
+
+
+def _equal_index_permutation_counts(idxs):
+    """ The number of orderings of the equal indices in each (sorted) set of
+        indices: the product of the factorials of their counts.
+    """
+
+    counts = numpy.ones(len(idxs))
+    run = numpy.ones(len(idxs))
+    for pos in range(1, idxs.shape[1]):
+        run = numpy.where(idxs[:, pos] == idxs[:, pos-1], run + 1, 1)
+        counts *= run
+
+    return counts
@@ -0,0 +1,201 @@
+""" Trajectories read from the output of a job, with the points along the
+    path held as arrays
+"""
+
+import collections
+import numpy
+from autoparse import cast_array
+
+
+# The points along an Intrinsic Reaction Coordinate, in the order they
+# appear in the output; coordinates and gradients are (npoints, natoms, 3)
+# arrays, and Hessians (npoints, 3*natoms, 3*natoms), in atomic units
+IrcTrajectory = collections.namedtuple(
+    'IrcTrajectory',
+    ('symbs', 'coords', 'energies', 'rxn_coords', 'grads', 'hessians'))
+
+
+def trajectory_geometries(traj):
+    """ The geometries of the points of a trajectory, as automol geometries,
+        built from its coordinate array.
+
+        :param traj: trajectory of points
+        :type traj: IrcTrajectory or OptTrajectory
+        :returns: the geometry of each point, or None for a point whose
+            geometry was not found
+        :rtype: tuple(automol geom data structure)
+    """
+    import automol  # pylint: disable=import-outside-toplevel
+
+    return tuple(
+        None if numpy.isnan(xyzs).any() else
+        automol.geom.from_data(traj.symbs, xyzs.tolist(), angstrom=False)
+        for xyzs in traj.coords)
+
+
+# The steps of a geometry optimization, in the order they appear in the
+# output; coordinates are a (nsteps, natoms, 3) array, in Bohr, and the
+# energies and the largest force and displacement of each step are (nsteps,)
+# arrays, in the atomic units the program prints them in, with nan for
+# values that were not printed for a step
+OptTrajectory = collections.namedtuple(
+    'OptTrajectory',
+    ('symbs', 'coords', 'energies', 'max_forces', 'max_disps'))
+
+
+def step_positions(output_str, line_regex, line_key_dct):
+    """ Finds the lines read for each step of a job, in one scan of the
+        output; a new step is started by a line whose key the current step
+        already has.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :param line_regex: regular expression matching the text marking
+            the lines read
+        :type line_regex: re.Pattern
+        :param line_key_dct: key of the lines, by the text marking them
+        :type line_key_dct: dict[str: str]
+        :returns: the positions of the end of the marking text of the lines
+            read for each step, by key
+        :rtype: list(dict[str: int])
+    """
+
+    step_dcts = [{}]
+    for match in line_regex.finditer(output_str):
+        key = line_key_dct[match.group(0)]
+        if key in step_dcts[-1]:
+            step_dcts.append({})
+        step_dcts[-1][key] = match.end()
+
+    return step_dcts if step_dcts[0] else []
+
+
+def line_values(output_str, pos, nskip=0):
+    """ The whitespace-separated values from a position in the output to the
+        end of its line, or of a line a number of lines below it.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :param pos: position in the output string
+        :type pos: int
+        :param nskip: number of lines to go down
+        :type nskip: int
+        :rtype: list(str)
+    """
+
+    for _ in range(nskip):
+        pos = output_str.find('\n', pos) + 1
+        if not pos:
+            return []
+
+    end = output_str.find('\n', pos)
+    return output_str[pos:end if end >= 0 else None].split()
+
+
+def first_value(output_str, pos, after=None, nskip=0):
+    """ The first value on the line from a position in the output (or on a
+        line a number of lines below it), or the first one after the last
+        occurence of some text on the line, if given.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :param pos: position in the output string, or None
+        :type pos: int
+        :param after: text that the value follows
+        :type after: str
+        :param nskip: number of lines to go down
+        :type nskip: int
+        :returns: the value, or None if there is none
+        :rtype: str
+    """
+
+    if pos is None:
+        return None
+
+    vals = line_values(output_str, pos, nskip=nskip)
+    if after is not None:
+        line = ' '.join(vals)
+        vals = line.split(after)[-1].split() if after in line else []
+
+    return vals[0] if vals else None
+
+
+def table_rows(output_str, pos, nskip, ncols):
+    """ The rows of values of a table in the output, from the line a number
+        of lines below a position up to the first line that does not have
+        the number of columns of the table.
+
+        :param output_str: string of the program's output file
+        :type output_str: str
+        :param pos: position of the header of the table
+        :type pos: int
+        :param nskip: number of lines between the header and the rows
+        :type nskip: int
+        :param ncols: number of columns of the table
+        :type ncols: int
+        :rtype: list(list(str))
+    """
+
+    rows = []
+    row = line_values(output_str, pos, nskip=nskip + 1)
+    while len(row) == ncols:
+        rows.append(row)
+        pos = output_str.find('\n', pos) + 1
+        row = line_values(output_str, pos, nskip=nskip + 1)
+
+    return rows
+
+
+def fill_opt_trajectory(geo_rows_lst, step_vals_lst, symb_col=0, xyz_col=1):
+    """ Fills the arrays of an optimization trajectory, allocated once for
+        all of its steps, from the text read for each step.
+
+        :param geo_rows_lst: rows of the geometry table, in Angstrom, of
+            each step (empty if the step has none)
+        :type geo_rows_lst: list(list(list(str)))
+        :param step_vals_lst: the energy, largest force, and largest
+            displacement of each step (None for those not printed)
+        :type step_vals_lst: list(tuple(str))
+        :param symb_col: column of the geometry table with the atom symbols
+        :type symb_col: int
+        :param xyz_col: first column of the geometry table with coordinates
+        :type xyz_col: int
+        :returns: the trajectory, or None if no step has a geometry
+        :rtype: OptTrajectory
+    """
+
+    from phydat import phycon  # pylint: disable=import-outside-toplevel
+
+    symbs = next((tuple(row[symb_col] for row in rows)
+                  for rows in geo_rows_lst if rows), None)
+    if symbs is None:
+        return None
+
+    nsteps, natms = len(geo_rows_lst), len(symbs)
+    coords = numpy.full((nsteps, natms, 3), numpy.nan)
+    vals = numpy.full((nsteps, 3), numpy.nan)
+
+    # The coordinates of all of the complete geometries are cast at once
+    idxs = [idx for idx, rows in enumerate(geo_rows_lst)
+            if len(rows) == natms]
+    xyz_slc = slice(xyz_col, xyz_col + 3)
+    if idxs:
+        coords[idxs] = cast_array(
+            [[row[xyz_slc] for row in geo_rows_lst[idx]] for idx in idxs])
+    coords *= phycon.ANG2BOHR
+
+    for idx, step_vals in enumerate(step_vals_lst):
+        vals[idx] = tuple(map(_float_or_nan, step_vals))
+
+    return OptTrajectory(symbs, coords, *vals.T)
+
+
+def _float_or_nan(val):
+    """ The value of a number printed in the output, or nan if it is missing
+        or does not fit its field (printed as asterisks).
+    """
+    try:
+        val = float(val.replace('D', 'E'))
+    except (AttributeError, ValueError):
+        val = numpy.nan
+    return val
@@ -1,12 +1,16 @@
 """ helpers for importing and managing program modules
 """
 
+import functools
 import importlib
 from elstruct import par
 from elstruct import pclass
 
 
-# Functions to import and call the appropriate writer function
+PROGRAMS = pclass.values(par.Program)
+
+
+# Functions to import and call the appropriate reader function
 def call_module_function(prog, function, *args, **kwargs):
     """ call the module implementation of a given function
 
@@ -16,28 +20,38 @@ def call_module_function(prog, function, *args, **kwargs):
         :type function_template: function
     """
 
-    def _rename_prog(prog):
-        """ Rename a program if number does not match module name """
-        if prog in ('molpro2021', 'molpro2021_mppx'):
-            prog = 'molpro2015'
-        elif prog in ('gaussian03'):
-            prog = 'gaussian09'
-        return prog
+    reader = module_function(prog, function)
+
+    return reader(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def module_function(prog, function):
+    """ get the module implementation of a given function
+
+        The program is checked, its module imported, and the function
+        looked up only on the first call for each (prog, function) pair;
+        later calls return the cached function directly.
+
+        :param prog: the program
+        :type prog: str
+        :param function: name of the function
+        :type function: str
+        :rtype: function
+    """
 
     new_name = _rename_prog(prog)
-    assert new_name in pclass.values(par.Program), (
+    assert new_name in PROGRAMS, (
         f"The program '{new_name}' is not in the supported list of programs; "
-        f"options are {pclass.values(par.Program)}")
+        f"options are {PROGRAMS}")
     assert new_name in program_modules_with_function(function), (
         f"The function '{function}' is not in the supported list of functions"
         f" for the program '{new_name}'; programs with this function are "
         f"{program_modules_with_function(function)}")
 
-    name = f'_{_rename_prog(prog)}'
-    module = importlib.import_module(f'elstruct.reader.{name:s}')
-    reader = getattr(module, function)
+    module = importlib.import_module(f'elstruct.reader._{new_name:s}')
 
-    return reader(*args, **kwargs)
+    return getattr(module, function)
 
 
 def program_modules_with_function(function):
@@ -47,13 +61,34 @@ def program_modules_with_function(function):
     """
 
     progs = []
-    for prog in pclass.values(par.Program):
+    for prog in PROGRAMS:
         if function in READER_MODULE_DCT[prog]:
             progs.append(prog)
 
     return progs
 
 
+def has_function(prog, function):
+    """ does the module of a program implement a given function?
+
+        :param prog: the program
+        :type prog: str
+        :param function: name of the function
+        :type function: str
+        :rtype: bool
+    """
+    return _rename_prog(prog) in program_modules_with_function(function)
+
+
+def _rename_prog(prog):
+    """ Rename a program if number does not match module name """
+    if prog in ('molpro2021', 'molpro2021_mppx'):
+        prog = 'molpro2015'
+    elif prog in ('gaussian03'):
+        prog = 'gaussian09'
+    return prog
+
+
 # Information on what writers have been implemented
 class Job():
     """ Names of electronic structure jobs to ne written
@@ -65,7 +100,9 @@ class Job():
     NORM_COORDS = 'normal_coordinates'
     IRC_PTS = 'irc_points'
     IRC_PATH = 'irc_path'
+    IRC_TRAJ = 'irc_trajectory'
     OPT_GEO = 'opt_geometry'
+    OPT_TRAJ = 'opt_trajectory'
     OPT_ZMA = 'opt_zmatrix'
     OPT_ZMAS = 'opt_zmatrices'
     INP_ZMA = 'inp_zmatrix'
@@ -76,7 +113,9 @@ class Job():
     ERR_LST = 'error_list'
     SUCCESS_LST = 'success_list'
     ERR_MSG = 'has_error_message'
+    SUCCESS_MSG = 'has_success_message'
     CONV_MSG = 'check_convergence_messages'
+    STATUS_REPORT = 'status_report'
     PROG_NAME = 'program_name'
     PROG_VERS = 'program_version'
 
@@ -87,63 +126,63 @@ READER_MODULE_DCT = {
         Job.ENERGY, Job.GRADIENT,
         Job.OPT_GEO, Job.OPT_ZMA,
         Job.EXIT_MSG, Job.ERR_LST, Job.SUCCESS_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.ERR_MSG, Job.SUCCESS_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.GAUSSIAN09: (
         Job.ENERGY, Job.GRADIENT,
         Job.HESSIAN, Job.HARM_FREQS, Job.NORM_COORDS,
-        Job.IRC_PTS, Job.IRC_PATH,
-        Job.OPT_GEO, Job.OPT_ZMA, Job.OPT_ZMAS, Job.INP_ZMA,
+        Job.IRC_PTS, Job.IRC_PATH, Job.IRC_TRAJ,
+        Job.OPT_GEO, Job.OPT_TRAJ, Job.OPT_ZMA, Job.OPT_ZMAS, Job.INP_ZMA,
         Job.VPT2,
         Job.DIP_MOM, Job.POLAR,
         Job.EXIT_MSG, Job.ERR_LST, Job.SUCCESS_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.ERR_MSG, Job.SUCCESS_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.GAUSSIAN03: (
         Job.ENERGY, Job.GRADIENT,
         Job.HESSIAN, Job.HARM_FREQS, Job.NORM_COORDS,
-        Job.IRC_PTS, Job.IRC_PATH,
-        Job.OPT_GEO, Job.OPT_ZMA, Job.INP_ZMA,
+        Job.IRC_PTS, Job.IRC_PATH, Job.IRC_TRAJ,
+        Job.OPT_GEO, Job.OPT_TRAJ, Job.OPT_ZMA, Job.INP_ZMA,
         Job.VPT2,
         Job.DIP_MOM, Job.POLAR,
         Job.EXIT_MSG, Job.ERR_LST, Job.SUCCESS_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.ERR_MSG, Job.SUCCESS_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.GAUSSIAN16: (
         Job.ENERGY, Job.GRADIENT,
         Job.HESSIAN, Job.HARM_FREQS, Job.NORM_COORDS,
-        Job.IRC_PTS, Job.IRC_PATH,
-        Job.OPT_GEO, Job.OPT_ZMA, Job.INP_ZMA,
+        Job.IRC_PTS, Job.IRC_PATH, Job.IRC_TRAJ,
+        Job.OPT_GEO, Job.OPT_TRAJ, Job.OPT_ZMA, Job.INP_ZMA,
         Job.VPT2,
         Job.DIP_MOM, Job.POLAR,
         Job.EXIT_MSG, Job.ERR_LST, Job.SUCCESS_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.ERR_MSG, Job.SUCCESS_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.MOLPRO2015: (
         Job.ENERGY, Job.GRADIENT,
         Job.HESSIAN, Job.HARM_FREQS, Job.NORM_COORDS,
         Job.OPT_GEO, Job.OPT_ZMA, Job.INP_ZMA,
-        Job.EXIT_MSG, Job.ERR_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.EXIT_MSG, Job.ERR_LST, Job.SUCCESS_LST,
+        Job.ERR_MSG, Job.SUCCESS_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.MOLPRO2021: (
         Job.ENERGY, Job.GRADIENT,
         Job.HESSIAN, Job.HARM_FREQS, Job.NORM_COORDS,
         Job.OPT_GEO, Job.OPT_ZMA,
-        Job.EXIT_MSG, Job.ERR_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.EXIT_MSG, Job.ERR_LST, Job.SUCCESS_LST,
+        Job.ERR_MSG, Job.SUCCESS_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.MRCC2018: (
         Job.ENERGY, Job.GRADIENT,
         Job.DIP_MOM,
         Job.EXIT_MSG, Job.ERR_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.ERR_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.NWCHEM6: (
@@ -157,7 +196,7 @@ READER_MODULE_DCT = {
         Job.OPT_GEO,
         Job.DIP_MOM,
         Job.EXIT_MSG, Job.ERR_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.ERR_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.PSI4: (
@@ -166,8 +205,8 @@ READER_MODULE_DCT = {
         Job.IRC_PTS, Job.IRC_PATH,
         Job.OPT_GEO, Job.OPT_ZMA, Job.INP_ZMA,
         Job.DIP_MOM, Job.POLAR,
-        Job.EXIT_MSG, Job.ERR_LST,
-        Job.ERR_MSG, Job.CONV_MSG,
+        Job.EXIT_MSG, Job.ERR_LST, Job.SUCCESS_LST,
+        Job.ERR_MSG, Job.SUCCESS_MSG, Job.CONV_MSG, Job.STATUS_REPORT,
         Job.PROG_NAME, Job.PROG_VERS
     ),
     par.Program.QCHEM5: ()
@@ -0,0 +1,160 @@
+""" Synthetic Gaussian outputs, in the layout of the sections read by the
+    trajectory readers
+
+    Used by the reader tests and by the benchmarks, which scale them to any
+    number of atoms and steps.
+"""
+
+SYMBS = ('C', 'H', 'O')
+NUMS = (6, 1, 8)
+XYZS = ((0.0, 0.0, 0.0), (1.09, 0.0, 0.0), (-0.7, 1.1, 0.0))
+SYMB_DCT = {1: 'H', 6: 'C', 7: 'N', 8: 'O'}
+RULE = ' ' + '-' * 69 + '\n'
+
+
+def step_xyzs(step, xyzs=XYZS):
+    """ The coordinates (in Angstrom) of a step of the optimization
+    """
+    return tuple((x + 0.001 * step, y, z) for x, y, z in xyzs)
+
+
+def step_energy(step):
+    """ The energy of a step of the optimization
+    """
+    return -100.0 - 0.001 * step
+
+
+def step_force(step):
+    """ The largest force of a step of the optimization
+    """
+    return 0.01 / (step + 1)
+
+
+def step_disp(step):
+    """ The largest displacement of a step of the optimization
+    """
+    return 0.02 / (step + 1)
+
+
+# Gaussian
+def gaussian_orientation_string(name, nums, xyzs):
+    """ A Gaussian orientation table, e.g., 'Input' or 'Standard'
+    """
+    return (
+        f'                         {name} orientation:\n' + RULE +
+        ' Center     Atomic      Atomic             Coordinates (Angstroms)\n'
+        ' Number     Number       Type             X           Y           Z\n'
+        + RULE + ''.join(
+            f' {idx+1:6d} {num:10d} {0:11d} {x:14.6f} {y:11.6f} {z:11.6f}\n'
+            for idx, (num, (x, y, z)) in enumerate(zip(nums, xyzs))) + RULE)
+
+
+def _gaussian_step_str(step, nums, xyzs):
+    return (
+        gaussian_orientation_string('Input', nums, xyzs) +
+        gaussian_orientation_string('Standard', nums, step_xyzs(step, xyzs)) +
+        f' SCF Done:  E(RB3LYP) =  {step_energy(step):.10f}     A.U. '
+        'after   12 cycles\n'
+        '         Item               Value     Threshold  Converged?\n'
+        f' Maximum Force            {step_force(step):.6f}     0.000450     NO\n'
+        f' RMS     Force            {step_force(step)/2:.6f}     0.000300     '
+        'NO\n'
+        f' Maximum Displacement     {step_disp(step):.6f}     0.001800     NO\n'
+        f' RMS     Displacement     {step_disp(step)/2:.6f}     0.001200     '
+        'NO\n')
+
+
+STEP_STR_DCT = {
+    'gaussian16': _gaussian_step_str,
+    'gaussian09': _gaussian_step_str,
+}
+
+
+def opt_output_string(prog, nsteps, nums=NUMS, xyzs=XYZS):
+    """ Build the output of an optimization with the given number of steps,
+        starting from the given geometry (atomic numbers, and coordinates in
+        Angstrom); each step moves the atoms along x by 0.001 Angstrom.
+
+        :param prog: electronic structure program
+        :type prog: str
+        :param nsteps: number of optimization steps
+        :type nsteps: int
+        :param nums: atomic numbers
+        :type nums: tuple(int)
+        :param xyzs: coordinates of the first step, in Angstrom
+        :type xyzs: tuple(tuple(float))
+        :rtype: str
+    """
+    step_str_ = STEP_STR_DCT[prog]
+    return ''.join(step_str_(step, nums, xyzs) for step in range(nsteps))
+
+
+# Gaussian IRC
+def _irc_cur_geo_str(xyzs):
+    return (
+        '                          CURRENT STRUCTURE\n' + RULE +
+        ' Cartesian Coordinates (Ang):\n' + RULE +
+        '     I     Z        X           Y           Z\n' + RULE + ''.join(
+            f' {idx+1:5d} {num:5d} {x:11.6f} {y:11.6f} {z:11.6f}\n'
+            for idx, (num, (x, y, z)) in enumerate(zip(NUMS, xyzs))) + RULE)
+
+
+def _irc_step_str(xyzs, ene):
+    return (
+        gaussian_orientation_string('Input', NUMS, xyzs) +
+        f' SCF Done:  E(RB3LYP) =  {ene:.10f}     A.U. after   10 cycles\n' +
+        RULE +
+        ' Center     Atomic                   Forces (Hartrees/Bohr)\n'
+        ' Number     Number              X              Y              Z\n'
+        + RULE + ''.join(
+            f' {idx+1:6d} {num:8d} {x/10:16.9f} {y/10:14.9f} {z/10:14.9f}\n'
+            for idx, (num, (x, y, z)) in enumerate(zip(NUMS, xyzs))) + RULE)
+
+
+def irc_output_string(npts, nsteps=2):
+    """ Build the output of a Gaussian IRC, going npts points in either
+        direction with nsteps optimization steps each.
+
+        :param npts: number of points in each direction
+        :type npts: int
+        :param nsteps: number of optimization steps of each point
+        :type nsteps: int
+        :rtype: str
+    """
+
+    def _xyzs(pt_idx, step):
+        return tuple((x + 0.01 * pt_idx + 0.001 * step, y, z)
+                     for x, y, z in XYZS)
+
+    out_str = _irc_step_str(XYZS, -100.0)
+    for path, sign in ((1, 1), (2, -1)):
+        for pt_num in range(1, npts + 1):
+            if pt_num == 1:
+                direction = 'FORWARD' if path == 1 else 'REVERSE'
+                out_str += (
+                    f' Point Number  1 in {direction} path direction.\n')
+            for step in range(nsteps):
+                out_str += _irc_step_str(
+                    _xyzs(sign * pt_num, step), -100.0 - 0.001 * pt_num)
+            out_str += (
+                _irc_cur_geo_str(_xyzs(sign * pt_num, nsteps - 1)) +
+                f' Point Number: {pt_num:3d}          Path Number: {path:3d}\n'
+                '   CHANGE IN THE REACTION COORDINATE =    0.10000\n'
+                '   NET REACTION COORDINATE UP TO THIS POINT = '
+                f'{0.1 * pt_num:10.5f}\n'
+                f'  # OF POINTS ALONG THE PATH = {pt_num:3d}\n'
+                f'  # OF STEPS = {nsteps:3d}\n')
+
+    rows = sorted(
+        (round(sign * 0.1 * pt_num, 5), -0.001 * pt_num)
+        for sign in (1, -1) for pt_num in range(1, npts + 1)) + [(0.0, 0.0)]
+    rows.sort()
+    out_str += (
+        ' Energies reported relative to the TS energy of  -100.000000\n' +
+        RULE + ' Summary of reaction path following\n' + RULE +
+        '                         Energy    RxCoord\n' + ''.join(
+            f' {idx+1:5d} {ene:20.5f} {crd:9.5f}\n'
+            for idx, (crd, ene) in enumerate(rows)) + RULE +
+        f' Total number of points: {len(rows):5d}\n')
+
+    return out_str
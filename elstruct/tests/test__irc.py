@@ -0,0 +1,99 @@
+""" test elstruct.reader.irc_trajectory
+"""
+
+import os
+import numpy
+import elstruct.reader
+
+from ioformat import pathtools
+from elstruct.tests._outputs import SYMBS
+from elstruct.tests._outputs import XYZS
+from elstruct.tests._outputs import irc_output_string
+
+ANG2BOHR = 1.8897261246257702
+PATH = os.path.dirname(os.path.realpath(__file__))
+DAT_PATH = os.path.join(PATH, 'data')
+
+
+def test__irc_trajectory():
+    """ test elstruct.reader.irc_trajectory
+    """
+
+    npts = 4
+    out_str = irc_output_string(npts)
+
+    for prog in elstruct.reader.irc_trajectory_programs():
+        traj = elstruct.reader.irc_trajectory(prog, out_str)
+        assert traj.symbs == SYMBS
+        assert traj.coords.shape == (2 * npts + 1, 3, 3)
+        assert numpy.allclose(traj.coords[0] / 1.8897261246257702, XYZS)
+        assert numpy.allclose(
+            traj.coords[[1, npts+1], 0, 0] / 1.8897261246257702,
+            [0.011, -0.009])
+        assert numpy.allclose(
+            traj.energies, [-100.0] + [-100.0 - 0.001 * idx
+                                       for idx in range(1, npts + 1)] * 2)
+        assert numpy.allclose(
+            traj.rxn_coords,
+            [0.0] + [0.1 * idx for idx in range(1, npts + 1)] +
+            [-0.1 * idx for idx in range(1, npts + 1)])
+        assert traj.grads.shape == traj.coords.shape
+        assert numpy.allclose(traj.grads[0], -numpy.array(XYZS) / 10)
+        assert traj.hessians is None
+
+        # The geometries view, as read by irc_points
+        geos, _, _ = elstruct.reader.irc_points(prog, out_str)
+        assert len(geos) == 2 * npts + 1
+        assert tuple(geos) == elstruct.reader.trajectory_geometries(traj)
+
+        coords, enes = elstruct.reader.irc_path(prog, out_str)
+        assert len(coords) == len(enes) == 2 * npts + 1
+        assert enes[npts] == -100.0
+
+
+def test__irc_trajectory_gaussian_output():
+    """ test elstruct.reader.irc_trajectory on an excerpt laid out as a
+        Gaussian 16 IRC output, with the lines printed between the tables
+    """
+
+    out_str = pathtools.read_file(DAT_PATH, 'gaussian16_irc.out')
+    traj = elstruct.reader.irc_trajectory('gaussian16', out_str)
+    assert traj.symbs == ('O', 'N', 'H', 'O')
+
+    # The saddle point, the forward path, then the reverse path, each point
+    # at the geometry of its last step
+    assert numpy.allclose(
+        traj.coords[0] / ANG2BOHR,
+        [[0.000000, -0.000000, 0.000000],
+         [0.000000, -0.000000, 1.392706],
+         [0.944866, 0.000000, -0.252162],
+         [1.085792, -0.000514, 1.865018]])
+    assert numpy.allclose(
+        traj.coords[:, 2, 0] / ANG2BOHR,
+        [0.944866, 0.965866, 0.987866, 0.925866])
+    assert numpy.allclose(
+        numpy.delete(traj.coords, 2, axis=1),
+        numpy.delete(traj.coords[[0]], 2, axis=1))
+    assert numpy.allclose(
+        traj.energies,
+        [-205.729418172, -205.730141337, -205.731923554, -205.730004816])
+    assert numpy.allclose(traj.rxn_coords, [0.0, 0.10001, 0.20002, -0.09999])
+
+    # The forces of the last step of each point
+    assert traj.grads.shape == traj.coords.shape
+    assert numpy.allclose(
+        traj.grads[:, 0], [[-0.004011226, -1e-9, 0.002005613],
+                           [-0.002005613, -1e-9, 0.0010028065],
+                           [-0.002005613, -1e-9, 0.0010028065],
+                           [0.002005613, -1e-9, -0.0010028065]])
+    assert traj.hessians is None
+
+    coords, enes = elstruct.reader.irc_path('gaussian16', out_str)
+    assert sorted(coords) == [-0.09999, 0.0, 0.10001, 0.20002]
+    assert sorted(enes) == [-205.731928, -205.730138, -205.730008,
+                            -205.729418]
+
+
+if __name__ == '__main__':
+    test__irc_trajectory()
+    test__irc_trajectory_gaussian_output()
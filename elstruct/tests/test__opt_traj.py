@@ -0,0 +1,85 @@
+""" test elstruct.reader.opt_trajectory
+"""
+
+import os
+import numpy
+import elstruct.reader
+
+from ioformat import pathtools
+from elstruct.tests._outputs import SYMBS
+from elstruct.tests._outputs import step_xyzs as _xyzs
+from elstruct.tests._outputs import step_energy as _ene
+from elstruct.tests._outputs import step_force as _force
+from elstruct.tests._outputs import step_disp as _disp
+from elstruct.tests._outputs import opt_output_string
+
+ANG2BOHR = 1.8897261246257702
+PATH = os.path.dirname(os.path.realpath(__file__))
+# A (trimmed) Gaussian frequency output, from the ProjRot tests
+GAUSSIAN_DAT_PATH = os.path.join(PATH, '..', '..', 'projrot_io', 'tests',
+                                 'data')
+
+
+def test__opt_trajectory():
+    """ test elstruct.reader.opt_trajectory
+    """
+
+    # Only the readers checked on an actual output are registered
+    progs = ('gaussian16', 'gaussian09')
+    assert set(elstruct.reader.opt_trajectory_programs()) == {
+        'gaussian16', 'gaussian09', 'gaussian03'}
+
+    nsteps = 4
+    steps = numpy.arange(nsteps)
+    for prog in progs:
+        traj = elstruct.reader.opt_trajectory(
+            prog, opt_output_string(prog, nsteps))
+        assert traj.symbs == SYMBS, prog
+        assert numpy.allclose(
+            traj.coords, [numpy.multiply(_xyzs(step), ANG2BOHR)
+                          for step in steps]), prog
+        assert numpy.allclose(traj.energies, _ene(steps)), prog
+        assert numpy.allclose(traj.max_forces, _force(steps),
+                              rtol=1e-2), prog
+        assert numpy.allclose(traj.max_disps, _disp(steps), rtol=1e-2), prog
+
+        assert elstruct.reader.opt_trajectory(prog, '') is None
+
+    # A step that did not print its forces
+    out_str = opt_output_string('gaussian16', 3)
+    out_str = out_str.replace(f'Maximum Force            {_force(1):.6f}', '')
+    traj = elstruct.reader.opt_trajectory('gaussian16', out_str)
+    assert numpy.isnan(traj.max_forces[1])
+    assert not numpy.isnan(traj.max_forces[[0, 2]]).any()
+
+    # A long optimization
+    traj = elstruct.reader.opt_trajectory(
+        'gaussian16', opt_output_string('gaussian16', 3000))
+    assert traj.coords.shape == (3000, 3, 3)
+    assert traj.energies.shape == (3000,)
+    assert not numpy.isnan(traj.coords).any()
+
+    geos = elstruct.reader.trajectory_geometries(traj)
+    assert len(geos) == 3000
+
+
+def test__opt_trajectory_gaussian_output():
+    """ test elstruct.reader.opt_trajectory on the orientation table of an
+        actual Gaussian output
+    """
+
+    out_str = pathtools.read_file(GAUSSIAN_DAT_PATH, 'disp1.out')
+    traj = elstruct.reader.opt_trajectory('gaussian16', out_str)
+    assert traj.symbs == ('O', 'N', 'H', 'O')
+    assert numpy.allclose(
+        traj.coords / ANG2BOHR,
+        [[[0.000000, -0.000000, 0.000000],
+          [0.000000, -0.000000, 1.392706],
+          [0.944866, 0.000000, -0.252162],
+          [1.085792, -0.000514, 1.865018]]])
+    assert numpy.isnan(traj.energies).all()
+
+
+if __name__ == '__main__':
+    test__opt_trajectory()
+    test__opt_trajectory_gaussian_output()
@@ -0,0 +1,58 @@
+""" test elstruct.option
+"""
+
+import pytest
+import elstruct.option
+
+
+MAXITER_ = elstruct.option.create('scf_maxiter', ['num'])
+NOSYMM_ = elstruct.option.create('no_symmetry')
+
+
+def test__parse():
+    """ test elstruct.option.parse
+    """
+
+    maxiter = elstruct.option.specify(MAXITER_, 50)
+    assert maxiter == '<scf_maxiter>[50]'
+
+    assert elstruct.option.parse(MAXITER_) == ('scf_maxiter', ('num',), None)
+    assert elstruct.option.parse(maxiter) == ('scf_maxiter', (), (50,))
+    assert elstruct.option.parse(NOSYMM_) == ('no_symmetry', (), ())
+
+    # The parsed option is only built once for each specifier
+    assert elstruct.option.parse(maxiter) is elstruct.option.parse(maxiter)
+
+    # The functions reading the specifiers agree with the parsed option
+    assert elstruct.option.name(maxiter) == 'scf_maxiter'
+    assert elstruct.option.values(maxiter) == (50,)
+    assert elstruct.option.keys(MAXITER_) == ('num',)
+    assert elstruct.option.is_template(MAXITER_)
+    assert elstruct.option.is_valueless(NOSYMM_)
+    assert not elstruct.option.is_valid('scf_maxiter')
+
+
+def test__values():
+    """ test that the cached values of elstruct.option cannot be changed
+    """
+
+    osp = '<occ>[[1, [2, 3]], 4]'
+    vals = elstruct.option.values(osp)
+    assert vals == ((1, (2, 3)), 4)
+    with pytest.raises(AttributeError):
+        vals[0][1].append(5)
+    assert elstruct.option.values(osp) == ((1, (2, 3)), 4)
+    assert elstruct.option.parse(osp).values == vals
+
+    # (YAML reads a mapping from a key-value pair without braces)
+    osp = '<x>[a: [1, 2]]'
+    vals = elstruct.option.values(osp)
+    assert vals == ({'a': (1, 2)},)
+    with pytest.raises(TypeError):
+        vals[0]['b'] = 3
+    assert elstruct.option.values(osp) == ({'a': (1, 2)},)
+
+
+if __name__ == '__main__':
+    test__parse()
+    test__values()
@@ -1,7 +1,9 @@
 """ test elstruct.reader
 """
 
+import pytest
 from elstruct import reader
+from elstruct.reader import _qchem5
 
 
 def test__programs():
@@ -63,3 +65,13 @@ def test__vpt2_programs():
     """
     assert set(reader.vpt2_programs()) >= {
         'gaussian09', 'gaussian03', 'gaussian16'}
+
+
+def test__qchem5_unimplemented():
+    """ test that the unimplemented QChem readers raise a clear error
+    """
+
+    for name in ('normal_coordinates', 'inp_zmatrix'):
+        assert name in _qchem5.__all__
+        with pytest.raises(NotImplementedError):
+            getattr(_qchem5, name)('')
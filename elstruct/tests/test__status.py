@@ -0,0 +1,76 @@
+""" test elstruct.reader.status_report
+"""
+
+import itertools
+import elstruct.reader
+from elstruct import par
+from elstruct.reader import program_modules as pm
+
+
+# Lines with the error and success messages of the different programs
+MESSAGE_LINES = (
+    ' Convergence criterion not met.\n SCF Done:  E(RHF) =  -1.0\n',
+    ' Rotation gradient small -- convergence achieved.\n',
+    ' Initial convergence to 1.0D-05 achieved.  Increase integral accuracy.\n'
+    ' SCF Done:  E(RHF) =  -1.0\n',
+    ' Optimization stopped.\n    -- Number of steps exceeded,  NStep= 20\n',
+    ' Optimization completed.\n    -- Stationary point found.\n',
+    ' Maximum number of corrector steps exceeded\n',
+    ' Reaction path calculation complete.\n',
+    ' SCF has converged.\n',
+    ' SCF failed to converge\n',
+    ' CC did not converge !!!\n',
+    ' timing for (T)\n',
+    ' *Maximum number of optimization steps exceeded.\n',
+    ' No convergence\n',
+    ' No convergence in max. number of iterations\n',
+    ' The problem occurs in Multi\n',
+    ' ERROR: BASIS LINEARLY DEPENDENT OR WRONG S\n',
+    ' THE SCF ITERATION HAS NOT CONVERGED,\n'
+    ' IN MAXIMAL NUMBER OF STEPS SET BY USER!\n',
+    ' This wavefunction IS NOT CONVERGED!\n',
+    ' --- The Coupled-Cluster iterations have NOT converged ---\n',
+    ' Energy and wave function converged\n',
+    ' **** Optimization is complete!\n',
+    ' PsiException: Could not converge SCF iterations\n',
+    ' Unrecognized point group bits: 3\n',
+)
+
+
+def test__status_report():
+    """ test elstruct.reader.status_report
+    """
+
+    output_strs = MESSAGE_LINES + (
+        ''.join(MESSAGE_LINES), ''.join(MESSAGE_LINES).lower(), '') + tuple(
+            ''.join(lines) for lines in itertools.combinations(
+                MESSAGE_LINES[::3], 2))
+
+    # (the MRCC reader module fails its own energy reader check on import)
+    progs = [prog for prog in
+             pm.program_modules_with_function(pm.Job.STATUS_REPORT)
+             if prog != par.Program.MRCC2018]
+    for prog in progs:
+        errors = elstruct.reader.error_list(prog)
+        successes = (elstruct.reader.success_list(prog)
+                     if pm.has_function(prog, pm.Job.SUCCESS_MSG) else ())
+        for output_str in output_strs:
+            report = elstruct.reader.status_report(prog, output_str)
+            assert set(errors) <= set(report)
+            for error in errors:
+                assert report[error] == elstruct.reader.has_error_message(
+                    prog, error, output_str), (prog, error, output_str)
+            for success in successes:
+                assert report[success] == elstruct.reader.has_success_message(
+                    prog, success, output_str), (prog, success, output_str)
+
+    report = elstruct.reader.status_report('gaussian16', output_strs[0])
+    assert report == {
+        'scf_noconv': True, 'mcscf_noconv': False, 'cc_noconv': False,
+        'opt_noconv': False, 'irc_noconv': False,
+        'linear_dependent_basis': False,
+        'scf_conv': False, 'opt_conv': False, 'irc_conv': False}
+
+
+if __name__ == '__main__':
+    test__status_report()
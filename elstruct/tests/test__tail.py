@@ -0,0 +1,130 @@
+""" test elstruct.reader.OutputTail
+"""
+
+import os
+import tempfile
+import elstruct.reader
+from elstruct.reader import OutputTail
+
+
+TMP_DIR = tempfile.mkdtemp()
+
+OUTPUT_LINES = (
+    ' Step number   1 out of a maximum of  100\n',
+    ' SCF Done:  E(RB3LYP) =  -149.442473330     A.U. after    9 cycles\n',
+    ' Step number   2 out of a maximum of  100\n',
+    ' Convergence criterion not met.\n',
+    ' SCF Done:  E(RB3LYP) =  -149.500000000     A.U. after  129 cycles\n',
+    ' Rotation gradient small -- convergence achieved.\n',
+    ' Normal termination of Gaussian 16 at Mon Jan  1 00:00:00 2024.\n',
+)
+MOLPRO_OUTPUT_LINES = (
+    ' ITERATION   1  ENERGY=-149.44247333\n',
+    ' No convergence in max. number of iterations\n',
+    ' Optimization completed.\n',
+    '    -- Stationary point found.\n',
+    ' Molpro calculation terminated\n',
+)
+ORCA_OUTPUT_LINES = (
+    '        * GEOMETRY OPTIMIZATION CYCLE   1*\n',
+    '        * GEOMETRY OPTIMIZATION CYCLE   2*\n',
+    ' This wavefunction IS NOT CONVERGED!\n',
+    '                             ****ORCA TERMINATED NORMALLY****\n',
+)
+
+
+def test__output_tail():
+    """ test elstruct.reader.OutputTail
+    """
+
+    path = os.path.join(TMP_DIR, 'run.out')
+    tail = OutputTail('gaussian16', path, method='b3lyp')
+
+    # The unfinished last line is left for the next update
+    with open(path, 'w', encoding='utf-8') as file_obj:
+        file_obj.write(''.join(OUTPUT_LINES[:3]) + ' Convergence crit')
+    assert tail.update() == ()
+    assert tail.offset == len(''.join(OUTPUT_LINES[:3]))
+    assert tail.energy == -149.44247333
+    assert tail.opt_step == 2
+    assert not any(tail.errors.values())
+
+    # The error message (split across two updates) is reported once
+    with open(path, 'a', encoding='utf-8') as file_obj:
+        file_obj.write('erion not met.\n' + ''.join(OUTPUT_LINES[4:]))
+    assert tail.update() == ('scf_noconv',)
+    assert tail.energy == -149.5
+    assert tail.successes['scf_conv'] and not tail.successes['opt_conv']
+    assert tail.normal_exit
+    assert tail.converged('scf_noconv', 'scf_conv')
+    assert not tail.converged('scf_noconv', 'opt_conv')
+
+    assert tail.update() == ()
+    assert tail.errors['scf_noconv']
+
+    # An output rewritten by a restarted job is read from its start
+    with open(path, 'w', encoding='utf-8') as file_obj:
+        file_obj.write(''.join(OUTPUT_LINES[:2]))
+    assert tail.update() == ()
+    assert tail.offset == len(''.join(OUTPUT_LINES[:2]))
+    assert not any(tail.errors.values())
+    assert not tail.normal_exit
+    assert tail.opt_step == 1
+
+
+def test__output_tail_missing():
+    """ test elstruct.reader.OutputTail before the output is written
+    """
+
+    path = os.path.join(TMP_DIR, 'missing.out')
+    tail = OutputTail('gaussian16', path)
+    assert tail.update() == ()
+    assert tail.offset == 0
+    assert tail.opt_step is None
+
+
+def test__output_tail_programs():
+    """ test that elstruct.reader.OutputTail and the readers of the full
+        output agree, for Gaussian, Molpro and ORCA
+    """
+
+    for prog, lines, opt_step in (
+            ('gaussian16', OUTPUT_LINES, 2),
+            ('molpro2015', MOLPRO_OUTPUT_LINES, None),
+            ('orca4', ORCA_OUTPUT_LINES, 2)):
+        path = os.path.join(TMP_DIR, f'{prog}.out')
+        tail = OutputTail(prog, path)
+        with open(path, 'w', encoding='utf-8') as file_obj:
+            for line in lines:
+                file_obj.write(line)
+                file_obj.flush()
+                tail.update()
+
+        output_str = ''.join(lines)
+        report = elstruct.reader.status_report(prog, output_str)
+        assert tail.errors == {
+            err: report[err]
+            for err in elstruct.reader.error_list(prog)}, prog
+        assert tail.normal_exit, prog
+        assert tail.opt_step == opt_step, prog
+
+        successes = (elstruct.reader.success_list(prog)
+                     if prog != 'orca4' else (None,))
+        for error in ('scf_noconv', 'opt_noconv'):
+            for success in successes:
+                assert tail.converged(error, success) == (
+                    elstruct.reader.check_convergence_messages(
+                        prog, error, success, output_str)), (prog, error)
+
+    # Molpro reports its success messages
+    assert tail.successes == {} and not tail.converged('scf_noconv')
+    tail = OutputTail('molpro2015', os.path.join(TMP_DIR, 'molpro2015.out'))
+    tail.update()
+    assert tail.successes['opt_conv'] and not tail.successes['scf_conv']
+    assert tail.converged('opt_noconv', 'opt_conv')
+
+
+if __name__ == '__main__':
+    test__output_tail()
+    test__output_tail_missing()
+    test__output_tail_programs()
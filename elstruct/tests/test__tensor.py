@@ -0,0 +1,77 @@
+""" test the sparse symmetric tensors of elstruct.reader
+"""
+
+import itertools
+import numpy
+import elstruct.reader
+from elstruct.reader._gaussian16 import _vpt2
+
+
+CUBIC_FC_STR = """
+ :     CUBIC FORCE CONSTANTS IN NORMAL MODES       :
+
+ FI =  Reduced values [cm-1]  (default input)
+ k  =  Cubic Force Const.[AttoJ*amu(-3/2)*Ang(-3)]
+ K  =  Cubic Force Const.[Hartree*amu(-3/2)*Bohr(-3)]
+
+     I     J     K         FI            k            K
+      1     1     1       -65.18380     -0.47230     -0.01608
+      2     1     1        12.50011      0.09058      0.00308
+      2     2     1        -3.75021     -0.02717     -0.00092
+      3     2     1         1.02210      0.00741      0.00025
+
+ :     QUARTIC FORCE CONSTANTS IN NORMAL MODES     :
+"""
+
+
+def test__symmetric_tensor():
+    """ test elstruct.reader.symmetric_tensor
+    """
+
+    rng = numpy.random.default_rng(7)
+    for order, dim in ((2, 6), (3, 5), (4, 4)):
+        idxs = rng.integers(0, dim, size=(30, order))
+        vals = rng.normal(size=30)
+
+        # The full array, with the last value of each set of indices
+        ref_arr = numpy.zeros((dim,) * order)
+        for idx, val in zip(idxs, vals):
+            for perm in itertools.permutations(idx):
+                ref_arr[perm] = val
+
+        tensor = elstruct.reader.symmetric_tensor(idxs, vals, dim=dim)
+        assert elstruct.reader.tensor_order(tensor) == order
+        assert (numpy.diff(tensor.idxs, axis=1) >= 0).all()
+        assert len(tensor.vals) == len({tuple(sorted(idx)) for idx in idxs})
+        assert numpy.array_equal(
+            elstruct.reader.tensor_full_array(tensor), ref_arr)
+
+        vec = rng.normal(size=dim)
+        for nfree in range(order + 1):
+            ref_con = ref_arr
+            for _ in range(order - nfree):
+                ref_con = ref_con @ vec
+            assert numpy.allclose(
+                elstruct.reader.tensor_contraction(tensor, vec, nfree=nfree),
+                ref_con)
+
+
+def test__cubic_force_constants():
+    """ test the reading of the cubic force constants into a sparse tensor
+    """
+
+    tensor = _vpt2.cubic_force_constants(CUBIC_FC_STR)
+    assert tensor.dim == 3
+    assert tensor.idxs.tolist() == [[0, 0, 0], [0, 0, 1], [0, 1, 1],
+                                    [0, 1, 2]]
+    assert numpy.allclose(tensor.vals, [-0.01608, 0.00308, -0.00092, 0.00025])
+
+    fc_arr = elstruct.reader.tensor_full_array(tensor)
+    assert fc_arr[1, 0, 0] == fc_arr[0, 1, 0] == fc_arr[0, 0, 1] == 0.00308
+    assert fc_arr[2, 1, 0] == fc_arr[0, 2, 1] == 0.00025
+    assert fc_arr[2, 2, 2] == 0.
+
+
+if __name__ == '__main__':
+    test__symmetric_tensor()
+    test__cubic_force_constants()
@@ -0,0 +1,121 @@
+""" test the normal-mode analysis of elstruct.util
+"""
+
+import numpy
+import qcelemental as qcel
+from qcelemental import constants as qcc
+import automol
+import elstruct.util
+
+
+SYMBS = ('O', 'H', 'H')
+XYZS = ((0., 0., -0.1243), (0., 1.4320, 0.9865), (0., -1.4320, 0.9865))
+
+
+def _geometries_and_hessians(ngeos):
+    """ distorted water geometries, with random symmetric Hessians
+    """
+    rng = numpy.random.default_rng(11)
+    geos = [automol.geom.from_data(
+        SYMBS, numpy.add(XYZS, 0.05 * rng.normal(size=(3, 3))).tolist())
+            for _ in range(ngeos)]
+    hesss = rng.normal(size=(ngeos, 9, 9))
+    hesss = 0.05 * (hesss + numpy.swapaxes(hesss, 1, 2))
+    return geos, hesss
+
+
+def _diatomic_geometry_and_hessian(symbs, dist, axis, force_const):
+    """ a diatomic, with its center of mass at the origin and its bond along
+        an axis, with the Hessian of a harmonic bond of a force constant
+    """
+    axis = numpy.divide(axis, numpy.linalg.norm(axis))
+    mass1, mass2 = map(qcel.periodictable.to_mass, symbs)
+    geo = automol.geom.from_data(
+        symbs, [(-dist * mass2 / (mass1 + mass2)) * axis,
+                (dist * mass1 / (mass1 + mass2)) * axis])
+    bond_hess = force_const * numpy.outer(axis, axis)
+    hess = numpy.block([[bond_hess, -bond_hess], [-bond_hess, bond_hess]])
+    return geo, hess
+
+
+def test__normal_mode_analyses():
+    """ test elstruct.util.normal_mode_analyses against the analytic
+        normal modes of diatomics
+    """
+
+    # H2, with a bond force constant of 0.3696 Eh/a0^2, has a harmonic
+    # frequency of 4402.4 cm-1 and no other modes
+    geo, hess = _diatomic_geometry_and_hessian(
+        ('H', 'H'), 1.4, (0., 0., 1.), 0.3696)
+    for project in (True, False):
+        norm_cooss, freqss = elstruct.util.normal_mode_analyses(
+            [geo], [hess], project=project)
+        assert numpy.allclose(freqss[0, :5], 0., atol=1e-3)
+        assert numpy.isclose(freqss[0, 5], 4402.4, atol=0.1)
+        assert numpy.allclose(
+            numpy.abs(norm_cooss[0, :, 5]),
+            numpy.abs([0., 0., 1., 0., 0., -1.]) / numpy.sqrt(2.))
+    assert numpy.allclose(
+        elstruct.util.harmonic_frequencies(geo, hess), freqss[0])
+
+    # CO at many bond lengths and orientations, with a force constant for
+    # each: the stretch is at sqrt(k/mu) along the bond
+    rng = numpy.random.default_rng(11)
+    ngeos = 20
+    dists = rng.uniform(2.0, 2.3, size=ngeos)
+    axes = rng.normal(size=(ngeos, 3))
+    force_consts = rng.uniform(0.8, 1.2, size=ngeos)
+    geos, hesss = zip(*map(_diatomic_geometry_and_hessian, [('C', 'O')] *
+                           ngeos, dists, axes, force_consts))
+
+    conv = qcc.conversion_factor('hartree', 'wavenumber')
+    amu = qcc.conversion_factor('amu', 'electron_mass')
+    masses = numpy.array([qcel.periodictable.to_mass(symb)
+                          for symb in ('C', 'O')]) * amu
+    red_mass = numpy.prod(masses) / numpy.sum(masses)
+    for project in (True, False):
+        norm_cooss, freqss = elstruct.util.normal_mode_analyses(
+            geos, numpy.array(hesss), project=project)
+        assert norm_cooss.shape == (ngeos, 6, 6)
+        assert freqss.shape == (ngeos, 6)
+        assert numpy.allclose(
+            freqss[:, 5], numpy.sqrt(force_consts / red_mass) * conv)
+        # (as mass-weighted displacements)
+        for axis, norm_coos in zip(axes, norm_cooss):
+            axis = axis / numpy.linalg.norm(axis)
+            mw_disp = numpy.hstack([numpy.sqrt(masses[1]) * axis,
+                                    -numpy.sqrt(masses[0]) * axis])
+            assert numpy.isclose(
+                abs(numpy.dot(norm_coos[:, 5], mw_disp)),
+                numpy.linalg.norm(mw_disp))
+
+    # (the rotations about axes that are not along the bond are not
+    # orthogonal, so the other modes are only zero without projection)
+    _, freqss = elstruct.util.normal_mode_analyses(
+        geos, numpy.array(hesss), project=False)
+    assert numpy.allclose(freqss[:, :5], 0., atol=1e-3)
+
+
+def test__mass_weighted_hessians():
+    """ test elstruct.util.mass_weighted_hessians against the projection
+        built one geometry at a time
+    """
+
+    geos, hesss = _geometries_and_hessians(3)
+    mw_hesss = elstruct.util.mass_weighted_hessians(geos, hesss)
+    for geo, hess, mw_hess in zip(geos, hesss, mw_hesss):
+        mw_vec = elstruct.util.mass_weighting_vector(geo)
+        tr_norm_coos = numpy.hstack([
+            elstruct.util.translational_normal_coordinates(
+                geo, mass_weighted=True),
+            elstruct.util.rotational_normal_coordinates(
+                geo, mass_weighted=True)])
+        proj = numpy.eye(9) - numpy.dot(tr_norm_coos, tr_norm_coos.T)
+        ref_mw_hess = proj.T @ (hess / numpy.outer(mw_vec, mw_vec)) @ proj
+        assert numpy.allclose(mw_hess, ref_mw_hess)
+        assert numpy.allclose(mw_hess, mw_hess.T)
+
+
+if __name__ == '__main__':
+    test__normal_mode_analyses()
+    test__mass_weighted_hessians()
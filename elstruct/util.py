@@ -51,9 +51,9 @@ def normal_coordinates(geo, hess, project=True):
         :rtype: tuple(tuple(float))
     """
 
-    norm_coos, _, _ = _frequency_analysis(geo, hess, project=project)
+    norm_coos, _ = normal_mode_analyses([geo], [hess], project=project)
 
-    return norm_coos
+    return norm_coos[0]
 
 
 def harmonic_frequencies(geo, hess, project=True):
@@ -69,39 +69,39 @@ def harmonic_frequencies(geo, hess, project=True):
         :rtype: tuple(tuple(float))
     """
 
-    _, freqs_re, freqs_im = _frequency_analysis(geo, hess, project=project)
-    freqs = numpy.subtract(freqs_re, freqs_im)
-    freqs = tuple(freqs)
+    _, freqs = normal_mode_analyses([geo], [hess], project=project)
+    freqs = tuple(freqs[0])
 
     return freqs
 
 
-def _frequency_analysis(geo, hess, project=True):
-    """ Froms the mass-weighted Hessian and diagonalizes it to obtain
-        the normal coordinates and harmonic vibrational frequencies.
+def normal_mode_analyses(geos, hesss, project=True):
+    """ Form the mass-weighted Hessians of many geometries of one molecule
+        and diagonalize them all at once, to obtain the normal coordinates
+        and harmonic vibrational frequencies (in cm-1; imaginary entries
+        returned as negative) at each geometry.
 
-        :param geo: cartesian or z-matrix geometry
-        :type geo: tuple
-        :param hess: Hessian correpsonding to the geometry
-        :type hess: tuple(tuple(float))
-        :param project: project out rotations and translations of Hessian
+        :param geos: cartesian geometries of the molecule
+        :type geos: tuple(automol geom data structure)
+        :param hesss: Hessian corresponding to each geometry, (n, 3N, 3N)
+        :type hesss: numpy.ndarray
+        :param project: project out rotations and translations of Hessians
         :type project: bool
-        :rtype: tuple(tuple(float))
+        :returns: the normal coordinates, (n, 3N, 3N), and the frequencies,
+            (n, 3N), at each geometry
+        :rtype: (numpy.ndarray, numpy.ndarray)
     """
 
-    mw_hess = mass_weighted_hessian(geo, hess, project=project)
-    fcs, mw_norm_coos = numpy.linalg.eigh(mw_hess)
+    mw_hesss = mass_weighted_hessians(geos, hesss, project=project)
+    fcs, mw_norm_coos = numpy.linalg.eigh(mw_hesss)
 
     conv = qcc.conversion_factor("hartree", "wavenumber")
-    freqs = numpy.sqrt(numpy.complex_(fcs)) * conv
-    freqs_im = numpy.imag(freqs)
-    freqs_re = numpy.real(freqs)
+    freqs = numpy.sign(fcs) * numpy.sqrt(numpy.abs(fcs)) * conv
 
-    mw_vec = mass_weighting_vector(geo)
-    norm_coos = mw_norm_coos
+    mw_vec = mass_weighting_vector(geos[0])
     norm_coos = _normalize_columns(mw_vec * mw_norm_coos)
 
-    return norm_coos, freqs_re, freqs_im
+    return norm_coos, freqs
 
 
 def mass_weighted_hessian(geo, hess, project=True):
@@ -117,25 +117,47 @@ def mass_weighted_hessian(geo, hess, project=True):
         :rtype: tuple(tuple(float))
     """
 
-    mw_vec = mass_weighting_vector(geo)
-    mw_mat = numpy.outer((1. / mw_vec), (1. / mw_vec))
-    mw_hess = numpy.multiply(hess, mw_mat)
-    if project:
-        dim = len(mw_vec)
-        trans_norm_coos = translational_normal_coordinates(geo,
-                                                           mass_weighted=True)
-        rot_norm_coos = rotational_normal_coordinates(geo,
-                                                      mass_weighted=True)
-        tr_norm_coos = numpy.hstack([trans_norm_coos, rot_norm_coos])
-        proj = numpy.eye(dim) - numpy.dot(tr_norm_coos, tr_norm_coos.T)
-        # proj = scipy.linalg.orth(proj, rcond=0.5)
-        mw_hess = numpy.dot(numpy.dot(proj.T, mw_hess), proj)
-
+    mw_hess = mass_weighted_hessians([geo], [hess], project=project)[0]
     mw_hess = tuple(map(tuple, mw_hess))
 
     return mw_hess
 
 
+def mass_weighted_hessians(geos, hesss, project=True):
+    """ Form the mass-weighted Hessians of many geometries of one molecule
+        and, if requested, project out the rotations and translations,
+        building the projectors for all of the geometries at once.
+
+        :param geos: cartesian geometries of the molecule
+        :type geos: tuple(automol geom data structure)
+        :param hesss: Hessian corresponding to each geometry, (n, 3N, 3N)
+        :type hesss: numpy.ndarray
+        :param project: project out rotations and translations of Hessians
+        :type project: bool
+        :rtype: numpy.ndarray
+    """
+
+    mw_vec = mass_weighting_vector(geos[0])
+    mw_mat = numpy.outer((1. / mw_vec), (1. / mw_vec))
+    mw_hesss = numpy.multiply(numpy.asarray(hesss, dtype=float), mw_mat)
+    if project:
+        ngeos, dim = len(geos), len(mw_vec)
+        trans_norm_coos = numpy.broadcast_to(
+            translational_normal_coordinates(geos[0], mass_weighted=True),
+            (ngeos, dim, 3))
+        rot_norm_coos = _rotational_normal_coordinates(
+            numpy.array([automol.geom.coordinates(geo) for geo in geos]),
+            mw_vec)
+        tr_norm_coos = numpy.concatenate(
+            [trans_norm_coos, rot_norm_coos], axis=-1)
+        projs = numpy.eye(dim) - numpy.einsum(
+            'nik,njk->nij', tr_norm_coos, tr_norm_coos)
+        mw_hesss = numpy.einsum(
+            'nji,njk,nkl->nil', projs, mw_hesss, projs, optimize=True)
+
+    return mw_hesss
+
+
 def translational_normal_coordinates(geo, axes=None, mass_weighted=False):
     """ translational normal coordinates
 
@@ -190,6 +212,28 @@ def rotational_normal_coordinates(geo, axes=None, mass_weighted=False):
     return rot_norm_coos
 
 
+def _rotational_normal_coordinates(xyzss, mw_vec):
+    """ mass-weighted rotational normal coordinates about the axes, for
+        many sets of coordinates of the same atoms at once
+
+        :param xyzss: coordinates of the atoms, (n, N, 3)
+        :type xyzss: numpy.ndarray
+        :param mw_vec: mass weights, (3N,)
+        :type mw_vec: numpy.ndarray
+        :rtype: numpy.ndarray
+    """
+    ngeos, natms, _ = xyzss.shape
+    rot_norm_coos = numpy.cross(xyzss[:, :, X, :], numpy.eye(3)[X, X, :, :])
+    rot_norm_coos = numpy.reshape(
+        numpy.swapaxes(rot_norm_coos, 2, 3), (ngeos, 3*natms, 3))
+    rot_norm_coos = mw_vec[:, X] * rot_norm_coos
+
+    # for linear molecules aligned to an axis, one of these can be zero
+    norms = numpy.linalg.norm(rot_norm_coos, axis=1, keepdims=True)
+    rot_norm_coos = numpy.where(norms > 1e-5, rot_norm_coos, 0.)
+    return rot_norm_coos
+
+
 def mass_weighting_vector(geo):
     """ Build a vector of mass weights (1/sqrt(m)) for each atom in a geometry.
     """
@@ -202,11 +246,11 @@ def mass_weighting_vector(geo):
 def _normalize_columns(mat):
     """normalize the columns of a matrix
 
-        :param mat: matrix
+        :param mat: matrix, or a stack of them
         :type mat: numpy.ndarray
         :rtype: numpy.ndarray
     """
-    norms = list(map(numpy.linalg.norm, numpy.transpose(mat)))
+    norms = numpy.linalg.norm(mat, axis=-2, keepdims=True)
     return numpy.divide(mat, norms)
 
 
@@ -1,11 +1,15 @@
 """ helpers for importing and managing program modules
 """
 
+import functools
 import importlib
 from elstruct import par
 from elstruct import pclass
 
 
+PROGRAMS = pclass.values(par.Program)
+
+
 # Functions to import and call the appropriate writer function
 def call_module_function(prog, function, *args, **kwargs):
     """ call the module implementation of a given function
@@ -16,23 +20,33 @@ def call_module_function(prog, function, *args, **kwargs):
         :type function_template: function
     """
 
-    def _rename_prog(prog):
-        """ Rename a program if number does not match module name """
-        if prog in ('molpro2021', 'molpro2021_mppx'):
-            prog = 'molpro2015'
-        elif prog in ('gaussian03'):
-            prog = 'gaussian09'
-        return prog
+    writer = module_function(prog, function)
+
+    return writer(function, *args, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def module_function(prog, function):
+    """ get the module implementation of a given function
+
+        The program is checked, its module imported, and the function
+        looked up only on the first call for each (prog, function) pair;
+        later calls return the cached function directly.
+
+        :param prog: the program
+        :type prog: str
+        :param function: name of the function
+        :type function: str
+        :rtype: function
+    """
 
     new_name = _rename_prog(prog)
-    assert new_name in pclass.values(par.Program)
+    assert new_name in PROGRAMS
     assert new_name in program_modules_with_function(function)
 
-    name = f'_{_rename_prog(prog)}'
-    module = importlib.import_module(f'elstruct.writer.{name:s}')
-    writer = getattr(module, 'write_input')
+    module = importlib.import_module(f'elstruct.writer._{new_name:s}')
 
-    return writer(function, *args, **kwargs)
+    return getattr(module, 'write_input')
 
 
 def program_modules_with_function(function):
@@ -42,13 +56,22 @@ def program_modules_with_function(function):
     """
 
     progs = []
-    for prog in pclass.values(par.Program):
+    for prog in PROGRAMS:
         if function in WRITER_MODULE_DCT[prog]:
             progs.append(prog)
 
     return progs
 
 
+def _rename_prog(prog):
+    """ Rename a program if number does not match module name """
+    if prog in ('molpro2021', 'molpro2021_mppx'):
+        prog = 'molpro2015'
+    elif prog in ('gaussian03'):
+        prog = 'gaussian09'
+    return prog
+
+
 # Information on what writers have been implemented
 class Job():
     """ Names of electronic structure jobs to ne written
@@ -2,20 +2,7 @@
     that are used by all of the interface modules
 """
 
-from ioformat._format import build_mako_str
-from ioformat._format import indent
-from ioformat._format import add_line
-from ioformat._format import change_line
-from ioformat._format import addchar
-from ioformat._format import headlined_sections
-from ioformat._format import remove_whitespace_from_string
-from ioformat._format import remove_trail_whitespace
-from ioformat._format import remove_comment_lines
-from ioformat._format import remove_empty_lines
-from ioformat._string import hash_string
-from ioformat import pathtools
-from ioformat import phycon
-from ioformat import ptt
+from ioformat._lazy import lazy_load
 
 
 __all__ = [
@@ -36,5 +23,25 @@ __all__ = [
     # libs
     'pathtools',
     'phycon',
-    'ptt'
+    'ptt',
+    # lazy loading
+    'lazy_load'
 ]
+
+
+# Submodules and functions are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    # format functions
+    'build_mako_str': 'ioformat._format',
+    'indent': 'ioformat._format',
+    'add_line': 'ioformat._format',
+    'change_line': 'ioformat._format',
+    'addchar': 'ioformat._format',
+    'headlined_sections': 'ioformat._format',
+    'remove_whitespace_from_string': 'ioformat._format',
+    'remove_trail_whitespace': 'ioformat._format',
+    'remove_comment_lines': 'ioformat._format',
+    'remove_empty_lines': 'ioformat._format',
+    # string
+    'hash_string': 'ioformat._string',
+})
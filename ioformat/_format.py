@@ -2,7 +2,6 @@
 """
 
 import os
-from mako.template import Template
 import more_itertools as mit
 import autoparse.pattern as app
 import autoparse.find as apf
@@ -24,6 +23,9 @@ def build_mako_str(template_file_name, template_src_path, template_keys,
         :rtype: str
     """
 
+    # Mako is only imported once a template is actually built
+    from mako.template import Template  # pylint: disable=import-outside-toplevel
+
     template_file_path = os.path.join(template_src_path, template_file_name)
     mako_str = Template(filename=template_file_path).render(**template_keys)
 
@@ -0,0 +1,58 @@
+""" Lazy loading of the submodules and functions of a package
+"""
+
+import sys
+import importlib
+
+
+def lazy_load(package_name, names, attr_module_dct=None):
+    """ Build the module-level `__getattr__` and `__dir__` functions that
+        let a package import its submodules and functions on first access,
+        rather than at package import, so that the heavy dependencies of
+        a submodule are only loaded if that submodule is used.
+
+        Used in a package `__init__.py` as
+
+            __getattr__, __dir__ = lazy_load(__name__, __all__, {...})
+
+        Any name not in the attribute dictionary is imported as a
+        submodule of the package.
+
+        :param package_name: name of the package, `__name__`
+        :type package_name: str
+        :param names: public names of the package, `__all__`
+        :type names: tuple(str)
+        :param attr_module_dct: modules holding the functions (and other
+            non-module attributes) to be exposed by the package
+        :type attr_module_dct: dict[str: str]
+        :rtype: (function, function)
+    """
+
+    attr_module_dct = attr_module_dct or {}
+
+    def __getattr__(name):
+        if name in attr_module_dct:
+            module = importlib.import_module(attr_module_dct[name])
+            attr = getattr(module, name)
+        else:
+            mod_name = f'{package_name}.{name}'
+            try:
+                attr = importlib.import_module(mod_name)
+            except ModuleNotFoundError as err:
+                # Only a missing submodule is a missing attribute; a missing
+                # dependency of the submodule should be raised as it is
+                if err.name != mod_name:
+                    raise
+                raise AttributeError(
+                    f"module '{package_name}' has no attribute '{name}'"
+                ) from err
+
+        # Set the attribute so later accesses skip this function
+        setattr(sys.modules[package_name], name, attr)
+
+        return attr
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(names))
+
+    return __getattr__, __dir__
@@ -109,6 +109,38 @@ def read_file(path, file_name,
     return file_str
 
 
+def read_new_lines(file_path, offset=0):
+    """ Read the complete lines appended to a file (that may still be being
+        written) past a byte offset; a partially written last line is left
+        for the next read.
+
+        A missing file has no new lines. If the file has become shorter
+        than the offset, e.g., as it was rewritten by a restarted job, it is
+        read again from the start, and the returned offset is smaller than
+        the one given.
+
+        :param file_path: path to the file
+        :type file_path: str
+        :param offset: byte offset of the first line not yet read
+        :type offset: int
+        :returns: the new lines, and the byte offset past them
+        :rtype: (str, int)
+    """
+
+    if not os.path.isfile(file_path):
+        return '', offset
+
+    with open(file_path, mode='rb') as fobj:
+        if os.fstat(fobj.fileno()).st_size < offset:
+            offset = 0
+        fobj.seek(offset)
+        new_bytes = fobj.read()
+    nbytes = new_bytes.rfind(b'\n') + 1
+
+    return (new_bytes[:nbytes].decode('utf-8', errors='ignore'),
+            offset + nbytes)
+
+
 def write_numpy_file(np_arr, path, file_name):
     """ Save some numpy array to a file using the numpy interface.
 
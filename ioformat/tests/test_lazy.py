@@ -0,0 +1,99 @@
+""" test ioformat.lazy_load and the imports of the packages using it
+"""
+
+import os
+import sys
+import json
+import subprocess
+import ioformat
+
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.realpath(__file__))))
+
+# Packages whose import should not load any heavy dependencies
+LAZY_PACKAGES = ('ioformat', 'elstruct', 'elstruct.reader', 'mess_io',
+                 'mess_io.reader', 'chemkin_io', 'autorun')
+HEAVY_MODULES = ('automol', 'pandas', 'pyparsing', 'mako', 'qcelemental',
+                 'phydat', 'scipy')
+# Submodules that are imported with the packages, to set up the lazy loading
+EAGER_MODULES = ('ioformat._lazy',)
+
+# Reader calls, and the only program module they should load
+LIGHT_CALL_DCT = {
+    "elstruct.reader.has_error_message('gaussian16', 'scf_noconv', '')":
+    'elstruct.reader._gaussian16.status',
+    "elstruct.reader.status_report('molpro2015', '')":
+    'elstruct.reader._molpro2015.status',
+}
+
+IMPORT_SCRIPT = """
+import sys, json
+import {}
+{}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test__lazy_load():
+    """ test ioformat.lazy_load
+    """
+
+    # Functions and submodules are loaded on access and then set
+    assert ioformat.indent('a', 2) == '  a'
+    assert 'indent' in vars(ioformat)
+    assert ioformat.ptt.__name__ == 'ioformat.ptt'
+    assert set(ioformat.__all__) <= set(dir(ioformat))
+
+    # Unknown names are still attribute errors
+    assert not hasattr(ioformat, 'not_a_submodule')
+
+
+def test__lazy_import():
+    """ test that importing the packages does not load their submodules or
+        heavy dependencies
+    """
+
+    for pkg in LAZY_PACKAGES:
+        modules = _loaded_modules(pkg)
+
+        loaded = set(HEAVY_MODULES) & {name.split('.')[0] for name in modules}
+        assert not loaded, (
+            f'importing {pkg} loaded {sorted(loaded)}')
+        loaded = {name for name in modules if name.startswith(f'{pkg}.')}
+        assert loaded <= set(EAGER_MODULES), (
+            f'importing {pkg} loaded {sorted(loaded)}')
+
+
+def test__lazy_call():
+    """ test that calling a reader only loads the modules it uses
+    """
+
+    for call, prog_module in LIGHT_CALL_DCT.items():
+        modules = _loaded_modules('elstruct.reader', call)
+
+        loaded = set(HEAVY_MODULES) & {name.split('.')[0] for name in modules}
+        assert not loaded, f'{call} loaded {sorted(loaded)}'
+        loaded = {name for name in modules
+                  if name.startswith('elstruct.reader._') and
+                  name.count('.') == 3}
+        assert loaded == {prog_module}, f'{call} loaded {sorted(loaded)}'
+
+
+def _loaded_modules(pkg, statement=''):
+    """ The modules loaded by importing a package, and then running a
+        statement, in a fresh interpreter
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [ROOT_PATH] + ([env['PYTHONPATH']] if 'PYTHONPATH' in env else []))
+    out_str = subprocess.check_output(
+        [sys.executable, '-c', IMPORT_SCRIPT.format(pkg, statement)],
+        cwd=ROOT_PATH, env=env)
+    return set(json.loads(out_str))
+
+
+if __name__ == '__main__':
+    test__lazy_load()
+    test__lazy_import()
+    test__lazy_call()
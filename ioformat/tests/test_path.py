@@ -93,6 +93,31 @@ def test__pathtools():
     assert file3_str is None
 
 
+def test__read_new_lines():
+    """ test ioformat.pathtools.read_new_lines
+    """
+
+    path = os.path.join(TMP_DIR, 'tmp_tail.dat')
+
+    # A file that does not exist yet
+    assert ioformat.pathtools.read_new_lines(path) == ('', 0)
+
+    # A partially written last line is left for the next read
+    ioformat.pathtools.write_file(FILE_STR[:60], TMP_DIR, 'tmp_tail.dat')
+    new_str, offset = ioformat.pathtools.read_new_lines(path)
+    assert new_str == FILE_STR[:FILE_STR.rfind('\n', 0, 60) + 1]
+    ioformat.pathtools.write_file(FILE_STR, TMP_DIR, 'tmp_tail.dat')
+    new2_str, offset = ioformat.pathtools.read_new_lines(path, offset)
+    assert new_str + new2_str == FILE_STR
+    assert offset == len(FILE_STR)
+    assert ioformat.pathtools.read_new_lines(path, offset) == ('', offset)
+
+    # A file that was rewritten shorter is read again from the start
+    ioformat.pathtools.write_file(FILE2_STR, TMP_DIR, 'tmp_tail.dat')
+    assert ioformat.pathtools.read_new_lines(path, offset) == (
+        FILE2_STR, len(FILE2_STR))
+
+
 def test__numpy_file():
     """ test ioformat.pathtools.write_numpy_file
         test ioformat.pathtools.read_numpy_file
@@ -2,9 +2,7 @@
  MESS interface writer and readers
 """
 
-from mess_io import writer
-from mess_io import reader
-from mess_io._wellextend import well_lumped_input_file
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -12,3 +10,9 @@ __all__ = [
     'reader',
     'well_lumped_input_file',
 ]
+
+
+# Submodules and functions are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'well_lumped_input_file': 'mess_io._wellextend',
+})
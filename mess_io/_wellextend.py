@@ -15,6 +15,10 @@ def well_lumped_input_file(inp_str, out_str, aux_str, log_str,
     """ Run MESS to get the wells and then parse the aux file for wells...
     """
 
+    # Read the translation tables of the output and log only once
+    out_str = mess_io.reader.output_context(out_str)
+    log_str = mess_io.reader.output_context(log_str)
+
     # Get the requisite information from analyzing the output
     well_enes_dct = well_energies(out_str, log_str, lump_pressure)
     
@@ -42,7 +46,7 @@ def well_lumping_scheme(mess_aux_str, out_str, pressure, temp):
     # it broken in some other way that I haven't found yet?
     well_lump_lst = mess_io.reader.merged_wells(mess_aux_str, pressure, temp)
     if well_lump_lst is not None:
-        lbl_dct = mess_io.reader._label.name_label_dct(out_str)
+        lbl_dct = mess_io.reader.output_context(out_str).lbl_dct
         well_lump_lst = [
             tuple(lbl_dct.get(lbl, lbl) for lbl in lump_set) for lump_set in well_lump_lst
         ]
@@ -57,30 +61,36 @@ def well_lumping_scheme(mess_aux_str, out_str, pressure, temp):
 # Get the energies for definining the well extension cap
 def well_energies(mess_out_str, mess_log_str, pressure):
     """ Obtain the energies for each well at the given pressure.
+
+        The output and log are each read once: the rate constants of all
+        of the reactions into a single table, from which the maximum
+        temperature at which each well exists is found for all wells at
+        once, and the thermal energies of all of the wells.
+
+        The output and log may be given as strings or OutputContexts.
     """
 
-    mess_temps, _ = mess_io.reader.rates.temperatures(mess_out_str)
+    out_ctx = mess_io.reader.output_context(mess_out_str)
+    log_ctx = mess_io.reader.output_context(mess_log_str)
+
+    mess_temps, _ = mess_io.reader.rates.temperatures(out_ctx.string)
     max_run_temp = max(mess_temps)
 
     # Get the temps where each well exists
+    ktp_tab = mess_io.reader.rates.filter_ktp_table(
+        mess_io.reader.rates.ktp_table(out_ctx.string))
+    well_rxns = _get_well_reactions(out_ctx, rxns=ktp_tab.rxns)
+    max_temps, max_rxns = _max_temps_wells_exist(
+        ktp_tab, well_rxns, pressure, mess_temps)
+
+    ene_dct = mess_io.reader.well_thermal_energies(log_ctx.string)
     well_enes = {}
-    well_rxns = _get_well_reactions(mess_out_str)
-    for well, rxn_lst in well_rxns.items():
+    for well, max_temp, max_rxn in zip(well_rxns, max_temps, max_rxns):
         print('\n***********************************************\n')
         print(f'Obtaining information for well {well} at P={pressure}')
-        max_temp = -1.0
-        for rxn in rxn_lst:
-
-            well, prd = rxn[0][0], rxn[1][0]
-
-            # Read the rate constants out of the mess outputs
-            ktp_dct = mess_io.reader.rates.ktp_dct(mess_out_str, well, prd)
-            rxn_temp = _max_temp_well_exists(ktp_dct, pressure, mess_temps)
-
-            if rxn_temp > max_temp:
-                max_temp = rxn_temp
-                print(f'- New max temperature for well: {rxn_temp} K')
-                print(f'- from reaction {well}->{prd}')
+        if max_rxn is not None:
+            print(f'- Max temperature for well: {max_temp} K')
+            print(f'- from reaction {well}->{max_rxn[1][0]}')
 
         # Determine if k(T) exist at highest T -> no Well cap exists
         if numpy.isclose(max_temp, max_run_temp):
@@ -93,9 +103,9 @@ def well_energies(mess_out_str, mess_log_str, pressure):
         # Read the thermal energy at the max temperature
         # Only put enes if they are positive to be written later
         if max_temp is not None:
-            ene = mess_io.reader.well_thermal_energy(mess_log_str, well, max_temp)
+            ene = mess_io.reader.thermal_energy_lookup(ene_dct, well, max_temp)
 
-            if ene > 0.0:
+            if ene is not None and ene > 0.0:
                 well_enes[well] = ene
             else:
                 well_enes[well] = None
@@ -103,79 +113,99 @@ def well_energies(mess_out_str, mess_log_str, pressure):
             well_enes[well] = None
 
     # relabel if needed
-    lbl_dct = mess_io.reader._label.name_label_dct(mess_log_str)
+    lbl_dct = log_ctx.lbl_dct
 
-    if lbl_dct is not None:    
+    if lbl_dct is not None:
         well_enes_new = {lbl_dct[key]: val for key, val in well_enes.items()}
-        well_enes_new = {}
-        for key, val in well_enes.items():
-            new_key = lbl_dct[key]
-            well_enes_new[new_key] = val
     else:
         well_enes_new = well_enes
-        
+
     return well_enes_new
 
 
-def _get_well_reactions(mess_out_str):
+def _get_well_reactions(mess_out_str, rxns=None):
     """ For each Well in the output file, Generate a list of all
         reactions where that Well is the reactant
     """
 
     # Get the well labels from the reactions
     # We assume wells are MESS labels missing a '+' or 'W'
-    rxns = mess_io.reader.rates.reactions(mess_out_str)
+    out_ctx = mess_io.reader.output_context(mess_out_str)
+    if rxns is None:
+        rxns = mess_io.reader.rates.reactions(out_ctx.string)
     rxns = mess_io.reader.rates.filter_reactions(
         rxns, filter_reverse=False)
-    
-    lbl_dct = mess_io.reader._label.name_label_dct(mess_out_str)
-        
-    wells = ()
+
+    lbl_dct = out_ctx.lbl_dct
+
+    wells = {}
     for rxn in rxns:
         rcts, prds = rxn[0], rxn[1]
         if lbl_dct is None:
-            wells += tuple(rct for rct in rcts if '+' not in rct)
-            wells += tuple(prd for prd in prds if '+' not in prd)
-        else: #renamed 
-            wells += tuple(rct for rct in rcts if rct[0] == 'W')
-            wells += tuple(prd for prd in prds if prd[0] == 'W')            
-
-    # Remove duplicates from above loop
-    wells = tuple(n for i, n in enumerate(wells) if n not in wells[:i])
+            wells.update(dict.fromkeys(rct for rct in rcts if '+' not in rct))
+            wells.update(dict.fromkeys(prd for prd in prds if '+' not in prd))
+        else: #renamed
+            wells.update(dict.fromkeys(rct for rct in rcts if rct[0] == 'W'))
+            wells.update(dict.fromkeys(prd for prd in prds if prd[0] == 'W'))
 
     # Grab reactions that contains the well as the reactant
-    well_rxns = {}
-    for well in wells:
-        rxn_lst = ()
-        for rxn in rxns:
-            if (well,) == rxn[0]:
-                rxn_lst += (rxn,)
-        well_rxns[well] = rxn_lst
+    well_rxns = {well: () for well in wells}
+    for rxn in rxns:
+        if len(rxn[0]) == 1 and rxn[0][0] in well_rxns:
+            well_rxns[rxn[0][0]] += (rxn,)
 
     return well_rxns
 
 
-def _max_temp_well_exists(ktp_dct, pressure, mess_temps):
-    """ For a given reaction and pressure, find a max temperature
+def _max_temps_wells_exist(ktp_tab, well_rxns, pressure, mess_temps):
+    """ For each well, find the max temperature at the given pressure
+        at which any of its reactions has a rate constant, from the
+        table of filtered rate constants of all of the reactions
+
+        For a reaction without rate constants at the pressure, this
+        defaults to the lowest temperature run; a well without any
+        reaction gets -1.
 
-        Assumes a filtered ktp dct.
+        :return: max temperature of each well, reaction giving it
+        :rtype: (numpy.ndarray, tuple)
     """
 
-    max_temp = None
-    for _pressure, kt_lst in ktp_dct.items():
-        if _pressure != 'high':
-            if numpy.isclose(_pressure, pressure):
-                # max_temp = max((t for t in kt_lst[0] if t is not None))
-                max_temp = max(kt_lst[0])
-                break
-
-    # Default to the lowest temperature run if no rate constants found
-    if max_temp is None:
-        max_temp = min(mess_temps)
-        print(f'\nNo k(T) values found for P = {pressure} atm.')
-        print(f'T={max_temp}: minimum of all temps in output')
-
-    return max_temp
+    rxns, _pressures, temps, ktp_arr = ktp_tab
+    rxn_idx_dct = {rxn: idx for idx, rxn in enumerate(rxns)}
+
+    # Index of each reaction of each well in the table
+    rxn_lst = [rxn for rxns_ in well_rxns.values() for rxn in rxns_]
+    well_idxs = numpy.repeat(
+        numpy.arange(len(well_rxns)),
+        [len(rxns_) for rxns_ in well_rxns.values()])
+    tab_idxs = numpy.array([rxn_idx_dct[rxn] for rxn in rxn_lst], dtype=int)
+
+    # Max temperature with a rate constant at the pressure for each reaction
+    press_idx = next(
+        (idx for idx, _press in enumerate(_pressures)
+         if _press != 'high' and numpy.isclose(_press, pressure)), None)
+    rxn_temps = numpy.full(len(tab_idxs), float(min(mess_temps)))
+    found = numpy.zeros(len(tab_idxs), dtype=bool)
+    if press_idx is not None and len(temps) > 0:
+        defined = numpy.isfinite(ktp_arr[tab_idxs, press_idx])
+        found = defined.any(axis=1)
+        last_idxs = len(temps) - 1 - numpy.argmax(defined[:, ::-1], axis=1)
+        rxn_temps[found] = temps[last_idxs[found]]
+    for rxn in (rxn for rxn, has_kts in zip(rxn_lst, found) if not has_kts):
+        print(f'\nNo k(T) values found for P = {pressure} atm',
+              f'for {rxn[0][0]}->{rxn[1][0]}.')
+        print(f'T={min(mess_temps)}: minimum of all temps in output')
+
+    # Max over the reactions of each well
+    max_temps = numpy.full(len(well_rxns), -1.0)
+    numpy.maximum.at(max_temps, well_idxs, rxn_temps)
+    max_rxns = tuple(
+        rxn_lst[numpy.flatnonzero(
+            (well_idxs == idx) & (rxn_temps == max_temp))[0]]
+        if max_temp >= 0 else None
+        for idx, max_temp in enumerate(max_temps))
+
+    return max_temps, max_rxns
 
 
 # Handlies writing the new string
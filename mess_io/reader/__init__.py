@@ -3,22 +3,8 @@
   various kinetic and thermochemical parameters of interest
 """
 
-from mess_io.reader import pfs
-from mess_io.reader import rates
-from mess_io.reader import tors
-from mess_io.reader import ped
-from mess_io.reader import hoten
-from mess_io.reader import bf
-from mess_io.reader._pes import pes
-from mess_io.reader._pes import get_species
-from mess_io.reader._pes import find_barrier
-from mess_io.reader._pes import dct_species_fragments
-from mess_io.reader._wells import merged_wells
-from mess_io.reader._wells import well_thermal_energy
-from mess_io.reader._label import relabel
-from mess_io.reader._label import name_label_dct
-from mess_io.reader._nonboltz import ped_info
-from mess_io.reader._nonboltz import hot_info
+from ioformat import lazy_load
+
 
 __all__ = [
     'pfs',
@@ -33,8 +19,31 @@ __all__ = [
     'dct_species_fragments',
     'merged_wells',
     'well_thermal_energy',
+    'well_thermal_energies',
+    'thermal_energy_lookup',
     'relabel',
     'name_label_dct',
+    'OutputContext',
+    'output_context',
     'ped_info',
     'hot_info'
 ]
+
+
+# Submodules and functions are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    'pes': 'mess_io.reader._pes',
+    'get_species': 'mess_io.reader._pes',
+    'find_barrier': 'mess_io.reader._pes',
+    'dct_species_fragments': 'mess_io.reader._pes',
+    'merged_wells': 'mess_io.reader._wells',
+    'well_thermal_energy': 'mess_io.reader._wells',
+    'well_thermal_energies': 'mess_io.reader._wells',
+    'thermal_energy_lookup': 'mess_io.reader._wells',
+    'relabel': 'mess_io.reader._label',
+    'name_label_dct': 'mess_io.reader._label',
+    'OutputContext': 'mess_io.reader._label',
+    'output_context': 'mess_io.reader._label',
+    'ped_info': 'mess_io.reader._nonboltz',
+    'hot_info': 'mess_io.reader._nonboltz',
+})
@@ -2,39 +2,99 @@
     MESS output files
 """
 
+import functools
 import autoparse.find as apf
 import autoparse.pattern as app
 
 
+# Output context
+class OutputContext():
+    """ A MESS output (or log) file string with its name-label translation
+        table read once, so that the table does not have to be re-read by
+        each of the readers called on the same file.
+
+        The readers that relabel species accept an OutputContext in place
+        of the file string. The lines and the translation are read on
+        first access.
+
+        :param output_str: string of lines of MESS output file
+        :type output_str: str
+    """
+
+    def __init__(self, output_str):
+        self.string = output_str
+
+    @functools.cached_property
+    def lines(self):
+        """ lines of the file string
+        """
+        return tuple(self.string.splitlines())
+
+    @functools.cached_property
+    def lbl_dct(self):
+        """ MESS labels to input names, None if there is no table
+        """
+        return name_label_dct(self.string)
+
+    @functools.cached_property
+    def inv_lbl_dct(self):
+        """ input names to MESS labels, None if there is no table
+        """
+        if self.lbl_dct is None:
+            return None
+        return {name: lbl for lbl, name in self.lbl_dct.items()}
+
+    @functools.cached_property
+    def relabel_dct(self):
+        """ MESS labels to tuples of species names, None if there is
+            no table
+        """
+        if self.lbl_dct is None:
+            return None
+        return _relabel_dct(self.lbl_dct)
+
+
+def output_context(output_str):
+    """ Get the OutputContext of a MESS output file string; an
+        OutputContext is returned as it is
+
+        :param output_str: string of lines of MESS output file or context
+        :type output_str: str or OutputContext
+        :rtype: OutputContext
+    """
+    if isinstance(output_str, OutputContext):
+        return output_str
+    return OutputContext(output_str)
+
+
 # Relabeling functions
 def relabel(rxn_ktp_dct, label_dct):
-    """ Relabel the rxn ktp dictionaries using the label dictionary
+    """ Relabel the rxn ktp dictionaries using the label dictionary,
+        or the translation of an OutputContext
     """
 
-    def _relabel(lbl, label_dct):
+    if isinstance(label_dct, OutputContext):
+        relabel_dct = label_dct.relabel_dct or {}
+    else:
+        relabel_dct = _relabel_dct(label_dct)
+
+    def _relabel(lbls):
         """ Use the label dictionary to change the names in
             MESS output labeling to mech input labeling
         """
-        if lbl in label_dct:
-            relbl = tuple(label_dct[lbl].split('+'))
-        else:
-            relbl = (lbl,)
-        return relbl
+        relbls = ()
+        for lbl in lbls:
+            relbls += relabel_dct.get(lbl, (lbl,))
+        return relbls
 
-    relab_rxn_ktp_dct = {}
-    for rxn, _ktp_dct in rxn_ktp_dct.items():
-        rcts, prds, thirdbody = rxn
+    return {(_relabel(rcts), _relabel(prds), thirdbody): _ktp_dct
+            for (rcts, prds, thirdbody), _ktp_dct in rxn_ktp_dct.items()}
 
-        relab_rcts = ()
-        for rct in rcts:
-            relab_rcts += _relabel(rct, label_dct)
-        relab_prds = ()
-        for prd in prds:
-            relab_prds += _relabel(prd, label_dct)
 
-        relab_rxn_ktp_dct[(relab_rcts, relab_prds, thirdbody)] = _ktp_dct
-
-    return relab_rxn_ktp_dct
+def _relabel_dct(label_dct):
+    """ Translation of the MESS labels to tuples of species names
+    """
+    return {lbl: tuple(name.split('+')) for lbl, name in label_dct.items()}
 
 
 def name_label_dct(output_str):
@@ -56,17 +116,13 @@ def name_label_dct(output_str):
 
     start_table_ptt = 'Names Translation Tables'
     end_table_ptt = 'Barriers:'
-    if apf.has_match(start_table_ptt, output_str):
-        start_idx, end_idx = None, None
-        out_lines = output_str.splitlines()
-        for i, line in enumerate(out_lines):
-            if start_table_ptt in line:
-                start_idx = i
-            if end_table_ptt in line:
-                end_idx = i
-                break
-
-        table_block = '\n'.join(out_lines[start_idx+1: end_idx+1])
+    end = output_str.find(end_table_ptt)
+    start = output_str.rfind(start_table_ptt, 0, end if end >= 0 else None)
+    if start >= 0:
+        # the table runs from the line after the start to the end line
+        start = output_str.find('\n', start)
+        end = output_str.find('\n', end) if end >= 0 else -1
+        table_block = output_str[start+1:end if end >= 0 else None]
         name_ptt = (
             app.capturing(app.one_or_more(app.NONNEWLINE)) +
             app.SPACES +
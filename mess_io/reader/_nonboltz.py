@@ -29,6 +29,8 @@ def hot_info(hot_inp_str, hot_log_str):
     hot_frag_dct = reader.dct_species_fragments(spc_blocks_hoten)
     hot_spc_en = reader.hoten.get_hot_species(hot_inp_str)
 
+    # read the name translation of the log once for both readers
+    hot_log_str = reader.output_context(hot_log_str)
     hoten_dct = reader.hoten.extract_hot_branching(
         hot_log_str, hot_spc_en, list(spc_blocks_hoten.keys()), sp_labels='auto')
 
@@ -3,8 +3,6 @@
 
 import numpy
 from phydat import phycon
-import autoparse.pattern as app
-import autoparse.find as apf
 
 
 def merged_wells(mess_aux_str, pressure, temp):
@@ -67,53 +65,69 @@ def well_thermal_energy(log_str, well, temp):
         :type temp: float
         :rtype: dict[str: float]
     """
+    return thermal_energy_lookup(well_thermal_energies(log_str), well, temp)
 
-    # Loop through file to find the energy block with requested temp
-    block_ptt = (
-        'MasterEquation::set:  starts' +
-        app.capturing(app.one_or_more(app.WILDCARD, greedy=False)) +
-        'MasterEquation::set:  done'
-    )
-    blocks = apf.all_captures(block_ptt, log_str)
-
-    if blocks is not None:
-        ptt = ('Temperature' + app.SPACES + '=' + app.SPACES +
-               app.capturing(app.NUMBER) + app.SPACES + 'K')
-        for i, block in enumerate(blocks):
-            blocktemp = float(apf.first_capture(ptt, block))
-            if numpy.isclose(blocktemp, temp, atol=0.01):
-                block_idx = i
-                break
-    else:
-        block_idx = None
-
-    # If block with requested temp found, get energies
-    ene = None
-    if block_idx is not None:
-        ptt = (
-            app.escape(well) + app.SPACES +
-            app.escape('Well:') + app.SPACES +
-            'thermal energy =' + app.SPACES +
-            app.capturing(app.NUMBER) + app.SPACES +
-            app.escape('kcal/mol')
-        )
-        cap = apf.first_capture(ptt, blocks[block_idx])
-        if cap is not None:
-            ene = float(cap) * phycon.KCAL2EH
+
+def well_thermal_energies(log_str):
+    """ Read the thermal energies of all of the wells at all of the
+        temperatures of the MESS rate calculations in a single pass over
+        the log, for lookups with `thermal_energy_lookup`.
+
+        Returns the energies in hartrees.
+
+        :param log_str: string of the MESS .log file
+        :type log_str: str
+        :rtype: dict[float: dict[str: float]]
+    """
+
+    ene_dct = {}
+    temp, thermal, average = None, None, None
+    old_mess = False
+    for line in log_str.splitlines():
+        if 'MasterEquation::set:  starts' in line:
+            temp, thermal, average = None, {}, {}
+        elif thermal is None:
+            continue
+        elif 'MasterEquation::set:  done' in line:
+            # energies of the first block at each temperature are used;
+            # old versions of MESS give the 'average' energy instead
+            if temp is not None and temp not in ene_dct:
+                old_mess = old_mess or any(
+                    well not in thermal for well in average)
+                ene_dct[temp] = {**average, **thermal}
+            thermal = None
         else:
-            # check if user is using old version off MESS, which
-            # uses 'average' instead of 'thermal'
-            ptt = (
-                app.escape(well) + app.SPACES +
-                app.escape('Well:') + app.SPACES +
-                'average energy =' + app.SPACES +
-                app.capturing(app.NUMBER) + app.SPACES +
-                app.escape('kcal/mol')
-            )
-            cap = apf.first_capture(ptt, blocks[block_idx])
-            if cap is not None:
-                ene = float(cap) * phycon.KCAL2EH
-                print(
-                    "WARNING: old version of MESS detected from" +
-                    "use of 'average' instead of 'thermal' energy")
-    return ene
+            tmp = line.split()
+            if temp is None and tmp[:2] == ['Temperature', '=']:
+                temp = float(tmp[2])
+            elif (len(tmp) == 7 and tmp[1] == 'Well:' and
+                  tmp[3:5] == ['energy', '='] and tmp[6] == 'kcal/mol'):
+                if tmp[2] == 'thermal':
+                    thermal.setdefault(tmp[0], float(tmp[5])*phycon.KCAL2EH)
+                elif tmp[2] == 'average':
+                    average.setdefault(tmp[0], float(tmp[5])*phycon.KCAL2EH)
+
+    if old_mess:
+        print(
+            "WARNING: old version of MESS detected from" +
+            "use of 'average' instead of 'thermal' energy")
+
+    return ene_dct
+
+
+def thermal_energy_lookup(ene_dct, well, temp):
+    """ Get the thermal energy of a well at a temperature from the energies
+        of `well_thermal_energies`; None if it was not found
+
+        :param ene_dct: thermal energies at each temperature
+        :type ene_dct: dict[float: dict[str: float]]
+        :param well: name of the well to get energy for
+        :type well: str
+        :param temp: temperature to get the energy for
+        :type temp: float
+        :rtype: float
+    """
+    for _temp, well_ene_dct in ene_dct.items():
+        if numpy.isclose(_temp, temp, atol=0.01):
+            return well_ene_dct.get(well)
+    return None
@@ -4,11 +4,9 @@
 """
 import sys
 import numpy as np
-import pandas as pd
 import autoparse.find as apf
 from mess_io.reader._pes import pes
-from mess_io.reader._label import name_label_dct
-from automol.util.dict_ import invert
+from mess_io.reader._label import output_context
 
 
 def get_hot_species(input_str):
@@ -44,7 +42,7 @@ def extract_hot_branching(hot_log_str, hotspecies_en, species_lst,
                           sp_labels='auto', filter=False):
     """ Extract hot branching fractions for a single species
         :param hot_log_str: string of mess log file
-        :type hot_log_str: str
+        :type hot_log_str: str or OutputContext
         :param hotspecies_en: dct of hotspecies and corresponding energy
         :type hotspecies_en: dct{hotspecies: en}
         :param species_lst: list of all species on the PES
@@ -56,136 +54,220 @@ def extract_hot_branching(hot_log_str, hotspecies_en, species_lst,
         :return hoten_dct: hot branching fractions for hotspecies
         :rtype hoten_dct: dct{hotspecies: df[P][T]:df[allspecies][energies]}
     """
+    return hot_branching_dataframes(hot_branching(
+        hot_log_str, hotspecies_en, species_lst,
+        sp_labels=sp_labels, filter=filter))
+
+
+def hot_branching(hot_log_str, hotspecies_en, species_lst,
+                  sp_labels='auto', filter=False):
+    """ Extract hot branching fractions for each hot species as arrays
+
+        Each block of the log is read in a single pass; the energies of each
+        hot species are rescaled by its energy on the PES and only those
+        above 0 are kept. With filter, branching fractions outside of
+        (1e-20, 1] are zeroed and the rest renormalized.
+
+        :param hot_log_str: string of mess log file
+        :type hot_log_str: str or OutputContext
+        :param hotspecies_en: dct of hotspecies and corresponding energy
+        :type hotspecies_en: dct{hotspecies: en}
+        :param species_lst: list of all species on the PES
+        :type species_lst: list
+        :param sp_labels: type of species labels: 'inp' is how you find them
+                in mess input, 'out' is how they are labeled in the output;
+                'auto' decides 'inp' if it finds the lbl dct
+        :type sp_labels: str
+        :return: pressures, temperatures, products (species_lst followed by
+            any other species in the log) and, for each hot species, its
+            energies (decreasing) and the branching fractions, of shape
+            (npressures, ntemps, nenergies, nproducts), which are NaN for
+            the energies not read at a given pressure and temperature
+        :rtype: (tuple(float), tuple(float), tuple(str),
+                 dct{hotspecies: (numpy.ndarray, numpy.ndarray)})
+    """
     # get label dictionary
-    lbl_dct = name_label_dct(hot_log_str)
-    if lbl_dct:
-        inv_lbl_dct = invert(lbl_dct)
+    log_ctx = output_context(hot_log_str)
+    lbl_dct, inv_lbl_dct = log_ctx.lbl_dct, log_ctx.inv_lbl_dct
 
     if sp_labels == 'auto':
         sp_labels = 'inp'*(not not lbl_dct) + 'out'*(not lbl_dct)
+    if sp_labels not in ('inp', 'out'):
+        print('*Error: sp_labels must be "inp" (as in mess input) \
+            or "out" (as in mess output)')
+        sys.exit()
 
-    lines = hot_log_str.splitlines()
-    # for each species: dataframe of dataframes BF[Ti][pi]
-    # each of them has BF[energy][species]
-    # preallocations
-    hotspecies_lst = list(hotspecies_en.keys())
-    # 1. extract P, T and preallocate dictionary
-    pt_i_array = apf.where_in(['Pressure', 'Temperature'], lines)
-    pt_list = []
-    for pt_i in pt_i_array:
-        pt_list.append([
-            float(var)
-            for var in lines[pt_i].strip().split()[2:7:4]])
-    pressures = list(set([pt[0] for pt in pt_list]))
-    temps = list(set([pt[1] for pt in pt_list]))
-    pressures.sort(), temps.sort()
+    # 1. read all of the blocks of branching fractions with their P, T
+    blocks = _hot_branching_blocks(log_ctx.lines)
+    pressures = tuple(sorted({block[0] for block in blocks}))
+    temps = tuple(sorted({block[1] for block in blocks}))
+
+    products = list(species_lst)
+    for _, _, species_bf_i_messout, _, _ in blocks:
+        for spc in species_bf_i_messout:
+            spc = lbl_dct[spc] if sp_labels == 'inp' else spc
+            if spc not in products:
+                products.append(spc)
+    prd_idx_dct = {spc: idx for idx, spc in enumerate(products)}
+
+    # 2. for each hotspecies: get the BFs of its lines in every block
+    # rescale energy by the hotspecies energy on the PES!!
+    # ref 0 energy is the ref for the PES, even for the hotspecies
+    hot_bf_dct = {}
+    for hotspecies, ref_en in hotspecies_en.items():
+        hotspecies_messout = (
+            inv_lbl_dct[hotspecies] if sp_labels == 'inp' else hotspecies)
+
+        blk_bfs = ()
+        for _press, _temp, species_bf_i_messout, labels, vals in blocks:
+            rows = labels == hotspecies_messout
+            hot_e_lvl = vals[rows, 0] - ref_en
+            branch_ratio = vals[rows, 1:]
+
+            sp_i = apf.where_is(hotspecies_messout, species_bf_i_messout)
+            if filter:
+                branch_ratio, valid = _filter_branching(branch_ratio, sp_i)
+            else:
+                valid = np.ones(hot_e_lvl.shape, dtype=bool)
+
+            # pick only values above 0, once for each energy
+            valid &= hot_e_lvl > 0
+            _, first_idxs = np.unique(
+                np.where(valid, hot_e_lvl, np.nan), return_index=True)
+            keep = np.zeros(hot_e_lvl.shape, dtype=bool)
+            keep[first_idxs] = True
+            keep &= valid
+
+            species_bf_i = (
+                [lbl_dct[spc] for spc in species_bf_i_messout]
+                if sp_labels == 'inp' else species_bf_i_messout)
+            cols = [prd_idx_dct[spc] for spc in species_bf_i]
+            blk_bfs += ((pressures.index(_press), temps.index(_temp), cols,
+                         hot_e_lvl[keep], branch_ratio[keep]),)
+
+        # 3. allocate in the array, with 0 for the products not in a block
+        hot_e_lvl = np.unique(np.concatenate(
+            [blk[3] for blk in blk_bfs] or [[]]))[::-1]
+        bf_arr = np.full(
+            (len(pressures), len(temps), len(hot_e_lvl), len(products)),
+            np.nan)
+        for pidx, tidx, cols, blk_e_lvl, blk_bf in blk_bfs:
+            eidxs = len(hot_e_lvl) - 1 - np.searchsorted(
+                hot_e_lvl[::-1], blk_e_lvl)
+            bf_arr[pidx, tidx, eidxs, :] = 0.0
+            bf_arr[pidx, tidx, eidxs[:, None], np.array(cols)] = blk_bf
+        hot_bf_dct[hotspecies] = (hot_e_lvl, bf_arr)
+
+    return pressures, temps, tuple(products), hot_bf_dct
+
+
+def hot_branching_dataframes(hot_bf):
+    """ Convert the hot branching fraction arrays into the dataframes of
+        `extract_hot_branching`
+
+        :param hot_bf: hot branching fractions, as from `hot_branching`
+        :type hot_bf: tuple
+        :rtype: dct{hotspecies: df[P][T]:df[allspecies][energies]}
+    """
+    # pylint: disable=import-outside-toplevel
+    import pandas as pd
+
+    pressures, temps, products, hot_bf_dct = hot_bf
+
+    hoten_dct = {}
+    for hotspecies, (hot_e_lvl, bf_arr) in hot_bf_dct.items():
+        hoten_dct[hotspecies] = pd.DataFrame(
+            index=list(temps), columns=list(pressures))
+        for pidx, _press in enumerate(pressures):
+            for tidx, _temp in enumerate(temps):
+                read = ~np.isnan(bf_arr[pidx, tidx, :, 0])
+                hoten_dct[hotspecies].at[_temp, _press] = pd.DataFrame(
+                    bf_arr[pidx, tidx, read], index=hot_e_lvl[read],
+                    columns=list(products))
 
-    hoten_dct = {s: pd.DataFrame(index=temps, columns=pressures)
-                 for s in hotspecies_lst}
+    return hoten_dct
 
-    # variables limiting the blocks
-    hot_i_array = apf.where_in(['Hot distribution branching ratios'], lines)
-    if len(hot_i_array) == 0:
-        # different output
-        hot_i_array = apf.where_in(['hot energies branching fractions'], lines)
-    end_hot_i_array = apf.where_in(
-        ['prompt', 'isomerization', 'dissociation'], lines)
-
-    # 2. find Hot distribution branching ratios:
-    for i, hot_i in enumerate(hot_i_array):
-
-        # extract block, PT, and species for which BF is assigned
-        lines_block = lines[hot_i+2:end_hot_i_array[i]]
-        _press, _temp = [
-            float(var)
-            for var in lines[pt_i_array[i]].strip().split()[2:7:4]]
-
-        # options for different outputs:
-        if 'WellE' in lines[hot_i+1]:
-            species_bf_i_messout = lines[hot_i+1].strip().split()[2:-1]
-            outtype = 2
-        elif 'kcal ' in lines[hot_i+1]:
-            species_bf_i_messout = lines[hot_i+1].strip().split()[3:]
-            outtype = 1
-        else:
-            print('*Error in reading hoten blocks - Yuri changed output again. exiting')
-            sys.exit()
-
-        # for each hotspecies: read BFs
-        # rescale energy by the hotspecies energy on the PES!!
-        # ref 0 energy is the ref for the PES, even for the hotspecies
-
-        for hotspecies in hotspecies_lst:
-            hot_e_lvl, branch_ratio = [], []
-            ref_en = hotspecies_en[hotspecies]
-
-            if sp_labels == 'inp':
-                hotspecies_messout = inv_lbl_dct[hotspecies]
-                species_bf_i = [lbl_dct[sp_i] for sp_i in species_bf_i_messout]
-            elif sp_labels == 'out':
-                hotspecies_messout = hotspecies
-                species_bf_i = species_bf_i_messout
+
+def _hot_branching_blocks(lines):
+    """ Read every block of hot branching fractions of the log lines in a
+        single pass
+
+        :return: for each block: pressure, temperature, species of the
+            branching fractions, label of each line, array of the energy and
+            branching fractions of each line
+        :rtype: tuple((float, float, list(str), numpy.ndarray, numpy.ndarray))
+    """
+
+    blocks = []
+    _press, _temp = None, None
+    rows, species_bf_i_messout, header_i = None, None, None
+    for i, line in enumerate(lines):
+        if rows is not None:
+            if i == header_i:
+                continue
+            if all(word in line for word in
+                   ('prompt', 'isomerization', 'dissociation')):
+                labels = np.array([row[0] for row in rows], dtype=str)
+                vals = np.array(
+                    [row[1:len(species_bf_i_messout)+2] for row in rows],
+                    dtype=float).reshape(-1, len(species_bf_i_messout)+1)
+                blocks.append(
+                    (_press, _temp, species_bf_i_messout, labels, vals))
+                rows = None
+            elif line.strip():
+                rows.append(line.split())
+        elif 'Pressure' in line and 'Temperature' in line:
+            _press, _temp = [
+                float(var) for var in line.strip().split()[2:7:4]]
+        elif ('Hot distribution branching ratios' in line or
+              'hot energies branching fractions' in line):
+            # options for different outputs:
+            header = lines[i+1]
+            if 'WellE' in header:
+                species_bf_i_messout = header.strip().split()[2:-1]
+            elif 'kcal ' in header:
+                species_bf_i_messout = header.strip().split()[3:]
             else:
-                print('*Error: sp_labels must be "inp" (as in mess input) \
-                    or "out" (as in mess output)')
+                print('*Error in reading hoten blocks - Yuri changed output '
+                      'again. exiting')
                 sys.exit()
+            rows, header_i = [], i+1
 
-            sp_i = apf.where_is(hotspecies_messout, species_bf_i_messout)
+    return tuple(blocks)
 
-            for line in lines_block:
-                line = line.strip()
-                if line.startswith(hotspecies_messout):
-                    hot_e = float(line.split()[1]) - ref_en
-                    # pick only values above 0
-                    if hot_e not in hot_e_lvl and hot_e > 0:
-                        if outtype == 1:
-                            branch_ratio_arr = np.array(
-                                list(line.split()[2:]), dtype=float)
-                        elif outtype == 2:
-                            branch_ratio_arr = np.array(
-                                list(line.split()[2:-1]), dtype=float)
-
-                        # check that value of reactant branching is between 0 and 1
-                        # if any bf > 1: skip the line
-                        if filter:
-                            if sp_i.size > 0:
-                                if branch_ratio_arr[sp_i] > 1:
-                                    branch_ratio_arr = np.ones(branch_ratio_arr.shape)*1e-19
-                                    branch_ratio_arr[sp_i] = 1
-
-                            # remove negative values or values >1
-                            _arr = [abs(x*int(1e-20 < x <= 1))
-                                    for x in branch_ratio_arr]
-                            br_filter = np.array(_arr, dtype=float)
-
-                            # if all invalid: do not save
-
-                            if all(br_filter == 0):
-                                continue
-                            br_renorm = br_filter/np.sum(br_filter)
-                        else:
-                            br_renorm = branch_ratio_arr
-                            
-                        # append values                            
-                        branch_ratio.append(br_renorm) ### COMMENT THIS LATER
-                        hot_e_lvl.append(hot_e)
-
-            hot_e_lvl = np.array(hot_e_lvl)
-            branch_ratio = np.array(branch_ratio)
-
-            # 3. allocate in the dataframe
-            bf_hotspecies = pd.DataFrame(
-                0, index=hot_e_lvl, columns=species_lst)
-            bf_hotspecies[species_bf_i] = branch_ratio
-            hoten_dct[hotspecies].at[_temp, _press] = bf_hotspecies
 
-    return hoten_dct
+def _filter_branching(branch_ratio, sp_i):
+    """ Filter and renormalize the branching fractions of each line
+
+        :return: filtered branching fractions, whether each line is valid
+        :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+
+    branch_ratio = np.array(branch_ratio, dtype=float)
+
+    # check that value of reactant branching is between 0 and 1
+    # if any bf > 1: set it to 1 and all others to 1e-19
+    if sp_i.size > 0:
+        over = branch_ratio[:, sp_i[0]] > 1
+        branch_ratio[over] = 1e-19
+        branch_ratio[over, sp_i[0]] = 1
+
+    # remove negative values or values >1
+    branch_ratio = np.where(
+        (branch_ratio > 1e-20) & (branch_ratio <= 1), branch_ratio, 0.0)
+
+    # if all invalid: do not save
+    bf_sum = branch_ratio.sum(axis=1)
+    valid = bf_sum > 0
+    branch_ratio[valid] /= bf_sum[valid, None]
+
+    return branch_ratio, valid
 
 
 def extract_fne(log_str, sp_labels='auto'):
     """ Extract fne from log file
         :param log_str: string of mess log file
-        :type log_str: str
+        :type log_str: str or OutputContext
         :param sp_labels: type of species labels: 'inp' is how you find them
                 in mess input, 'out' is how they are labeled in the output;
                 'auto' sets to inp if it finds the lbl dct, otherwise 'out'
@@ -197,9 +279,13 @@ def extract_fne(log_str, sp_labels='auto'):
                 made so that you can extract bf_tp_df from here to
                 use it with bf_tp_df_todct
     """
-    lines = log_str.splitlines()
+    # pylint: disable=import-outside-toplevel
+    import pandas as pd
+
+    log_ctx = output_context(log_str)
+    lines = log_ctx.lines
     # get label dictionary and count N of wells
-    lbl_dct = name_label_dct(log_str)
+    lbl_dct = log_ctx.lbl_dct
     if sp_labels == 'auto':
         sp_labels = 'inp'*(not not lbl_dct) + 'out'*(not lbl_dct)
 
@@ -5,13 +5,11 @@
 from doctest import OutputChecker
 import sys
 import numpy as np
-import pandas as pd
 import copy
 import autoparse.find as apf
 import autoparse.pattern as app
 from ioformat import remove_comment_lines
-from mess_io.reader._label import name_label_dct
-from automol.util.dict_ import invert
+from mess_io.reader._label import output_context
 
 
 def ped_names(input_str):
@@ -57,7 +55,7 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
         Energy in output set with respect to the ground energy of the products
 
         :param pedoutput_str: string of lines of ped_output file
-        :type pedoutput_str: str
+        :type pedoutput_str: str or OutputContext
         :param ped_spc: species of interest in pedoutput
         :type ped_spc: list(list(str))
         :param energy_dct: energies of ped PES
@@ -72,80 +70,240 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
         :rtype ped_df_dct: {((reacs,),(prods,),(None,)): dataframe(series(float))}
         for hotwells is ((reacs,),(prods,),(None,)): dataframe(series(series((float)))
     """
-    def prob_en_single(probability, energy, del_neg = False):
-        # build the series and put in dataframe after
-        # removing negative probs and renormalizing
-        # integrate with the trapezoidal rule
-        # if PEDtype is bimol, it checks for neg vals.
-        prob_en = pd.Series(probability, index=energy, dtype=float)
-        # remove duplicate indices 
-        prob_en = prob_en[~prob_en.index.duplicated(keep = 'first')]
-        prob_en = prob_en.sort_index()
-
-        # if there are negative energies (might happen for multiple ped prods)
-        prob_en = prob_en[prob_en.index > 0]
-
-        # prob_en = prob_en[prob_en > 0]
-        if del_neg:
-            if np.trapz(prob_en.values, x=prob_en.index) < 0:
-                # I don't know how to treat negative probabilities
-                # alternative: set the absolute value? or do nothing
-                prob_en *= 0
-            
-            elif len(prob_en[prob_en <= 0]) > 0:
-                # find indexes of non positive  values
-                idx_neg = np.where(prob_en <= 0)[0]
-                idx_max = np.argmax(prob_en) #turn this to max val?
-                # indexes of negative values closest to the center of ped (always =1)
-                try:
-                    low = idx_neg[idx_neg < idx_max][-1]+1
-                except IndexError:
-                    low = 0
-                try:
-                    up = idx_neg[idx_neg > idx_max][0]
-                except IndexError:
-                    up = -1
-
-                prob_en = prob_en.iloc[low:up]
-        # algorithm before 05-25-2022
-        # if there are negative values of the probability: remove them
-        #    prob_en = prob_en[prob_en[prob_en < 0].index[-1]+1:]
-        #    print(prob_en, '\n')
-        # integrate with trapz
-        prob_en /= abs(np.trapz(prob_en.values, x=prob_en.index))
-
-        # if issues : keep only max value like dirac delta
-        if any(np.isnan(prob_en.values)) or any(np.isinf(prob_en.values)):
-            prob_en = np.NaN
-
-        try:
-            if max(prob_en) > 1:
-                prob_en /= max(prob_en)
-        except ValueError:
-            prob_max = np.argmax(probability)
-            prob_en = pd.Series(probability[prob_max], index=energy[prob_max])
-
-        except TypeError:
-            pass
-
-        return prob_en
+    labels, pressure_lst, temperature_lst, store = _read_ped(
+        pedoutput_str, energy_dct, sp_labels)
+    store = process_ped_store(store)
+
+    return _ped_dataframes(labels, pressure_lst, temperature_lst, store)
+
+
+def ped_store(pedoutput_str, energy_dct, sp_labels='auto', del_neg=False):
+    """ Read `PEDOutput` file and extract all of the product energy
+        distributions into a single ragged array store
+
+            (keys, offsets, energies, probs)
+
+        where the distribution of keys[i] is energies[offsets[i]:offsets[i+1]],
+        probs[offsets[i]:offsets[i+1]]. The keys are (label, pressure, temp,
+        init_energy), with the labels and energies as in `get_ped` and
+        init_energy None except for hot wells.
+
+        The distributions are processed as in `get_ped` (see
+        `process_ped_store`); those that cannot be normalized are empty.
+
+        :param pedoutput_str: string of lines of ped_output file
+        :type pedoutput_str: str or OutputContext
+        :param energy_dct: energies of ped PES
+        :type energy_dct: {label: energy} (str)
+        :param sp_labels: type of pedspecies labels, as in `get_ped`
+        :type sp_labels: str
+        :param del_neg: trim the distributions to their positive central part
+        :type del_neg: bool
+        :rtype: (tuple, numpy.ndarray, numpy.ndarray, numpy.ndarray)
+    """
+    _, _, _, store = _read_ped(pedoutput_str, energy_dct, sp_labels)
+    return process_ped_store(store, del_neg=del_neg)
+
+
+def ped_store_dct(store):
+    """ Get the distributions of a ragged store of PEDs by key
+
+        :param store: PEDs, as from `ped_store`
+        :type store: tuple
+        :rtype: dict[tuple: (numpy.ndarray, numpy.ndarray)]
+    """
+    keys, offsets, energies, probs = store
+    return {key: (energies[start:end], probs[start:end])
+            for key, start, end in zip(keys, offsets[:-1], offsets[1:])}
+
+
+def process_ped_store(store, del_neg=False):
+    """ Process all of the distributions of a ragged store of PEDs at once:
+        for each, remove duplicate energies (keeping the first), sort by
+        energy, remove energies that are not positive, optionally trim the
+        distribution to the part around its maximum without non-positive
+        values (del_neg), normalize it to an integral (trapezoidal rule)
+        of 1, and rescale it if its maximum is above 1.
+
+        A distribution with no positive energy becomes a single point at the
+        maximum of the original one; one that cannot be normalized becomes
+        empty.
+
+        :param store: raw PEDs (keys, offsets, energies, probs)
+        :type store: tuple
+        :param del_neg: trim the distributions to their positive central part
+        :type del_neg: bool
+        :rtype: (tuple, numpy.ndarray, numpy.ndarray, numpy.ndarray)
+    """
+    keys, offsets, energies, probs = store
+    nser = len(keys)
+    seg_ids = np.repeat(np.arange(nser), np.diff(offsets))
+
+    # remove duplicate energies, keeping the first, and sort by energy
+    order = np.lexsort((np.arange(energies.size), energies, seg_ids))
+    seg, ene, prob = seg_ids[order], energies[order], probs[order]
+    keep = np.ones(ene.size, dtype=bool)
+    keep[1:] = (seg[1:] != seg[:-1]) | (ene[1:] != ene[:-1])
+    # if there are negative energies (might happen for multiple ped prods)
+    keep &= ene > 0
+    seg, ene, prob = seg[keep], ene[keep], prob[keep]
+
+    if del_neg:
+        seg, ene, prob = _trim_negative_tails(seg, ene, prob, nser)
+
+    # integrate with the trapezoidal rule and normalize
+    integ = _segment_trapezoid(seg, ene, prob, nser)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prob = prob / np.abs(integ[seg])
+    # if issues : drop the distribution
+    bad = np.zeros(nser, dtype=bool)
+    bad[seg[~np.isfinite(prob)]] = True
+    good = ~bad[seg]
+    seg, ene, prob = seg[good], ene[good], prob[good]
+
+    pmax = np.full(nser, -np.inf)
+    np.maximum.at(pmax, seg, prob)
+    prob = np.where(pmax[seg] > 1, prob / pmax[seg], prob)
+
+    # if nothing is left: keep only max value like dirac delta
+    counts = np.bincount(seg, minlength=nser)
+    dirac_segs = np.where((counts == 0) & ~bad & (np.diff(offsets) > 0))[0]
+    if dirac_segs.size:
+        dirac_idxs = np.array([
+            offsets[i] + np.argmax(probs[offsets[i]:offsets[i+1]])
+            for i in dirac_segs])
+        seg = np.concatenate((seg, dirac_segs))
+        ene = np.concatenate((ene, energies[dirac_idxs]))
+        prob = np.concatenate((prob, probs[dirac_idxs]))
+        order = np.argsort(seg, kind='stable')
+        seg, ene, prob = seg[order], ene[order], prob[order]
+        counts = np.bincount(seg, minlength=nser)
+
+    new_offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    return keys, new_offsets, ene, prob
+
+
+def _segment_trapezoid(seg, ene, prob, nser):
+    """ Integrate each segment of a ragged array with the trapezoidal rule
+    """
+    same = seg[1:] == seg[:-1]
+    areas = 0.5 * (prob[1:] + prob[:-1]) * np.diff(ene)
+    return np.bincount(seg[1:][same], weights=areas[same], minlength=nser)
+
+
+def _trim_negative_tails(seg, ene, prob, nser):
+    """ For each segment of a ragged array: zero it if its integral is
+        negative; otherwise, if it has non-positive values, keep only the
+        part between the non-positive values closest to its maximum
+    """
+    integ = _segment_trapezoid(seg, ene, prob, nser)
+    # I don't know how to treat negative probabilities
+    prob = np.where(integ[seg] < 0, 0.0, prob)
+
+    counts = np.bincount(seg, minlength=nser)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    loc = np.arange(seg.size) - starts[seg]
+
+    # position of the (first) maximum of each segment
+    pmax = np.full(nser, -np.inf)
+    np.maximum.at(pmax, seg, prob)
+    locmax = np.full(nser, seg.size)
+    np.minimum.at(locmax, seg, np.where(prob == pmax[seg], loc, seg.size))
+
+    # non-positive values closest to the maximum on each side
+    nonpos = (prob <= 0) & (integ[seg] >= 0)
+    low = np.zeros(nser, dtype=int)
+    np.maximum.at(low, seg,
+                  np.where(nonpos & (loc < locmax[seg]), loc + 1, 0))
+    upp = counts.copy()
+    np.minimum.at(upp, seg,
+                  np.where(nonpos & (loc > locmax[seg]), loc, seg.size))
+    # without any after the maximum, the last value is dropped
+    has_nonpos = np.bincount(seg, weights=nonpos, minlength=nser) > 0
+    no_upp = has_nonpos & (upp == counts)
+    upp[no_upp] = counts[no_upp] - 1
+
+    keep = ~has_nonpos[seg] | ((loc >= low[seg]) & (loc < upp[seg]))
+    return seg[keep], ene[keep], prob[keep]
+
+
+def _ped_dataframes(labels, pressure_lst, temperature_lst, store):
+    """ Build the dataframes of `get_ped` from the processed PEDs
+    """
+    # pylint: disable=import-outside-toplevel
+    import pandas as pd
+
+    ped_df_dct = {
+        label: pd.DataFrame(index=list(set(temperature_lst)),
+                            columns=list(set(pressure_lst)), dtype=object)
+        for label in labels}
+
+    keys, offsets, energies, probs = store
+    for (label, pressure, temp, init_energy), start, end in zip(
+            keys, offsets[:-1], offsets[1:]):
+        if end > start:
+            prob_en = pd.Series(probs[start:end], index=energies[start:end],
+                                dtype=float)
+        else:
+            prob_en = np.nan
+
+        if init_energy is None:
+            ped_df_dct[label].at[temp, pressure] = prob_en
+        else:
+            # hot wells: series of the distribution at each initial energy
+            hot_ped = ped_df_dct[label].at[temp, pressure]
+            if not isinstance(hot_ped, pd.Series):
+                hot_ped = pd.Series(dtype=object)
+            hot_ped[init_energy] = prob_en
+            ped_df_dct[label].at[temp, pressure] = hot_ped.dropna()
+
+    # remove "self" reactions, nonsense
+    return {label: ped_df for label, ped_df in ped_df_dct.items()
+            if label[0] != label[1]}
+
+
+def _read_ped(pedoutput_str, energy_dct, sp_labels):
+    """ Read all of the product energy distributions of a `PEDOutput` file,
+        as they are in the file, into a ragged store
+
+        :return: labels, pressures and temperatures of the blocks, and the
+            store (keys, offsets, energies, probs)
+        :rtype: (tuple, numpy.ndarray, numpy.ndarray, tuple)
+    """
+    ped_ctx = output_context(pedoutput_str)
+    ped_lines = ped_ctx.lines
+    # the first empty line after each line
+    empty_i = apf.where_is('', ped_lines)
+    # only search the lines that are not rows of numbers
+    text_i = np.array([i for i, line in enumerate(ped_lines)
+                       if line.lstrip()[:1] not in '0123456789.+-'],
+                      dtype=int)
+    text_lines = [ped_lines[i] for i in text_i]
+
+    def where_in(word):
+        return text_i[apf.where_in(word, text_lines)]
 
     def indexes(label_messout, ped_lines):
-        species_i = apf.where_in(label_messout, ped_lines)+1
-        empty_i = apf.where_is('', ped_lines)
-        final_i = np.array([empty_i[i < empty_i][0] for i in species_i])
+        species_i = where_in(label_messout)+1
+        final_i = empty_i[np.searchsorted(empty_i, species_i, side='right')]
 
         return species_i, final_i
 
     def def_prods_outinp(sp_labels, prods_list, lbl_dct):
         if sp_labels == 'inp':
-            prods_outinp = pd.Series([lbl_dct[prod]
-                                      for prod in prods_list], index=prods_list)
+            prods_outinp = {prod: lbl_dct[prod] for prod in prods_list}
         elif sp_labels == 'out':
-            prods_outinp = pd.Series(prods_list, index=prods_list)
+            prods_outinp = {prod: prod for prod in prods_list}
 
         return prods_outinp
 
+    def block_values(i_in, i_fin):
+        # convert all the values of the block at once
+        block_lines = ped_lines[i_in:i_fin]
+        return np.array(' '.join(block_lines).split(), dtype=float).reshape(
+            len(block_lines), -1).T
+
     def ped_and_hotwells_1(ped_lines):
         " list of ped species and hotwells for output type 1 ..."
         lines_bimolbimol, _ = indexes('Bimolecular-to-bimolecular', ped_lines)
@@ -181,14 +339,12 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
         if len(lines_wells) > 0:
             hotwells = list(set([ped_lines[well_idx-1].split()[1]
                                  for well_idx in lines_wells]))
-            
-        return ped_spc, hotwells
 
-    ped_lines = pedoutput_str.splitlines()
+        return ped_spc, hotwells
 
     # apf.where data of interest are
-    pressure_i = apf.where_in('pressure', ped_lines)
-    temperature_i = apf.where_in('temperature', ped_lines)
+    pressure_i = where_in('pressure')
+    temperature_i = where_in('temperature')
 
     # get T, P list
     pressure_lst = np.array([ped_lines[P].strip().split('=')[1]
@@ -196,9 +352,7 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
     temperature_lst = np.array([ped_lines[T].strip().split('=')[1]
                                 for T in temperature_i], dtype=float)
     # get label dictionary
-    lbl_dct = name_label_dct(pedoutput_str)
-    if lbl_dct:
-        inv_lbl_dct = invert(lbl_dct)
+    lbl_dct, inv_lbl_dct = ped_ctx.lbl_dct, ped_ctx.inv_lbl_dct
     if sp_labels == 'auto':
         sp_labels = 'out'*(not lbl_dct) + 'inp'*(not not lbl_dct)
 
@@ -214,15 +368,10 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
     if sp_labels == 'inp' and len(hotwells) > 0:
         hotwells = [lbl_dct[well] for well in hotwells]
 
-    ped_df_dct = {}
+    labels, keys, energies, probs = [], [], [], []
 
-    # ped_df_dct = dict.fromkeys(energy_dct.keys())
     # find the energy for the scaling: everything refers to the products
     for label_messout in ped_spc:
-        # allocate empty dataframe
-        ped_df = pd.DataFrame(index=list(set(temperature_lst)),
-                              columns=list(set(pressure_lst)), dtype=object)
-
         reacs, prods = label_messout.split('->')
         # relabel if necessary
         if sp_labels == 'inp':
@@ -234,6 +383,7 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
             print('*Error: sp_labels must be "inp" (as in mess input) \
                 or "out" (as in mess output)')
             sys.exit()
+        labels.append(label)
 
         # 0th of the energy: products energy
         prods_outinp = def_prods_outinp(sp_labels, [prods], lbl_dct)
@@ -250,27 +400,18 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
         # column label
         column_i = apf.where_is(
             label_messout, ped_lines[species_i[0]-1].strip().split()[1:])[0]
-        # reset species_i and final_i based on correspondence with label
 
-        # check that length of pressure list is the same as new species_i
         # extract the data
         for i in np.arange(0, len(species_i)):
             # if labels don't match: go to next loop
-
             if label_messout not in ped_lines[species_i[i]-1]:
                 continue
 
             pressure, temp = pressure_lst[i], temperature_lst[i]
-            i_in, i_fin = species_i[i], final_i[i]
-
-            en_prob_all = np.array(
-                [line.strip().split() for line in ped_lines[i_in:i_fin]],
-                dtype=float).T
-            energy = en_prob_all[:][0] + ene0
-            probability = en_prob_all[:][column_i]
-            ped_df.at[temp,pressure] = prob_en_single(probability, energy)
-
-        ped_df_dct[label] = ped_df
+            en_prob_all = block_values(species_i[i], final_i[i])
+            keys.append((label, pressure, temp, None))
+            energies.append(en_prob_all[0] + ene0)
+            probs.append(en_prob_all[column_i])
 
     for hotwell in hotwells:
 
@@ -283,7 +424,7 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
             print('*Error: sp_labels must be "inp" (as in mess input) \
                 or "out" (as in mess output)')
             sys.exit()
-            
+
         # add "hot" if you have outtype 2
         if outtype == 2:
             label_messout = [label_messout, 'hot']
@@ -293,51 +434,40 @@ def get_ped(pedoutput_str, energy_dct, sp_labels='auto'):
 
         prods_outinp = def_prods_outinp(sp_labels, prods_list, lbl_dct)
 
-        ene0_all = pd.Series(-np.array([energy_dct[prods_outinp[prods]]
-                                        for prods in prods_list]), index=prods_list)
-        # allocate dataframes and labels
-        for prods in prods_outinp.values:
-            label = ((hotwell,), tuple(prods.split('+')), (None,))
-            ped_df_dct[label] = pd.DataFrame(index=list(set(temperature_lst)),
-                                             columns=list(set(pressure_lst)), dtype=object)
+        ene0_all = {prods: -energy_dct[prods_outinp[prods]]
+                    for prods in prods_list}
+        # allocate labels
+        hot_labels = [((hotwell,), tuple(prods_outinp[prods].split('+')),
+                       (None,)) for prods in prods_list]
+        labels.extend(label for label in hot_labels if label not in labels)
 
         # extract the data
         for i in np.arange(0, len(species_i)):
             i_in, i_fin = species_i[i]+1, final_i[i]
             pressure, temp = pressure_lst[pressure_i <
                                           i_in][-1], temperature_lst[temperature_i < i_in][-1]
-        
+
             init_energy = float(ped_lines[i_in -
                                           2].split('=')[-1].strip().split()[0]) - energy_dct[hotwell]
-            en_prob_all = np.array(
-                [line.strip().split() for line in ped_lines[i_in:i_fin]],
-                dtype=float).T
+            en_prob_all = block_values(i_in, i_fin)
 
             for pi, prods in enumerate(prods_list):
-
-                label = ((hotwell,), tuple(
-                    prods_outinp[prods].split('+')), (None,))
-                try:
-                    ped_df_dct[label].at[temp, pressure][init_energy]
-                except TypeError:
-                    ped_df_dct[label].at[temp, pressure] = pd.Series(dtype=object)
-                except KeyError:
-                    pass
-                finally:
-                    energy = en_prob_all[:][0] + ene0_all[prods]
-                    probability = en_prob_all[:][pi+1]
-                    # print(probability)
-                    ped_df_dct[label].at[temp, pressure][init_energy] = prob_en_single(
-                        probability, energy)
-                    # print(label, prods , pressure, temp , ped_df_dct[label][pressure][temp][init_energy])
-                    ped_df_dct[label].at[temp, pressure] = ped_df_dct[label][pressure][temp].dropna(
-                    )
-
-    # remove "self" reactions, nonsense
-    keydel = []
-    for key in ped_df_dct.keys():
-        if key[0] == key[1]:
-            keydel.append(key)
-    [ped_df_dct.pop(key) for key in keydel]
-            
-    return ped_df_dct
+                keys.append((hot_labels[pi], pressure, temp, init_energy))
+                energies.append(en_prob_all[0] + ene0_all[prods])
+                probs.append(en_prob_all[pi+1])
+
+    # the hot well PEDs replace the ones read for the same reaction
+    hot_labels = {key[0] for key in keys if key[3] is not None}
+    idxs = [i for i, key in enumerate(keys)
+            if key[3] is not None or key[0] not in hot_labels]
+    keys = [keys[i] for i in idxs]
+    energies = [energies[i] for i in idxs]
+    probs = [probs[i] for i in idxs]
+
+    offsets = np.concatenate(
+        ([0], np.cumsum([len(ene) for ene in energies], dtype=int)))
+    store = (tuple(keys), offsets,
+             np.concatenate(energies) if energies else np.zeros(0),
+             np.concatenate(probs) if probs else np.zeros(0))
+
+    return tuple(labels), pressure_lst, temperature_lst, store
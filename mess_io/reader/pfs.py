@@ -4,6 +4,45 @@
   corresponding to one species.
 """
 
+import numpy
+from phydat import phycon
+
+
+# Columns of the MESSPF output, as the fields of the table
+PF_DTYPE = numpy.dtype([
+    ('temp', numpy.float64),      # K
+    ('logq', numpy.float64),      # ln(Q)
+    ('dq_dt', numpy.float64),     # d ln(Q) / dT
+    ('dq2_dt2', numpy.float64),   # d2 ln(Q) / dT2
+    ('s', numpy.float64),         # cal/mol/K
+    ('cp', numpy.float64),        # cal/mol/K
+])
+
+
+def pf_table(output_str):
+    """ Parses the MESSPF output file string for the partition function,
+        its derivatives, the entropy and the heat capacity of a single
+        species at once, into a structured array with the fields of
+        PF_DTYPE, one row per temperature (in the order of the file).
+
+        The entropy and heat capacity are NaN if they are not in the file.
+
+        :param output_str: string of lines for MESSPF output file
+        :type output_str: str
+        :rtype: numpy.ndarray
+    """
+
+    lines = [line for line in output_str.splitlines()[3:] if line.strip()]
+    pf_tab = numpy.full(len(lines), numpy.nan, dtype=PF_DTYPE)
+    if lines:
+        ncols = min(len(lines[0].split()), len(PF_DTYPE.names))
+        vals = numpy.array(
+            [line.split()[:ncols] for line in lines], dtype=numpy.float64)
+        for col, name in enumerate(PF_DTYPE.names[:ncols]):
+            pf_tab[name] = vals[:, col]
+
+    return pf_tab
+
 
 def partition_function(output_str):
     """ Parses the MESSPF output file string for the parition function
@@ -19,18 +58,12 @@ def partition_function(output_str):
         :rtype: dict[float: tuple(float)]
     """
 
-    temps, logq, dq_dt, dq2_dt2 = tuple(), tuple(), tuple(), tuple()
-    for i, line in enumerate(output_str.splitlines()):
-        if i not in (0, 1, 2):
-            tmp = line.strip().split()
-            temps += (float(tmp[0]),)
-            logq += (float(tmp[1]),)
-            dq_dt += (float(tmp[2]),)
-            dq2_dt2 += (float(tmp[3]),)
+    pf_tab = pf_table(output_str)
 
     # pf_dct = dict(zip(temps, zip(logq, dq_dt, dq2_dt2)))
     # return pf_dct
-    return temps, logq, dq_dt, dq2_dt2
+    return tuple(tuple(pf_tab[name].tolist())
+                 for name in ('temp', 'logq', 'dq_dt', 'dq2_dt2'))
 
 
 def entropy(output_str):
@@ -45,14 +78,8 @@ def entropy(output_str):
         :rtype: dict[float: tuple(float)]
     """
 
-    temps, s_t = tuple(), tuple()
-    for i, line in enumerate(output_str.splitlines()):
-        if i not in (0, 1, 2):
-            tmp = line.strip().split()
-            temps += (float(tmp[0]),)
-            s_t += (float(tmp[4]),)
-
-    s_dct = dict(zip(temps, s_t))
+    pf_tab = pf_table(output_str)
+    s_dct = dict(zip(pf_tab['temp'].tolist(), pf_tab['s'].tolist()))
 
     return s_dct
 
@@ -69,13 +96,53 @@ def heat_capacity(output_str):
         :rtype: dict[float: tuple(float)]
     """
 
-    temps, cp_t = tuple(), tuple()
-    for i, line in enumerate(output_str.splitlines()):
-        if i not in (0, 1, 2):
-            tmp = line.strip().split()
-            temps += (float(tmp[0]),)
-            cp_t += (float(tmp[5]),)
-
-    cp_dct = dict(zip(temps, cp_t))
+    pf_tab = pf_table(output_str)
+    cp_dct = dict(zip(pf_tab['temp'].tolist(), pf_tab['cp'].tolist()))
 
     return cp_dct
+
+
+def thermo_arrays(pf_tabs, temps=None, tref=298.15):
+    """ Derive the thermochemistry of many species at once from their
+        partition function tables, at a common set of temperatures:
+        H(T)-H(tref) (cal/mol), Cp (cal/mol/K) and S (cal/mol/K), each an
+        array of shape (nspecies, ntemps).
+
+        H(T)-H(0) = R T^2 dln(Q)/dT, with its derivative, R (2T dln(Q)/dT +
+        T^2 d2ln(Q)/dT2), as Cp and R (ln(Q) + T dln(Q)/dT) as S, as used by
+        MESSPF for its entropy and heat capacity columns. Values between
+        the temperatures of a table are interpolated linearly.
+
+        :param pf_tabs: partition function tables, as from `pf_table`
+        :type pf_tabs: tuple(numpy.ndarray)
+        :param temps: temperatures (K); defaults to those of the first
+            table, in increasing order
+        :type temps: tuple(float)
+        :param tref: reference temperature of the enthalpy (K)
+        :type tref: float
+        :rtype: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        :return: temps, h_t, cp_t, s_t
+    """
+
+    if temps is None:
+        temps = numpy.unique(pf_tabs[0]['temp'])
+    temps = numpy.asarray(temps, dtype=numpy.float64)
+    all_temps = numpy.append(temps, tref)
+
+    # Interpolate ln(Q) and its derivatives of each species onto the temps
+    logq, dq_dt, dq2_dt2 = (
+        numpy.empty((len(pf_tabs), len(all_temps))) for _ in range(3))
+    for i, pf_tab in enumerate(pf_tabs):
+        pf_tab = numpy.sort(pf_tab, order='temp')
+        logq[i] = numpy.interp(all_temps, pf_tab['temp'], pf_tab['logq'])
+        dq_dt[i] = numpy.interp(all_temps, pf_tab['temp'], pf_tab['dq_dt'])
+        dq2_dt2[i] = numpy.interp(
+            all_temps, pf_tab['temp'], pf_tab['dq2_dt2'])
+
+    rconst = phycon.KEL2CAL
+    h_0 = rconst * all_temps**2 * dq_dt
+    h_t = h_0[:, :-1] - h_0[:, -1:]
+    cp_t = rconst * (2.0 * all_temps * dq_dt + all_temps**2 * dq2_dt2)
+    s_t = rconst * (logq + all_temps * dq_dt)
+
+    return temps, h_t, cp_t[:, :-1], s_t[:, :-1]
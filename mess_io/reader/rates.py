@@ -5,17 +5,26 @@
 """
 
 import sys
+import functools
+import collections
 import numpy
-import pandas as pd
 import copy
 from phydat import phycon
 import autoparse.find as apf
 from mess_io.reader._label import relabel
-from mess_io.reader._label import name_label_dct
+from mess_io.reader._label import output_context
 
 # Global lists
 UNWANTED_RXN_TYPS = ('fake', 'self', 'loss', 'capture', 'reverse')
 DIRECTION_DCT = {'temp': 1000.0, 'pressure': 1.0, 'thresh': 1e-14}
+BIMOL_THRESH = 1.0e-24  # cm^3.s^-1
+# The rate constants of all reactions, as read by `ktp_table`, with
+# ktp_arr[i, j, k] the rate constant of rxns[i] at pressures[j] and temps[k]
+KtpTable = collections.namedtuple(
+    'KtpTable', ('rxns', 'pressures', 'temps', 'ktp_arr'))
+# Reasons a rate constant is filtered out, indexed by the filter codes
+FILTER_REASONS = ('valid', 'undefined', 'negative', 'threshold',
+                  'temperature', 'oscillation', 'pressure')
 
 # Functions for getting k(T,P) values from main MESS `RateOut` file
 def get_rxn_ktp_dct(out_str,
@@ -30,10 +39,12 @@ def get_rxn_ktp_dct(out_str,
         Pressures in atm.
         K(T)s in cm3/mol.s [bimol] or 1/s [unimol]
 
+        The rate constants of all reactions are read, filtered and converted
+        as a single dense table (see `ktp_table`); the dictionaries are only
+        built from that table at the end.
+
         :param output_str: string of lines of MESS output file
-        :type output_str: str
-        :param label_dct: dictionary to map name from MESS name to alternative
-        :type label_dct: dict[str: str]
+        :type output_str: str or OutputContext
         :param filter_kts: filter unphysical, insignificant rate constants
         :type filter_kts: bool
 
@@ -41,31 +52,32 @@ def get_rxn_ktp_dct(out_str,
     """
 
     # Get the MESS rxn in the tuple format ((rct,), (prd,), third_body))
-    # For each rxn pair, get rate constants, with filtering as indicated
-    rxns = reactions(out_str)
-    rxn_ktp_dct = {}
-    for rxn in rxns:
-        rxn_ktp_dct[rxn] = ktp_dct(out_str, rxn[0][0], rxn[1][0],
-                                   filter_kts=filter_kts, tmin=tmin,
-                                   tmax=tmax, pmin=pmin, pmax=pmax,
-                                   convert=convert)
+    # with the rate constants of all rxns, with filtering as indicated
+    # Note: filtering is before unit conversion, so bimolthresh is in cm^3.s^-1
+    out_ctx = output_context(out_str)
+    ktp_tab = ktp_table(out_ctx.string)
+    if filter_kts:
+        ktp_tab = filter_ktp_table(ktp_tab, tmin=tmin, tmax=tmax,
+                                   pmin=pmin, pmax=pmax)
+    if convert:
+        ktp_tab = convert_ktp_table_units(ktp_tab)
 
     # Read the reactions; filter them if requested
     if filter_reaction_types:
-        rxn_ktp_dct = filter_rxn_ktp_dct(
-            rxn_ktp_dct,
+        ktp_tab = filter_ktp_table_reactions(
+            ktp_tab,
             filter_fake=('fake' in filter_reaction_types),
             filter_self=('self' in filter_reaction_types),
             filter_loss=('loss' in filter_reaction_types),
             filter_capture=('capture' in filter_reaction_types),
             filter_reverse=('reverse' in filter_reaction_types)
         )
+    rxn_ktp_dct = ktp_table_dct(ktp_tab)
 
     # Reformat the dictionary keys to follow the tuple of tuples format
     if relabel_reactions:
-        lbl_dct = name_label_dct(out_str)
-        if lbl_dct is not None:
-            rxn_ktp_dct = relabel(rxn_ktp_dct, lbl_dct)
+        if out_ctx.lbl_dct is not None:
+            rxn_ktp_dct = relabel(rxn_ktp_dct, out_ctx)
         else:
             rxn_ktp_dct_relabeled = {}
             for key, val in rxn_ktp_dct.items():
@@ -254,8 +266,631 @@ def _parse_reactant_rate_constants(out_lines, block_start, product):
     return (fin_temps, fin_kts)
 
 
+# Functions for the dense k(T,P) table of all reactions in the `RateOut` file
+def ktp_table(out_str, third_body=(None,)):
+    """ Parses the MESS output file string for the rate constants of all
+        of the reactions, at all computed pressures, including the
+        high-pressure limit, into a single dense table
+
+            KtpTable(rxns, pressures, temps, ktp_arr)
+
+        where ktp_arr is a float64 array of shape
+        (nrxns, npressures+1, ntemps) with ktp_arr[i, j, k] the rate constant
+        of rxns[i] at pressures[j] and temps[k]. The last pressure is 'high'.
+        Rate constants that MESS does not define (i.e., '***') are NaN.
+
+        The reactions are ordered as in `reactions`.
+
+        Pressures in atm.
+        K(T)s in the units of the output: cm3/s [bimol] or 1/s [unimol]
+
+        :param out_str: string of lines of MESS output file
+        :type out_str: str
+        :param third_body: third body to use in the reaction keys
+        :type third_body: tuple(str)
+        :rtype: KtpTable
+    """
+
+    out_lines = out_str.splitlines()
+
+    # Read each block of rate constants: pressure-dependent, then high-P
+    pdep_blocks, highp_blocks = (), ()
+    section = None
+    for i, line in enumerate(out_lines):
+        if line.startswith('High Pressure Rate Coefficients'):
+            section = 'high'
+        elif line.startswith('Temperature-Species Rate Tables:'):
+            section = 'pdep'
+        elif line.startswith('____') or line.endswith('Rate Tables:'):
+            section = None
+        elif section is not None and line.startswith('Reactant ='):
+            tmp = line.split()
+            if section == 'pdep':
+                pressure = _convert_pressure(float(tmp[5]), tmp[6])
+                pdep_blocks += ((tmp[2], pressure) +
+                                _rate_constant_block(out_lines, i+1),)
+            else:
+                highp_blocks += ((tmp[2], 'high') +
+                                 _rate_constant_block(out_lines, i+1),)
+
+    # Build the reaction, pressure and temperature indices
+    rxn_idx_dct, press_idx_dct = {}, {}
+    for rct, pressure, prds, _, _ in pdep_blocks:
+        press_idx_dct.setdefault(pressure, len(press_idx_dct))
+        for prd in prds:
+            rxn_idx_dct.setdefault(((rct,), (prd,), third_body),
+                                   len(rxn_idx_dct))
+    press_idx_dct['high'] = len(press_idx_dct)
+    temps = numpy.unique(numpy.concatenate(
+        [block[3] for block in pdep_blocks + highp_blocks] or [[]]))
+
+    # Fill the table; reactions only in the high-P block are not included
+    ktp_arr = numpy.full(
+        (len(rxn_idx_dct), len(press_idx_dct), len(temps)), numpy.nan)
+    for rct, pressure, prds, blk_temps, blk_kts in pdep_blocks + highp_blocks:
+        cols, rxn_idxs = [], []
+        for col, prd in enumerate(prds):
+            rxn_idx = rxn_idx_dct.get(((rct,), (prd,), third_body))
+            if rxn_idx is not None:
+                cols.append(col)
+                rxn_idxs.append(rxn_idx)
+        temp_idxs = numpy.searchsorted(temps, blk_temps)
+        ktp_arr[numpy.array(rxn_idxs, dtype=int)[:, None],
+                press_idx_dct[pressure],
+                temp_idxs[None, :]] = blk_kts[:, cols].T
+
+    return KtpTable(tuple(rxn_idx_dct), tuple(press_idx_dct), temps, ktp_arr)
+
+
+def _rate_constant_block(out_lines, start):
+    """ Parses a block of a Temperature-Species rate table: a header of the
+        product names followed by a line of rate constants per temperature,
+        ending at the first blank line after the header.
+
+        :param out_lines: all of the lines of MESS output
+        :type out_lines: list(str)
+        :param start: line number from which to look for the header
+        :type start: int
+        :return: product names, temperatures, rate constants (ntemps, nprds)
+        :rtype: (tuple(str), numpy.ndarray, numpy.ndarray)
+    """
+
+    # Skip to the header line, which may follow a blank line
+    while not out_lines[start].strip():
+        start += 1
+    prds = tuple(out_lines[start].split()[1:])
+
+    end = start + 1
+    while end < len(out_lines) and out_lines[end].strip():
+        end += 1
+
+    # Convert all of the values at once, with the undefined ones as NaN
+    vals = numpy.array(
+        ' '.join(out_lines[start+1:end]).replace('***', 'nan').split(),
+        dtype=numpy.float64).reshape(end-start-1, len(prds)+1)
+
+    return prds, vals[:, 0], vals[:, 1:]
+
+
+def ktp_table_dct(ktp_tab):
+    """ Build the ktp dictionaries of each reaction from the dense table,
+        of the same form as those of `get_rxn_ktp_dct`; only the pressures
+        with at least one defined rate constant are included, with 'high'
+        first as in `ktp_dct`.
+
+        :param ktp_tab: table of rate constants, as from `ktp_table`
+        :type ktp_tab: KtpTable
+        :rtype: dict[tuple: dict[float: (numpy.ndarray, numpy.ndarray)]]
+    """
+
+    rxns, _pressures, temps, ktp_arr = ktp_tab
+
+    # Put the high-pressure limit first
+    order = sorted(range(len(_pressures)),
+                   key=lambda idx: _pressures[idx] != 'high')
+    _pressures = tuple(_pressures[idx] for idx in order)
+    ktp_arr = ktp_arr[:, order]
+    defined = numpy.isfinite(ktp_arr)
+
+    rxn_ktp_dct = {}
+    for rxn, rxn_kts, rxn_defined in zip(rxns, ktp_arr, defined):
+        rxn_ktp_dct[rxn] = {
+            pressure: (temps[pdefined], kts[pdefined])
+            for pressure, kts, pdefined in zip(_pressures, rxn_kts, rxn_defined)
+            if pdefined.any()}
+
+    return rxn_ktp_dct
+
+
+def filter_ktp_table(ktp_tab, tmin=None, tmax=None, pmin=None, pmax=None):
+    """ Filters out bad or undesired rate constants from the dense table,
+        setting them to NaN, following the same criteria as
+        `filter_ktp_dct` applied to each reaction.
+
+        :param ktp_tab: table of rate constants, as from `ktp_table`
+        :type ktp_tab: KtpTable
+        :rtype: KtpTable
+    """
+
+    rxns, _pressures, temps, ktp_arr = ktp_tab
+    codes = ktp_table_filter_codes(ktp_tab, tmin=tmin, tmax=tmax,
+                                   pmin=pmin, pmax=pmax)
+
+    return KtpTable(rxns, _pressures, temps,
+                    numpy.where(codes == 0, ktp_arr, numpy.nan))
+
+
+def ktp_table_filter_codes(ktp_tab,
+                           tmin=None, tmax=None, pmin=None, pmax=None):
+    """ Determine why each rate constant of the dense table is filtered out,
+        as an integer code of the same shape as the table; the codes index
+        FILTER_REASONS and 0 means the rate constant is kept.
+
+        :param ktp_tab: table of rate constants, as from `ktp_table`
+        :type ktp_tab: KtpTable
+        :rtype: numpy.ndarray(int)
+    """
+
+    rxns, _pressures, temps, ktp_arr = ktp_tab
+
+    thresh = numpy.where(bimolecular_mask(rxns), BIMOL_THRESH, 0.0)
+    codes = _kt_filter_codes(temps, ktp_arr, thresh[:, None], tmin, tmax)
+
+    outside = _outside_pressures(_pressures, pmin, pmax)
+    codes[:, outside] = numpy.where(
+        codes[:, outside] == 0, FILTER_REASONS.index('pressure'),
+        codes[:, outside])
+
+    return codes
+
+
+def convert_ktp_table_units(ktp_tab):
+    """ Convert units of the dense table from cm^3.s^-1 to cm^3.mol^-1.s^-1
+        for the bimolecular reactions
+
+        :param ktp_tab: table of rate constants, as from `ktp_table`
+        :type ktp_tab: KtpTable
+        :rtype: KtpTable
+    """
+
+    rxns, _pressures, temps, ktp_arr = ktp_tab
+    conv = numpy.where(bimolecular_mask(rxns), phycon.NAVO, 1.0)
+
+    return KtpTable(rxns, _pressures, temps, ktp_arr * conv[:, None, None])
+
+
+def filter_ktp_table_reactions(ktp_tab,
+                               filter_fake=True,
+                               filter_self=True,
+                               filter_loss=True,
+                               filter_capture=True,
+                               filter_reverse=True,
+                               direction_dct=DIRECTION_DCT):
+    """ Filter the reactions from the dense table, following the same
+        criteria as `filter_rxn_ktp_dct`
+
+        :param ktp_tab: table of rate constants, as from `ktp_table`
+        :type ktp_tab: KtpTable
+        :rtype: KtpTable
+    """
+
+    rxns, _pressures, temps, ktp_arr = ktp_tab
+
+    keep = numpy.array([
+        not ((filter_loss and prd == ('Loss',)) or
+             (filter_capture and prd == ('Capture',)) or
+             (filter_fake and any('Fake' in rgt for rgt in rct+prd)) or
+             (filter_self and rct == prd))
+        for rct, prd, _ in rxns], dtype=bool)
+    if filter_reverse:
+        keep &= desired_direction_mask(ktp_tab, direction_dct=direction_dct)
+
+    return KtpTable(tuple(rxn for rxn, rkeep in zip(rxns, keep) if rkeep),
+                    _pressures, temps, ktp_arr[keep])
+
+
+def desired_direction_mask(ktp_tab, direction_dct=DIRECTION_DCT):
+    """ Decides, for all reactions of the dense table at once, whether
+        each is written in the desired direction by comparing its forward
+        and backward rate constants, as in `is_desired_direction`.
+
+        A reaction whose reverse is not in the table is desired.
+
+        :param ktp_tab: table of rate constants, as from `ktp_table`
+        :type ktp_tab: KtpTable
+        :rtype: numpy.ndarray(bool)
+    """
+
+    rxns, _pressures, temps, ktp_arr = ktp_tab
+    targ_temp = direction_dct['temp']
+    thresh = direction_dct['thresh']
+
+    if not ktp_arr.size:
+        return numpy.ones(len(rxns), dtype=bool)
+
+    # Rate at the defined temperature closest to the target for each pressure
+    dist = numpy.where(numpy.isfinite(ktp_arr),
+                       numpy.abs(temps - targ_temp), numpy.inf)
+    tidxs = numpy.argmin(dist, axis=-1)
+    kts = numpy.take_along_axis(ktp_arr, tidxs[..., None], axis=-1)[..., 0]
+
+    # Representative rates: high-P and the average over all other pressures
+    high_kts = kts[:, -1]
+    pdep_kts = kts[:, :-1]
+    npdep = numpy.count_nonzero(numpy.isfinite(pdep_kts), axis=1)
+    avg_kts = numpy.where(
+        npdep > 0,
+        numpy.nansum(pdep_kts, axis=1) / numpy.maximum(npdep, 1),
+        1e-100)
+
+    # Pair each reaction with its reverse
+    _, _, ridxs = reaction_index(rxns)
+    has_rev = ridxs >= 0
+    ridxs = numpy.where(has_rev, ridxs, numpy.arange(len(rxns)))
+
+    # Use high-P rates if both directions have them, otherwise the average
+    has_high = numpy.isfinite(high_kts)
+    use_high = has_high & has_high[ridxs]
+    fwd_kts = numpy.where(use_high, high_kts, avg_kts)
+    bck_kts = numpy.where(use_high, high_kts[ridxs], avg_kts[ridxs])
+
+    # If unimol > unimol or bimol > bimol, larger direction is preferred
+    # If bimol > unimol (or reverse), consider the threshold value
+    rct_w = numpy.array(['W' in rxn[0][0] for rxn in rxns], dtype=bool)
+    prd_w = numpy.array(['W' in rxn[1][0] for rxn in rxns], dtype=bool)
+    rct_p = numpy.array(['P' in rxn[0][0] for rxn in rxns], dtype=bool)
+    prd_p = numpy.array(['P' in rxn[1][0] for rxn in rxns], dtype=bool)
+    is_desired = numpy.where(
+        (rct_w & prd_w) | (rct_p & prd_p),
+        fwd_kts > bck_kts,
+        numpy.where(rct_w,
+                    bck_kts / phycon.NAVO < thresh,
+                    fwd_kts / phycon.NAVO > thresh))
+
+    return is_desired | ~has_rev
+
+
+def _kt_filter_codes(temps, kts, thresh, tmin=None, tmax=None):
+    """ Determine why each rate constant of a set of k(T)s, all defined at
+        the same temperatures, is filtered out, for any number of leading
+        dimensions. A k(T) is filtered out if
+        (1) k(T) is undefined from Master Equation (i.e. k(T) is NaN)
+        (2) k(T) < 0, or T is at or below the highest T with k(T) < 0
+        (3) k(T) <= some threshold (e.g., for bimolecular reactions)
+        (4) T is outside tmin and tmax
+        (5) there are more than 2 oscillations from pos. to neg.
+        and the code of the first of these that applies is returned (0 if
+        none apply).
+
+        A requested tmin is not used for k(T)s with negative values.
+
+        :param temps: temperatures at which rate constants are defined (K)
+        :type temps: numpy.ndarray
+        :param kts: rate constants, with NaN if undefined (..., ntemps)
+        :type kts: numpy.ndarray
+        :param thresh: rate constant at or below which k(T) is filtered out,
+            broadcastable to kts[..., 0]
+        :type thresh: float or numpy.ndarray
+        :rtype: numpy.ndarray(int)
+    """
+
+    temps = numpy.asarray(temps, dtype=numpy.float64)
+    kts = numpy.asarray(kts, dtype=numpy.float64)
+
+    # Nothing to filter, e.g., for an output without any rate constants
+    if not kts.size:
+        return numpy.zeros(kts.shape, dtype=numpy.int8)
+
+    defined = numpy.isfinite(kts)
+    if tmin is not None:
+        assert tmin in temps, (f'{tmin} not in temps: {temps}')
+    tmin = temps.min() if tmin is None else tmin
+    tmax = temps.max() if tmax is None else tmax
+
+    # Find the highest temperature with a negative k(T), if any
+    neg = defined & (kts < 0.0)
+    has_neg = neg.any(axis=-1)
+    above_neg = temps.size - numpy.argmax(neg[..., ::-1], axis=-1)
+    neg_tmin = numpy.where(
+        above_neg < temps.size,
+        temps[numpy.minimum(above_neg, temps.size-1)], numpy.inf)
+    below_neg = has_neg[..., None] & (temps < neg_tmin[..., None])
+
+    # Count the sign changes (undefined k(T)s count as positive)
+    signs = numpy.sign(numpy.where(defined, kts, 1.0))
+    nsign_chgs = numpy.count_nonzero(numpy.diff(signs, axis=-1), axis=-1)
+
+    # Set the codes from the last reason to the first, so the first wins
+    codes = numpy.zeros(kts.shape, dtype=numpy.int8)
+    codes[numpy.broadcast_to((nsign_chgs > 2)[..., None], kts.shape)] = 5
+    codes[(~has_neg[..., None] & (temps < tmin)) | (temps > tmax)] = 4
+    with numpy.errstate(invalid='ignore'):
+        codes[kts <= numpy.asarray(thresh)[..., None]] = 3
+    codes[below_neg | neg] = 2
+    codes[~defined] = 1
+
+    return codes
+
+
+def _outside_pressures(_pressures, pmin=None, pmax=None):
+    """ Determine which pressures are outside of pmin and pmax; 'high'
+        never is.
+
+        :param _pressures: pressures
+        :type _pressures: tuple(float, str)
+        :rtype: numpy.ndarray(bool)
+    """
+
+    pvals = numpy.array([numpy.nan if pressure == 'high' else pressure
+                         for pressure in _pressures], dtype=numpy.float64)
+    outside = numpy.zeros(pvals.shape, dtype=bool)
+    with numpy.errstate(invalid='ignore'):
+        if pmin is not None:
+            outside |= pvals < pmin
+        if pmax is not None:
+            outside |= pvals > pmax
+
+    return outside
+
+
+def bimolecular_mask(rxns):
+    """ Determine which reactions have a bimolecular reactant, from the
+        MESS labels of the reactants
+
+        :param rxns: reactions, as from `reactions`
+        :type rxns: tuple
+        :rtype: numpy.ndarray(bool)
+    """
+    return numpy.array([(rxn[0][0][0] == 'P') or ('+' in rxn[0][0])
+                        for rxn in rxns], dtype=bool)
+
+
 # Functions for getting k(E)s and density-of-states from
 # main MESS `MicroRateOut` file
+class MicroRates():
+    """ Microcanonical rate constants [k(E)]s and densities of states read
+        from a MESS `MicroRateOut` (or `ke_ped_out`) file, stored as arrays
+        on their energy grids (kcal/mol)
+
+        :param energies: energy grid of the k(E)s and the well DOS
+        :type energies: numpy.ndarray
+        :param dos: density of states of the well on the grid (mol/kcal)
+        :type dos: numpy.ndarray
+        :param rxns: MESS labels of the reactions, as 'R->P'
+        :type rxns: tuple(str)
+        :param kes: k(E)s of each reaction on the grid, NaN if undefined
+        :type kes: numpy.ndarray
+        :param frag_energies: energy grid of the fragment DOS
+        :type frag_energies: numpy.ndarray
+        :param frags: labels of the bimolecular fragments
+        :type frags: tuple(str)
+        :param frag_dos: rovibrational DOS of each fragment on its grid
+        :type frag_dos: numpy.ndarray
+    """
+
+    def __init__(self, energies, dos, rxns, kes,
+                 frag_energies=(), frags=(), frag_dos=None):
+        self.energies = numpy.asarray(energies, dtype=float)
+        self.dos = numpy.asarray(dos, dtype=float)
+        self.rxns = tuple(rxns)
+        self.kes = numpy.asarray(kes, dtype=float).reshape(
+            len(self.rxns), len(self.energies))
+        self.frag_energies = numpy.asarray(frag_energies, dtype=float)
+        self.frags = tuple(frags)
+        self.frag_dos = numpy.asarray(
+            frag_dos if frag_dos is not None else (), dtype=float).reshape(
+                len(self.frags), len(self.frag_energies))
+        # interpolations are memoized on the queried energies
+        self._interpolate = functools.lru_cache(maxsize=256)(
+            self._interpolate_energies)
+
+    def ke(self, reactant, product, ene):
+        """ k(E) of a reaction at the energies, interpolated log-linearly
+            on the energy grid; NaN outside of the grid
+
+            :param reactant: label for the reactant used in the MESS output
+            :type reactant: str
+            :param product: label for the product used in the MESS output
+            :type product: str
+            :param ene: energies (kcal/mol)
+            :type ene: float or numpy.ndarray
+            :rtype: numpy.ndarray
+            :raises KeyError: if the reaction is not in the output
+        """
+        return self._query('ke', self._reaction_index(reactant, product), ene)
+
+    def density(self, ene):
+        """ density of states of the well at the energies (mol/kcal)
+
+            :param ene: energies (kcal/mol)
+            :type ene: float or numpy.ndarray
+            :rtype: numpy.ndarray
+        """
+        return self._query('dos', 0, ene)
+
+    def dos_rovib(self, frag, ene):
+        """ rovibrational density of states of a bimolecular fragment
+            at the energies (mol/kcal)
+
+            :param frag: label of the fragment
+            :type frag: str
+            :param ene: energies (kcal/mol)
+            :type ene: float or numpy.ndarray
+            :rtype: numpy.ndarray
+            :raises KeyError: if the fragment is not in the output
+        """
+        if frag not in self.frags:
+            raise KeyError(f'fragment {frag} not in MESS output')
+        return self._query('frag', self.frags.index(frag), ene)
+
+    def ke_dct(self, reactant, product):
+        """ k(E)s of a reaction on the energy grid, as from `ke_dct`
+
+            :rtype: dict[float: float]
+            :raises KeyError: if the reaction is not in the output
+        """
+        kes = self.kes[self._reaction_index(reactant, product)]
+        _ke_dct = {0.0: 0.0}
+        _ke_dct.update(zip(self.energies[1:].tolist(), kes[1:].tolist()))
+        return _ke_dct
+
+    def save(self, file_path):
+        """ Write the arrays to a compressed .npz file
+
+            :param file_path: path of the file
+            :type file_path: str
+        """
+        numpy.savez_compressed(
+            file_path, energies=self.energies, dos=self.dos,
+            rxns=numpy.array(self.rxns, dtype=str), kes=self.kes,
+            frag_energies=self.frag_energies,
+            frags=numpy.array(self.frags, dtype=str), frag_dos=self.frag_dos)
+
+    @classmethod
+    def load(cls, file_path):
+        """ Read the arrays written by `save`
+
+            :param file_path: path of the .npz file
+            :type file_path: str
+            :rtype: MicroRates
+        """
+        with numpy.load(file_path, allow_pickle=False) as npz:
+            return cls(npz['energies'], npz['dos'],
+                       npz['rxns'].tolist(), npz['kes'],
+                       npz['frag_energies'], npz['frags'].tolist(),
+                       npz['frag_dos'])
+
+    def _reaction_index(self, reactant, product):
+        rxn = _reaction_header(reactant, product)
+        if rxn not in self.rxns:
+            raise KeyError(f'reaction {rxn} not in MESS output')
+        return self.rxns.index(rxn)
+
+    def _query(self, kind, idx, ene):
+        ene_arr = numpy.asarray(ene, dtype=float)
+        vals = self._interpolate(kind, idx, tuple(ene_arr.ravel().tolist()))
+        return vals.reshape(ene_arr.shape)
+
+    def _interpolate_energies(self, kind, idx, enes):
+        if kind == 'frag':
+            grid, vals = self.frag_energies, self.frag_dos[idx]
+        else:
+            grid = self.energies
+            vals = self.dos if kind == 'dos' else self.kes[idx]
+        vals = loglinear_interpolate(numpy.array(enes), grid, vals)
+        vals.flags.writeable = False
+        return vals
+
+
+def micro_rates(output_str, sp_labels='auto'):
+    """ Read all of the k(E)s and densities of states of a MESS
+        `MicroRateOut` (or `ke_ped_out`) file at once
+
+        :param output_str: string of lines of MESS output file
+        :type output_str: str or OutputContext
+        :param sp_labels: type of fragment labels, as in `dos_rovib`
+        :type sp_labels: str
+        :rtype: MicroRates
+    """
+
+    out_ctx = output_context(output_str)
+    out_lines = out_ctx.lines
+
+    # k(E)s and well DOS: E, D, k(E) of each reaction
+    head_i = apf.where_in(['E, kcal/mol', 'D, mol/kcal'], out_lines)[0]
+    head = out_lines[head_i].replace('E, kcal/mol', 'E').replace(
+        'D, mol/kcal', 'D')
+    rxns = head.split()[2:]
+    ke_arr = _micro_block(out_lines, head_i+1, len(rxns)+2)
+
+    # rovibrational DOS of the fragments, if there
+    frags, frag_dos, frag_energies = (), None, ()
+    frag_i = apf.where_in(
+        'Bimolecular fragments density of states, mol/kcal', out_lines)
+    if len(frag_i) > 0:
+        mess_labels = out_lines[frag_i[0]+1].strip().split()[2:]
+        frag_arr = _micro_block(out_lines, frag_i[0]+2, len(mess_labels)+1)
+        frag_labels = _fragment_labels(
+            mess_labels, out_ctx.lbl_dct, sp_labels)
+        # keep the first column of each fragment
+        cols = [frag_labels.index(frag) for frag in dict.fromkeys(frag_labels)]
+        frags = tuple(frag_labels[col] for col in cols)
+        frag_energies = frag_arr[:, 0]
+        frag_dos = frag_arr[:, 1:][:, cols].T
+
+    return MicroRates(ke_arr[:, 0], ke_arr[:, 1], rxns, ke_arr[:, 2:].T,
+                      frag_energies, frags, frag_dos)
+
+
+def loglinear_interpolate(ene, grid, vals):
+    """ Interpolate values on an increasing energy grid linearly in
+        log(value), or linearly where the value is not positive, with
+        NaN outside of the grid
+
+        :param ene: energies to interpolate at
+        :type ene: numpy.ndarray
+        :param grid: energy grid
+        :type grid: numpy.ndarray
+        :param vals: values on the grid
+        :type vals: numpy.ndarray
+        :rtype: numpy.ndarray
+    """
+    ene = numpy.asarray(ene, dtype=float)
+    idx = numpy.clip(
+        numpy.searchsorted(grid, ene, side='right') - 1, 0, len(grid) - 2)
+    ene0, ene1 = grid[idx], grid[idx+1]
+    val0, val1 = vals[idx], vals[idx+1]
+    frac = (ene - ene0) / (ene1 - ene0)
+    pos = (val0 > 0) & (val1 > 0)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        log_vals = numpy.exp(
+            numpy.log(val0) + frac * (numpy.log(val1) - numpy.log(val0)))
+    interp = numpy.where(pos, log_vals, val0 + frac * (val1 - val0))
+    interp[(ene < grid[0]) | (ene > grid[-1])] = numpy.nan
+    return interp
+
+
+def _micro_block(out_lines, start, ncols):
+    """ Read the rows of numbers of a block into an array, with the
+        undefined (***) values as NaN
+    """
+    end = start
+    while (end < len(out_lines) and out_lines[end].strip()
+           and out_lines[end].split()[0][0] in '0123456789.+-'):
+        end += 1
+    vals = ' '.join(out_lines[start:end]).replace('***', 'nan').split()
+    return numpy.array(vals, dtype=float).reshape(end-start, ncols)
+
+
+def _fragment_labels(mess_labels, lbl_dct, sp_labels):
+    """ Names of the fragments with MESS labels 'Pi_n', the n-th species
+        of bimolecular Pi
+    """
+    if sp_labels == 'auto':
+        sp_labels = 'out'*(not lbl_dct) + 'inp'*(not not lbl_dct)
+
+    _labels = []
+    if sp_labels in ('inp', 'out'):
+        for sp in mess_labels:
+            bim, frag_n = sp.split('_')
+            if sp_labels == 'inp':
+                sp_tosplit = lbl_dct[bim]
+            elif sp_labels == 'out':
+                sp_tosplit = bim
+            try:
+                _labels.append(sp_tosplit.split('+')[int(frag_n)])
+            except IndexError:
+                print('*Error: bimol species should be named as P1+P2 \
+                    with P1, P2 being the fragment names')
+                sys.exit()
+    else:
+        print('*Error: sp_labels must be "inp" (as in mess input) \
+            or "out" (as in mess output)')
+        sys.exit()
+
+    return _labels
+
+
 def ke_dct(output_str, reactant, product):
     """ Parses the MESS output file string for the microcanonical
         rate constants [k(E)]s for a single reaction.
@@ -269,26 +904,7 @@ def ke_dct(output_str, reactant, product):
         :return rate_constants: all high-P rate constants for the reaction
         :rtype dict[float: float]
     """
-
-    # Form string for reaction header using reactant and product name
-    reaction = _reaction_header(reactant, product)
-
-    # Break up the file into lines
-    out_lines = output_str.split('\n')
-
-    # Determine col idx where reaction is
-    head = out_lines[0].replace('E, kcal/mol', 'E').replace('D, mol/kcal', 'D')
-    headers = head.split()
-    col_idx = headers.index(reaction)
-
-    _ke_dct = {0.0: 0.0}
-    for i, line in enumerate(out_lines):
-        if i not in (0, 1):
-            tmp = line.strip().split()
-            if tmp:
-                _ke_dct[float(tmp[0])] = float(tmp[col_idx])
-
-    return _ke_dct
+    return micro_rates(output_str, sp_labels='out').ke_dct(reactant, product)
 
 
 def dos_rovib(ke_ped_out, sp_labels='auto'):
@@ -298,7 +914,7 @@ def dos_rovib(ke_ped_out, sp_labels='auto'):
         units: kcal/mol, and for dos mol/kcal
 
         :param ke_ped_out: string of lines of microcanonical rates output file
-        :type ke_ped_out: str
+        :type ke_ped_out: str or OutputContext
         :param sp_labels: type of pedspecies labels: 'inp' is how you find them
                 in mess input, 'out' is how they are labeled in the output
                 'auto' sets 'inp' if it finds lbl dct
@@ -307,40 +923,22 @@ def dos_rovib(ke_ped_out, sp_labels='auto'):
                         with the density of states
         :rtype dos_df: dataframe(float)
     """
-    # get label dictionary
-    lbl_dct = name_label_dct(ke_ped_out)
-    if sp_labels == 'auto':
-        sp_labels = 'out'*(not lbl_dct) + 'inp'*(not not lbl_dct)
+    # pandas is only needed (and imported) for the returned DataFrame
+    import pandas as pd  # pylint: disable=import-outside-toplevel
 
-    ke_lines = ke_ped_out.splitlines()
+    ke_ctx = output_context(ke_ped_out)
+    ke_lines = ke_ctx.lines
 
     i_in = apf.where_in(
         'Bimolecular fragments density of states, mol/kcal', ke_lines)[0]+2
     mess_labels = ke_lines[i_in-1].strip().split()[2:]
-    en_dos_all = numpy.array(
-        [line.strip().split() for line in ke_lines[i_in:]], dtype=float).T
-    energy = en_dos_all[:][0]
-    dos_all = en_dos_all[:][1:].T
+    en_dos_all = _micro_block(ke_lines, i_in, len(mess_labels)+1)
+    energy = en_dos_all[:, 0]
+    dos_all = en_dos_all[:, 1:]
 
     # relabel if necessary
-    _labels = []
-    if sp_labels == 'inp' or sp_labels == 'out':
-        for sp in mess_labels:
-            bim, frag_n = sp.split('_')
-            if sp_labels == 'inp':
-                sp_tosplit = lbl_dct[bim]
-            elif sp_labels == 'out':
-                sp_tosplit = bim
-            try:
-                _labels.append(sp_tosplit.split('+')[int(frag_n)])
-            except IndexError:
-                print('*Error: bimol species should be named as P1+P2 \
-                    with P1, P2 being the fragment names')
-                sys.exit()
-    else:
-        print('*Error: sp_labels must be "inp" (as in mess input) \
-            or "out" (as in mess output)')
-        sys.exit()
+    _labels = _fragment_labels(
+        mess_labels, ke_ctx.lbl_dct, sp_labels)
 
     dos_rovib_df = pd.DataFrame(dos_all, index=energy, columns=_labels)
     # drop potentially duplicate columns WARNING CHECK THE EFFECT OF THIS
@@ -360,6 +958,9 @@ def energies(output_str):
         :rtype series(index=name), series(index=(reac,prod))
     """
 
+    # pandas is only needed (and imported) for the returned Series
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     # Break up the file into lines
     out_lines = numpy.array(output_str.split('\n\n'))
     headers = ['Wells', 'Bimolecular Products',
@@ -687,21 +1288,36 @@ def reactions(out_str, third_body=(None,)):
     # Reactant = <reactant>
     #
     # T(K) <prod1> <prod2> ... Loss Capture
-    rxns = ()
+    rxns = []
     for i, line in enumerate(reac_lines):
         if 'Reactant = ' in line and 'Pressure =' in line:
             _reac = line.strip().split()[2]
             _prods = reac_lines[i+2].strip().split()[1:]
             for _prod in _prods:
-                rxns += (
-                    ((_reac,), (_prod,), third_body),
-                )
+                rxns.append(((_reac,), (_prod,), third_body))
+
+    # Remove duplicates while preserving order
+    return tuple(dict.fromkeys(rxns))
+
+
+def reaction_index(rxns):
+    """ Index a set of reactions: the unique reactions, in order, a
+        dictionary from each reaction to its position, and the position
+        of the reverse of each reaction (-1 if it is not in the set).
+
+        :param rxns: reactions, as from `reactions`
+        :type rxns: tuple
+        :rtype: (tuple, dict[tuple: int], numpy.ndarray(int))
+    """
 
-    # Remove duplcates while preserving order
-    rxns = tuple(n for i, n in enumerate(rxns)
-                 if n not in rxns[:i])
+    rxn_idx_dct = {}
+    for rxn in rxns:
+        rxn_idx_dct.setdefault(rxn, len(rxn_idx_dct))
+    rev_idxs = numpy.array(
+        [rxn_idx_dct.get((prd, rct, tbody), -1)
+         for rct, prd, tbody in rxn_idx_dct], dtype=int)
 
-    return rxns
+    return tuple(rxn_idx_dct), rxn_idx_dct, rev_idxs
 
 
 def filter_rxn_ktp_dct(rxn_ktp_dct,
@@ -709,10 +1325,18 @@ def filter_rxn_ktp_dct(rxn_ktp_dct,
                        filter_self=True,
                        filter_loss=True,
                        filter_capture=True,
-                       filter_reverse=True):
+                       filter_reverse=True,
+                       direction_dct=DIRECTION_DCT):
     """ Filter the reactions from a ktp dictionary
+
+        The representative rate constants used to choose the direction of
+        each reaction (see `is_desired_direction`) are computed once for
+        every reaction, rather than for each reaction and its reverse.
     """
 
+    if filter_reverse:
+        rate_dct = representative_rates(rxn_ktp_dct, direction_dct['temp'])
+
     filt_rxn_ktp_dct = {}
     for rxn, ktp_dct in rxn_ktp_dct.items():
         rct, prd, tbody = rxn
@@ -733,9 +1357,15 @@ def filter_rxn_ktp_dct(rxn_ktp_dct,
             if filter_self:
                 continue
         if filter_reverse:
-            is_desired = is_desired_direction(rxn, rxn_ktp_dct)
-            if not is_desired:
-                continue
+            rev_rxn = (prd, rct, tbody)
+            if rev_rxn in rate_dct:
+                if not ktp_dct and not rxn_ktp_dct[rev_rxn]:
+                    print(f'Error: both directions empty for the rxn {rxn}')
+                is_desired = _is_desired_direction(
+                    rxn, rate_dct[rxn], rate_dct[rev_rxn],
+                    direction_dct['thresh'])
+                if not is_desired:
+                    continue
         # If continues not hit, reaction good to be added to new dct
         filt_rxn_ktp_dct[rxn] = ktp_dct
 
@@ -754,187 +1384,174 @@ def is_desired_direction(rxn, rxn_ktp_dct, direction_dct=DIRECTION_DCT):
         :rtype: bool
     """
 
-    def get_avg(ktp_dct, targ_temp, pressures):
-        """ Gets a singular rate constant at a desired temp and pressure
-        """
-        rate_sum = 0
-        nrates = 0  # number of forward rates (i.e., not NaNs)
-        # Get forward rates
-        for pressure in pressures:
-            curr_temps = ktp_dct[pressure][0]
-            tidx = (numpy.abs(numpy.array(curr_temps) - targ_temp)).argmin()
-            curr_rate = ktp_dct[pressure][1][tidx]
-            if not numpy.isnan(curr_rate):
-                rate_sum += curr_rate
-                nrates += 1
-        # Average
-        if nrates == 0:  # if nothing was found!
-            rate_avg = 1e-100
-        else:
-            rate_avg = rate_sum / nrates
-
-        return rate_avg
-
-    # Load things
     rct, prd, tbody = rxn
     targ_temp = direction_dct['temp']
-    thresh = direction_dct['thresh']
     fwd_ktp_dct = rxn_ktp_dct[rxn]
     bck_ktp_dct = rxn_ktp_dct[(prd, rct, tbody)]
     if fwd_ktp_dct == {} and bck_ktp_dct == {}:
         print(f'Error: both directions empty for the rxn {rxn}')
-    #if fwd_ktp_dct == {}:
-    #    return False
-    #if bck_ktp_dct == {}:
-    #    return True
+
+    return _is_desired_direction(
+        rxn,
+        _representative_rate(fwd_ktp_dct, targ_temp),
+        _representative_rate(bck_ktp_dct, targ_temp),
+        direction_dct['thresh'])
+
+
+def representative_rates(rxn_ktp_dct, targ_temp=DIRECTION_DCT['temp']):
+    """ Get the rate constants used to compare the directions of each
+        reaction of a ktp dictionary: the high-pressure rate constant
+        and the average over all other pressures, each at the temperature
+        closest to the target.
+
+        :param rxn_ktp_dct: ktp dictionaries of each reaction
+        :type rxn_ktp_dct: dict[tuple: dict]
+        :param targ_temp: target temperature (K)
+        :type targ_temp: float
+        :return: high-P rate (None if there is none), average rate
+        :rtype: dict[tuple: (float, float)]
+    """
+    return {rxn: _representative_rate(ktp_dct, targ_temp)
+            for rxn, ktp_dct in rxn_ktp_dct.items()}
+
+
+def _representative_rate(ktp_dct, targ_temp):
+    """ Gets the high-pressure rate constant and the average of the rate
+        constants at all other pressures at the target temperature
+    """
+
+    def _rate(pressure):
+        temps, kts = ktp_dct[pressure]
+        tidx = numpy.abs(numpy.asarray(temps) - targ_temp).argmin()
+        kt_i = kts[tidx]
+        return numpy.nan if kt_i is None else float(kt_i)
+
+    high_rate = None
+    if 'high' in ktp_dct:
+        high_rate = _rate('high')
+        high_rate = 1e-100 if numpy.isnan(high_rate) else high_rate
+
+    # Average, ignoring NaNs; if nothing was found, use a tiny rate
+    pdep_rates = [_rate(pressure) for pressure in ktp_dct
+                  if pressure != 'high']
+    pdep_rates = [rate for rate in pdep_rates if not numpy.isnan(rate)]
+    avg_rate = (sum(pdep_rates) / len(pdep_rates) if pdep_rates else
+                1e-100)
+
+    return high_rate, avg_rate
+
+
+def _is_desired_direction(rxn, fwd_rates, bck_rates, thresh):
+    """ Decides whether the current direction is the desired one from the
+        representative rates of both directions
+    """
+
+    rct, prd, _ = rxn
 
     # Determine the molecularity of the reaction
-    unimol_unimol = False
-    bimol_bimol = False
-    unimol_bimol = False
-    if 'W' in rct[0] and 'W' in prd[0]:  # unimol to unimol
-        unimol_unimol = True
-    if 'P' in rct[0] and 'P' in prd[0]:  # bimol to bimol
-        bimol_bimol = True
+    unimol_unimol = 'W' in rct[0] and 'W' in prd[0]
+    bimol_bimol = 'P' in rct[0] and 'P' in prd[0]
 
     # Get rate value to use for comparison
     # If both directions have 'high' values, use that at target T
-    if 'high' in fwd_ktp_dct.keys() and 'high' in bck_ktp_dct.keys():
-        fwd_avg = get_avg(fwd_ktp_dct, targ_temp, ['high'])
-        bck_avg = get_avg(bck_ktp_dct, targ_temp, ['high'])
     # Otherwise, average over all pressures except 'high' at target T
-    else: 
-        fwd_pressures = [key for key in fwd_ktp_dct.keys() if key != 'high']
-        bck_pressures = [key for key in bck_ktp_dct.keys() if key != 'high']
-        fwd_avg = get_avg(fwd_ktp_dct, targ_temp, fwd_pressures)
-        bck_avg = get_avg(bck_ktp_dct, targ_temp, bck_pressures)
+    (fwd_high, fwd_avg), (bck_high, bck_avg) = fwd_rates, bck_rates
+    if fwd_high is not None and bck_high is not None:
+        fwd_avg, bck_avg = fwd_high, bck_high
 
     # Finally, determine whether the current direction is desired
-    # If unimol > unimol or bimol > bimol, larger direction is preferred 
-    is_desired = False
-    if unimol_unimol or bimol_bimol:
-        if fwd_avg > bck_avg:
-            is_desired = True
+    # If unimol > unimol or bimol > bimol, larger direction is preferred
     # If bimol > unimol (or reverse), consider the threshold value
-    else:
-        if 'W' in rct[0]:  # written as unimol to bimol
-            if bck_avg / phycon.NAVO < thresh:  # if bimol less than thresh
-                    is_desired = True
-        else:  # written as bimol to unimol
-            if fwd_avg / phycon.NAVO > thresh:  # if bimol greater than thresh
-                is_desired = True
-        
+    if unimol_unimol or bimol_bimol:
+        is_desired = fwd_avg > bck_avg
+    elif 'W' in rct[0]:  # written as unimol to bimol
+        is_desired = bck_avg / phycon.NAVO < thresh
+    else:  # written as bimol to unimol
+        is_desired = fwd_avg / phycon.NAVO > thresh
+
     return is_desired
-            
+
 
 def filter_ktp_dct(_ktp_dct, bimol,
                    tmin=None, tmax=None, pmin=None, pmax=None):
-    """ Filters out bad or undesired rate constants from a ktp dictionary
-    """
-
-    def get_valid_tk(temps, kts, bimol, tmin=None, tmax=None,
-                     bimolthresh=1.0e-24):
-        """ Takes in lists of temperature-rate constant pairs [T,k(T)]
-            and removes invalid pairs for which
-            (1) k(T) < 0
-            (2) k(T) is undefined from Master Equation (i.e. k(T) is None)
-            (3) k(T) < some threshold for bimolecular reactions, or
-            (4) T is outside the cutoff
-            (5) there are more than 2 oscillations from pos. to neg.
-
-            :param temps: temperatures at which rate constants are defined (K)
-            :type temps: list(float)
-            :param kts: rate constants (s-1 or cm^3.s-1)
-            :type kts: list(str, float)
-            :param bimol: whether or not the reaction is bimolecular
-            :type bimol: Bool
-            :param bimolthresh: threshold below which bimolecular rate
-                constants will be removed (cm^3.s^-1)
-            :type bimolthresh: float
-            :return valid_t: List of vaild temperatures
-            :return valid_k: List of vaild rate constants
-            :rtype: (numpy.ndarray, numpy.ndarray)
-            """
-
-        # bimolthresh = 1.0e-60
-        bimolthresh = 1.0e-24
-        # Set max temperature
-        if tmax is None:
-            tmax = max(temps)
-
-        # Set min temperature to user input, if none use either
-        # min of input temperatures or
-        # if negative kts are found, set min temp to be just above highest neg.
-        max_neg_idx = None
-        sing_kts = []  # empty list that won't have any Nones
-        for kt_idx, sing_kt in enumerate(kts):
-            # find idx for max temperature for which kt is negative, if any
-            float_sing_kt = float(sing_kt) if sing_kt is not None else 1.0
-            if float_sing_kt < 0.0:
-                max_neg_idx = kt_idx
-            sing_kts.append(float_sing_kt) 
-
-        #   Otherwise, use requested tmin value or minimum of input temps
-        # Set tmin to None (i.e., no valid k(T)) if highest T has neg. k(T)
-        if max_neg_idx is not None:
-            # If negative values found:
-            #   Set tmin to highest T where k(T) is non-negative
-            if max_neg_idx+1 < len(temps):
-                tmin = temps[max_neg_idx+1]
-            else:
-                tmin = None
-        else:
-            # Otherwise, use requested tmin value or minimum of input temps
-            if tmin is None:
-                tmin = min(temps)
-            else:
-                assert tmin in temps, (f'{tmin} not in temps: {temps}')
-
-        # Grab the temperature, rate constant pairs which correspond to
-        # temp > 0, temp within tmin and tmax, rate constant defined (not ***)
-        valid_t, valid_k = [], []
-        if tmin is not None and tmax is not None:
-            for temp, sing_kt in zip(temps, kts):
-                if sing_kt is None:
-                    continue
-                kthresh = 0.0 if not bimol else bimolthresh
-                if float(sing_kt) > kthresh and tmin <= temp <= tmax:
-                    valid_t.append(temp)
-                    valid_k.append(sing_kt)
+    """ Filters out bad or undesired rate constants from a ktp dictionary.
+
+        Takes in lists of temperature-rate constant pairs [T,k(T)] at each
+        pressure and removes invalid pairs for which
+        (1) k(T) < 0
+        (2) k(T) is undefined from Master Equation (i.e. k(T) is None)
+        (3) k(T) < some threshold for bimolecular reactions, or
+        (4) T is outside the cutoff
+        (5) there are more than 2 oscillations from pos. to neg.
+        then removes the pressures without any valid pairs or outside
+        pmin and pmax ('high' is untouched). See `ktp_dct_filter_reasons`
+        for why each pair is removed.
+
+        :param _ktp_dct: rate constants (s-1 or cm^3.s-1) at each pressure
+        :type _ktp_dct: dict[float: (tuple(float), tuple(float))]
+        :param bimol: whether or not the reaction is bimolecular
+        :type bimol: Bool
+        :rtype: dict[float: (numpy.ndarray, numpy.ndarray)]
+    """
 
-        # Check for sign changes
-        allowed = 2  # number of allowed changes
-        sing_kts = numpy.array(sing_kts)
-        nsign_chgs = numpy.count_nonzero((numpy.diff(numpy.sign(sing_kts)) != 0) * 1)
-        if nsign_chgs > allowed:
-            valid_t, valid_k = [], []
+    filt_ktp_dct = {}
+    for pressure, (temps, kts, codes) in _ktp_dct_filter_codes(
+            _ktp_dct, bimol, tmin, tmax, pmin, pmax).items():
+        keep = codes == 0
+        if keep.any():
+            filt_ktp_dct[pressure] = (temps[keep], kts[keep])
 
-        # Convert the lists to numpy arrays
-        valid_t = numpy.array(valid_t, dtype=numpy.float64)
-        valid_k = numpy.array(valid_k, dtype=numpy.float64)
+    return filt_ktp_dct
 
-        return valid_t, valid_k
 
-    # Filter the kts based on temps, negatives, None, and bimolthresh
-    filt_ktp_dct = {}
-    for pressure, (temps, kts) in _ktp_dct.items():
-        filt_temps, filt_kts = get_valid_tk(temps, kts, bimol, tmin, tmax)
-        if filt_kts.size > 0:
-            filt_ktp_dct[pressure] = (filt_temps, filt_kts)
-
-    # Remove undesired pressures if pmin and/or pmax were given (leaves 'high'
-    # untouched if it is present)
-    _pressures = tuple(pressure for pressure in filt_ktp_dct
-                       if pressure != 'high')
-    for pressure in _pressures:
-        if pmin is not None:
-            if pressure < pmin:
-                filt_ktp_dct.pop(pressure)
-        if pmax is not None:
-            if pressure > pmax:
-                filt_ktp_dct.pop(pressure)
+def ktp_dct_filter_reasons(_ktp_dct, bimol,
+                           tmin=None, tmax=None, pmin=None, pmax=None):
+    """ Determine why each rate constant of a ktp dictionary is filtered
+        out by `filter_ktp_dct`, as one of FILTER_REASONS ('valid' if
+        it is kept).
 
-    return filt_ktp_dct
+        :param _ktp_dct: rate constants (s-1 or cm^3.s-1) at each pressure
+        :type _ktp_dct: dict[float: (tuple(float), tuple(float))]
+        :param bimol: whether or not the reaction is bimolecular
+        :type bimol: Bool
+        :rtype: dict[float: tuple(str)]
+    """
+    return {
+        pressure: tuple(FILTER_REASONS[code] for code in codes)
+        for pressure, (_, _, codes) in _ktp_dct_filter_codes(
+            _ktp_dct, bimol, tmin, tmax, pmin, pmax).items()}
+
+
+def _ktp_dct_filter_codes(_ktp_dct, bimol,
+                          tmin=None, tmax=None, pmin=None, pmax=None):
+    """ Determine the filter codes of all rate constants of a ktp dictionary,
+        handling all pressures with the same temperatures at once.
+
+        :rtype: dict[float: (numpy.ndarray, numpy.ndarray, numpy.ndarray)]
+    """
+
+    # Group the pressures by their temperatures; usually there is one group
+    press_grps = {}
+    for pressure, (temps, _) in _ktp_dct.items():
+        press_grps.setdefault(tuple(temps), []).append(pressure)
+
+    # Note: bimolthresh is in cm^3.s^-1
+    thresh = BIMOL_THRESH if bimol else 0.0
+    outside = dict(zip(_ktp_dct, _outside_pressures(tuple(_ktp_dct),
+                                                    pmin, pmax)))
+    code_dct = {}
+    for temps, press_grp in press_grps.items():
+        temps = numpy.array(temps, dtype=numpy.float64)
+        kts = numpy.array([_ktp_dct[pressure][1] for pressure in press_grp],
+                          dtype=numpy.float64)
+        codes = _kt_filter_codes(temps, kts, thresh, tmin, tmax)
+        for pressure, pkts, pcodes in zip(press_grp, kts, codes):
+            if outside[pressure]:
+                pcodes[pcodes == 0] = FILTER_REASONS.index('pressure')
+            code_dct[pressure] = (temps, pkts, pcodes)
+
+    # Keep the order of the pressures in the dictionary
+    return {pressure: code_dct[pressure] for pressure in _ktp_dct}
 
 
 def convert_units(_ktp_dct, bimol):
@@ -960,7 +1577,7 @@ def filter_reactions(rxns,
         Leaving this function here for the sake of _wellextend.py
     """
 
-    filt_rxns = ()
+    filt_rxns, filt_rxn_set = [], set()
     for rxn in rxns:
         rct, prd, tbody = rxn
         if prd == ('Loss',):
@@ -980,9 +1597,10 @@ def filter_reactions(rxns,
             if filter_self:
                 continue
         if filter_reverse:
-            if (prd, rct, tbody) in filt_rxns:
+            if (prd, rct, tbody) in filt_rxn_set:
                 continue
         # If continues not hit, reaction good to be added to new dct
-        filt_rxns += (rxn,)
+        filt_rxns.append(rxn)
+        filt_rxn_set.add(rxn)
 
-    return filt_rxns
+    return tuple(filt_rxns)
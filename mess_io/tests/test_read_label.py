@@ -5,6 +5,7 @@ import os
 from ioformat import pathtools
 from mess_io.reader import relabel
 from mess_io.reader import name_label_dct
+from mess_io.reader import output_context
 
 
 
@@ -21,6 +22,28 @@ def test_name_label_dct():
     assert lbl_dct == LBL_DCT
 
 
+def test_output_context():
+    """ test mess_io._label.output_context
+        test mess_io._label.relabel
+    """
+    log_ctx = output_context(HOT_LOG_DBL)
+    assert output_context(log_ctx) is log_ctx
+    assert log_ctx.lbl_dct == LBL_DCT
+    assert log_ctx.inv_lbl_dct['C2H4+CH3'] == 'P1'
+    assert log_ctx.lines[0] == HOT_LOG_DBL.splitlines()[0]
+
+    rxn_ktp_dct = {(('W1',), ('P1',), (None,)): 1.0,
+                   (('P2',), ('W2',), ('M',)): 2.0,
+                   (('W3',), ('P1',), (None,)): 3.0}
+    ref_rxn_ktp_dct = {
+        (('CH3CH2CH2',), ('C2H4', 'CH3'), (None,)): 1.0,
+        (('CH3CHCH2', 'H'), ('CH3CHCH3',), ('M',)): 2.0,
+        (('W3',), ('C2H4', 'CH3'), (None,)): 3.0}
+    assert relabel(rxn_ktp_dct, LBL_DCT) == ref_rxn_ktp_dct
+    assert relabel(rxn_ktp_dct, log_ctx) == ref_rxn_ktp_dct
+
+
 if __name__ == '__main__':
     test_name_label_dct()
+    test_output_context()
     # test_relabel() #todo
@@ -76,6 +76,28 @@ def test_ped_get_ped():
         atol=1e-3, rtol=1e-3)
 
 
+
+def test_ped_store():
+    """ test mess_io.reader.ped.ped_store
+    """
+    energy_dct2 = {'W0': 0.0, 'C3H8+H': 0.0, 'CH3CH2CH2+H2': -3.53, 'CH3CHCH3+H2': -6.58,
+                   'B0': 0.0, 'B1': 10.19, 'B2': 7.67}
+    store = mess_io.reader.ped.ped_store(PED_OUT_DBL, energy_dct2)
+    keys, offsets, energies, probs = store
+    assert len(offsets) == len(keys) + 1
+    assert offsets[-1] == len(energies) == len(probs)
+
+    ped_dct = mess_io.reader.ped.ped_store_dct(store)
+    ped_dct2 = mess_io.reader.ped.get_ped(PED_OUT_DBL, energy_dct2)
+    for (label, pressure, temp, init_energy), (ene, prob) in ped_dct.items():
+        assert init_energy is None
+        assert np.all(np.diff(ene) > 0)
+        assert max(prob) <= 1.
+        ped = ped_dct2[label][pressure][temp]
+        assert np.allclose(ped.index, ene) and np.allclose(ped.values, prob)
+
+
 if __name__ == '__main__':
     test_ped_names()
     test_ped_get_ped()
+    test_ped_store()
@@ -177,3 +177,30 @@ def test__thermo():
     for temp in sorted(list(s_dct.keys())):
         assert numpy.allclose(s_dct[temp], ref_s_dct[temp])
         assert numpy.allclose(cp_dct[temp], ref_cp_dct[temp])
+
+
+def test__pf_table():
+    """ test mess_io.reader.pfs.pf_table
+        test mess_io.reader.pfs.thermo_arrays
+    """
+
+    pf_tab = mess_io.reader.pfs.pf_table(OUT_STR)
+    assert pf_tab.shape == (31,)
+    assert numpy.isclose(pf_tab['temp'][-1], 298.2)
+    assert numpy.allclose(pf_tab[2].tolist(), (
+        300.0, 63.7557, 0.0123154, -2.28447e-05, 134.037, 10.5982))
+
+    # files without the entropy and heat capacity
+    pf_tab2 = mess_io.reader.pfs.pf_table(
+        pathtools.read_file(OUT_PATH, 'pf.dat2'))
+    assert numpy.allclose(pf_tab2['logq'], pf_tab['logq'])
+    assert numpy.all(numpy.isnan(pf_tab2['s']))
+
+    # the derived S and Cp are those of MESSPF
+    temps, h_t, cp_t, s_t = mess_io.reader.pfs.thermo_arrays(
+        (pf_tab, pf_tab2), temps=(300.0, 1000.0, 2000.0))
+    assert h_t.shape == cp_t.shape == s_t.shape == (2, 3)
+    assert numpy.allclose(cp_t[0], (10.5982, 97.1045, 652.913), rtol=1e-4)
+    assert numpy.allclose(s_t[1], (134.037, 175.279, 373.392), rtol=1e-4)
+    assert numpy.allclose(h_t[0], h_t[1])
+    assert 0.0 < h_t[0, 0] < 10.5982 * (300.0 - 298.15) * 1.01
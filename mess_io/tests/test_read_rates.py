@@ -2,7 +2,9 @@
 """
 
 import os
+import tempfile
 import numpy
+import pytest
 import automol.util.dict_
 from ioformat import pathtools
 import mess_io.reader
@@ -17,8 +19,10 @@ KTP_INP_STR = pathtools.read_file(INP_PATH, 'example.inp')
 KTP_OUT_STR = pathtools.read_file(OUT_PATH, 'rate.out')
 KTP_OUT_BAR_STR = pathtools.read_file(OUT_PATH, 'rate.out_bar')
 KTP_OUT_TORR_STR = pathtools.read_file(OUT_PATH, 'rate.out_torr')
+KTP_TAB_OUT_STR = pathtools.read_file(INP_PATH, 'rate.out')
 KE_OUT_STR = pathtools.read_file(OUT_PATH, 'ke.out')
 KE_PED_OUT_DBL = pathtools.read_file(OUT_PATH, 'ke_ped_c3h8_h.out')
+TMP_DIR = tempfile.mkdtemp()
 
 # Set the REACTANT and PRODUCT
 REACTANT = 'F1'
@@ -122,6 +126,177 @@ def test__ktp_dct():
     assert numpy.allclose(ref_ktp_dct[1.0], tktorr)
 
 
+def test__ktp_table():
+    """ test mess_io.reader.rates.ktp_table
+        test mess_io.reader.rates.ktp_table_dct
+        test mess_io.reader.rates.filter_ktp_table
+    """
+
+    ktp_tab = mess_io.reader.rates.ktp_table(KTP_TAB_OUT_STR)
+    rxns, pressures, temps, ktp_arr = ktp_tab
+    assert ktp_tab.ktp_arr is ktp_arr and ktp_tab.pressures == pressures
+
+    assert rxns == mess_io.reader.rates.reactions(KTP_TAB_OUT_STR)
+    assert pressures == (1.0, 'high')
+    assert numpy.allclose(
+        temps, (500., 800., 1000., 1300., 1500., 1800., 2000., 2300.))
+    assert ktp_arr.shape == (72, 2, 8)
+
+    # C5H4CH3 -> C5H5CH2-1 at 1 atm and high pressure
+    assert numpy.allclose(
+        ktp_arr[0],
+        ((4.12e-05, 154.0, 1.74e+04, 4.38e+05,
+          1.01e+06, 3.44e+06, 1.08e+07, 4.67e+07),
+         (4.15e-05, 184.0, 3.38e+04, 4.46e+06,
+          4.02e+07, 4.46e+08, 1.5e+09, 6.34e+09)))
+    # C5H4CH3 -> C5H5CH2-2 is undefined at high pressure
+    assert numpy.all(numpy.isnan(ktp_arr[2, 1]))
+
+    # The dictionary view only has the defined rate constants
+    rxn_ktp_dct = mess_io.reader.rates.ktp_table_dct(ktp_tab)
+    assert tuple(rxn_ktp_dct[rxns[2]].keys()) == (1.0,)
+    assert tuple(rxn_ktp_dct[rxns[0]].keys()) == ('high', 1.0)
+
+    filt_tab = mess_io.reader.rates.filter_ktp_table(
+        ktp_tab, tmin=800.0, tmax=2000.0)
+    assert numpy.all(numpy.isnan(filt_tab.ktp_arr[:, :, (0, 7)]))
+    assert numpy.allclose(filt_tab.ktp_arr[0, :, 1:7], ktp_arr[0, :, 1:7])
+
+    rxn_ktp_dct = mess_io.reader.rates.get_rxn_ktp_dct(
+        KTP_TAB_OUT_STR, relabel_reactions=False)
+    assert len(rxn_ktp_dct) == 18
+    assert not any(rxn[1] in (('Loss',), ('Capture',))
+                   for rxn in rxn_ktp_dct)
+
+
+def test__ktp_table_empty():
+    """ test mess_io.reader.rates.get_rxn_ktp_dct on outputs without any
+        rate constant tables
+    """
+
+    for out_str in (KTP_OUT_BAR_STR, KTP_OUT_TORR_STR):
+        ktp_tab = mess_io.reader.rates.ktp_table(out_str)
+        assert ktp_tab.rxns == () and ktp_tab.ktp_arr.size == 0
+
+        codes = mess_io.reader.rates.ktp_table_filter_codes(
+            ktp_tab, tmin=500.0)
+        assert codes.shape == ktp_tab.ktp_arr.shape
+
+        assert mess_io.reader.rates.get_rxn_ktp_dct(out_str) == {}
+        assert mess_io.reader.rates.get_rxn_ktp_dct(
+            out_str, tmin=500.0, tmax=1000.0) == {}
+
+
+def test__filter_ktp_reasons():
+    """ test mess_io.reader.rates.filter_ktp_dct
+        test mess_io.reader.rates.ktp_dct_filter_reasons
+    """
+
+    ref_dct = {
+        0.1: (numpy.array([400., 600.]),
+              numpy.array([2.0e4, 3.0e4])),
+        1.0: (numpy.array([400., 600.]),
+              numpy.array([2.0e5, 3.0e5])),
+        10.0: (numpy.array([400., 600., 800.]),
+               numpy.array([2.0e6, 3.0e6, 4.0e6]))}
+    filt_ktp_dct = mess_io.reader.rates.filter_ktp_dct(
+        KTP_DCT1, bimol=False, tmin=400.0, tmax=800.0, pmax=10.0)
+    assert tuple(filt_ktp_dct.keys()) == tuple(ref_dct.keys())
+    for pressure, (temps, kts) in filt_ktp_dct.items():
+        assert numpy.allclose(temps, ref_dct[pressure][0])
+        assert numpy.allclose(kts, ref_dct[pressure][1])
+
+    reason_dct = mess_io.reader.rates.ktp_dct_filter_reasons(
+        KTP_DCT1, bimol=False, tmin=400.0, tmax=800.0, pmax=10.0)
+    assert reason_dct[0.01] == (
+        'negative', 'negative', 'negative',
+        'undefined', 'undefined', 'undefined')
+    assert reason_dct[10.0] == (
+        'temperature', 'valid', 'valid', 'valid',
+        'temperature', 'temperature')
+    assert reason_dct[100.0] == (
+        'temperature', 'pressure', 'pressure', 'pressure',
+        'temperature', 'temperature')
+
+    reason_dct = mess_io.reader.rates.ktp_dct_filter_reasons(
+        KTP_DCT2, bimol=True)
+    assert reason_dct[0.01] == (
+        'threshold', 'threshold', 'valid', 'valid', 'valid', 'valid')
+
+    # More than two sign changes
+    reason_dct = mess_io.reader.rates.ktp_dct_filter_reasons(
+        {1.0: ((200., 400., 600., 800., 1000., 1200.),
+               (1.0, -1.0, 1.0, -1.0, 1.0, 1.0))}, bimol=False)
+    assert reason_dct[1.0] == (
+        'negative', 'negative', 'negative', 'negative',
+        'oscillation', 'oscillation')
+
+    assert not mess_io.reader.rates.filter_ktp_dct(KTP_DCT3, bimol=False)
+
+
+def test__reaction_index():
+    """ test mess_io.reader.rates.reaction_index
+        test mess_io.reader.rates.filter_reactions
+    """
+
+    rxns = (
+        (('W1',), ('W2',), (None,)),
+        (('W1',), ('P1',), (None,)),
+        (('W2',), ('W1',), (None,)),
+        (('W1',), ('W2',), (None,)),
+        (('W2',), ('Loss',), (None,)),
+    )
+
+    uni_rxns, rxn_idx_dct, rev_idxs = mess_io.reader.rates.reaction_index(
+        rxns)
+    assert uni_rxns == rxns[:3] + rxns[4:]
+    assert rxn_idx_dct[rxns[2]] == 2
+    assert tuple(rev_idxs) == (2, -1, 0, -1)
+
+    assert mess_io.reader.rates.filter_reactions(uni_rxns) == rxns[:2]
+
+
+def test__micro_rates():
+    """ test mess_io.reader.rates.micro_rates
+        test mess_io.reader.rates.MicroRates
+    """
+
+    micro = mess_io.reader.rates.micro_rates(KE_OUT_STR)
+    assert micro.rxns == ('W1->W3', 'W1->P1')
+    assert micro.kes.shape == (2, 61)
+    assert numpy.isnan(micro.kes[0, 0])
+    assert micro.frags == ()
+
+    # values on the grid, log-linear in between, NaN outside
+    assert numpy.allclose(
+        micro.ke('W1', 'W3', [0.2, 0.4]), [7.76e-15, 1.10e-13])
+    assert numpy.isclose(
+        micro.ke('W1', 'W3', 0.3), numpy.sqrt(7.76e-15 * 1.10e-13))
+    assert numpy.isnan(micro.ke('W1', 'W3', 100.))
+    assert micro.density(numpy.array([[0.2], [0.4]])).shape == (2, 1)
+
+    # unknown reactions and fragments are key errors
+    with pytest.raises(KeyError):
+        micro.ke('W1', 'W2', 0.2)
+    with pytest.raises(KeyError):
+        micro.ke_dct('W1', 'W2')
+    with pytest.raises(KeyError):
+        micro.dos_rovib('H', 0.2)
+
+    _ke_dct = mess_io.reader.rates.ke_dct(KE_OUT_STR, 'W1', 'W3')
+    assert micro.ke_dct('W1', 'W3') == _ke_dct
+    assert _ke_dct[0.0] == 0.0 and numpy.isclose(_ke_dct[12.0], 50.4699)
+
+    # compact storage
+    npz_path = os.path.join(TMP_DIR, 'ke.npz')
+    micro.save(npz_path)
+    micro2 = mess_io.reader.rates.MicroRates.load(npz_path)
+    assert micro2.rxns == micro.rxns
+    assert numpy.allclose(micro2.kes, micro.kes, equal_nan=True)
+    assert numpy.allclose(micro2.ke('W1', 'P1', [0.3, 5.1]),
+                          micro.ke('W1', 'P1', [0.3, 5.1]))
+
+
 # def test__ke_dct():
 #     """ test mess_io.reader.rates.ke_dct
 #     """
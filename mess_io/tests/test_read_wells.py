@@ -49,3 +49,19 @@ def test__energies():
     assert numpy.isclose(
         mess_io.reader.well_thermal_energy(LOG_STR, 'W3', TEMP3),
         0.11904202744591934)
+
+
+def test__thermal_energies():
+    """ test mess_io.reader._wells.well_thermal_energies
+        test mess_io.reader._wells.thermal_energy_lookup
+    """
+    ene_dct = mess_io.reader.well_thermal_energies(LOG_STR)
+    assert sorted(ene_dct)[:3] == [600.0, 800.0, 1000.0]
+    assert numpy.isclose(
+        mess_io.reader.thermal_energy_lookup(ene_dct, 'W1', TEMP1),
+        0.009402248486357753)
+    assert numpy.isclose(
+        mess_io.reader.thermal_energy_lookup(ene_dct, 'W3', TEMP3),
+        0.11904202744591934)
+    assert mess_io.reader.thermal_energy_lookup(ene_dct, 'W1', 300.) is None
+    assert mess_io.reader.thermal_energy_lookup(ene_dct, 'W9', TEMP1) is None
@@ -0,0 +1,38 @@
+""" test mess_io._wellextend
+"""
+
+import os
+from ioformat import pathtools
+from mess_io import _wellextend
+
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+INP_PATH = os.path.join(PATH, 'data', 'inp')
+KTP_TAB_OUT_STR = pathtools.read_file(INP_PATH, 'rate.out')
+# An output whose temperatures are read, but without any rate constants
+NO_KTP_OUT_STR = """
+Pressure-Species Rate Tables:
+
+Reactant = W1   Temperature = 500 K
+
+Reactant = W1   Temperature = 1000 K
+
+Temperature-Species Rate Tables:
+
+"""
+
+
+def test__well_energies():
+    """ test mess_io._wellextend.well_energies
+    """
+
+    well_enes_dct = _wellextend.well_energies(KTP_TAB_OUT_STR, '', 1.0)
+    assert set(well_enes_dct) == {
+        'C5H4CH3', 'C5H5CH2-1', 'C5H5CH2', 'C5H5CH2-2', 'W5', 'W6'}
+    assert set(well_enes_dct.values()) == {None}
+
+    assert _wellextend.well_energies(NO_KTP_OUT_STR, '', 1.0) == {}
+
+
+if __name__ == '__main__':
+    test__well_energies()
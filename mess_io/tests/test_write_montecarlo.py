@@ -2,6 +2,7 @@
 Tests writing the input for a Monte Carlo sampling routine
 """
 
+import io
 import os
 from ioformat import pathtools
 import mess_io.writer
@@ -107,3 +108,9 @@ def test__dat():
 
     assert mc_dat1_str == pathtools.read_file(INP_PATH, 'mc_dat1.inp')
     assert mc_dat2_str == pathtools.read_file(INP_PATH, 'mc_dat2.inp')
+
+    # Writing into a sink gives the same data
+    sink = io.StringIO()
+    assert mess_io.writer.monte_carlo_data(
+        GEOS, ENES, grads=GRADS, hessians=HESSES, sink=sink) is None
+    assert sink.getvalue() == mc_dat2_str
@@ -4,40 +4,7 @@
   data from electronic structure calculations
 """
 
-from mess_io.writer._glob import messrates_inp_str
-from mess_io.writer._glob import messpf_inp_str
-from mess_io.writer._glob import messhr_inp_str
-from mess_io.writer._glob import global_rates_input_v1
-from mess_io.writer._glob import global_rates_input_v2
-from mess_io.writer._glob import global_pf_input
-from mess_io.writer._glob import global_energy_transfer_input
-from mess_io.writer._glob import pf_output
-from mess_io.writer._etrans import energy_down
-from mess_io.writer._etrans import collision_frequency
-from mess_io.writer._lump import well_lump_scheme
-from mess_io.writer._rxnchan import species
-from mess_io.writer._rxnchan import well
-from mess_io.writer._rxnchan import bimolecular
-from mess_io.writer._rxnchan import ts_sadpt
-from mess_io.writer._rxnchan import ts_variational
-from mess_io.writer._rxnchan import configs_union
-from mess_io.writer._rxnchan import dummy
-from mess_io.writer._spc import atom
-from mess_io.writer._spc import molecule
-from mess_io.writer._mol_inf import core_rigidrotor
-from mess_io.writer._mol_inf import core_multirotor
-from mess_io.writer._mol_inf import core_phasespace
-from mess_io.writer._mol_inf import core_rotd
-from mess_io.writer._mol_inf import rotor_hindered
-from mess_io.writer._mol_inf import rotor_internal
-from mess_io.writer._mol_inf import mdhr_data
-from mess_io.writer._mol_inf import umbrella_mode
-from mess_io.writer._mol_inf import tunnel_eckart
-from mess_io.writer._mol_inf import tunnel_read
-from mess_io.writer._monte_carlo import monte_carlo_species
-from mess_io.writer._monte_carlo import monte_carlo_data
-from mess_io.writer._monte_carlo import fluxional_mode
-from mess_io.writer._sec import SPC_SEP_STR
+from ioformat import lazy_load
 
 
 __all__ = [
@@ -83,3 +50,49 @@ __all__ = [
     # section library
     'SPC_SEP_STR'
 ]
+
+
+# Submodules and functions are imported on first access
+__getattr__, __dir__ = lazy_load(__name__, __all__, {
+    # global writers
+    'messrates_inp_str': 'mess_io.writer._glob',
+    'messpf_inp_str': 'mess_io.writer._glob',
+    'messhr_inp_str': 'mess_io.writer._glob',
+    'global_rates_input_v1': 'mess_io.writer._glob',
+    'global_rates_input_v2': 'mess_io.writer._glob',
+    'global_pf_input': 'mess_io.writer._glob',
+    'global_energy_transfer_input': 'mess_io.writer._glob',
+    'pf_output': 'mess_io.writer._glob',
+    # energy transfer
+    'energy_down': 'mess_io.writer._etrans',
+    'collision_frequency': 'mess_io.writer._etrans',
+    # well lumping
+    'well_lump_scheme': 'mess_io.writer._lump',
+    # reaction channel
+    'species': 'mess_io.writer._rxnchan',
+    'well': 'mess_io.writer._rxnchan',
+    'bimolecular': 'mess_io.writer._rxnchan',
+    'ts_sadpt': 'mess_io.writer._rxnchan',
+    'ts_variational': 'mess_io.writer._rxnchan',
+    'configs_union': 'mess_io.writer._rxnchan',
+    'dummy': 'mess_io.writer._rxnchan',
+    # species
+    'atom': 'mess_io.writer._spc',
+    'molecule': 'mess_io.writer._spc',
+    'core_rigidrotor': 'mess_io.writer._mol_inf',
+    'core_multirotor': 'mess_io.writer._mol_inf',
+    'core_phasespace': 'mess_io.writer._mol_inf',
+    'core_rotd': 'mess_io.writer._mol_inf',
+    'rotor_hindered': 'mess_io.writer._mol_inf',
+    'rotor_internal': 'mess_io.writer._mol_inf',
+    'mdhr_data': 'mess_io.writer._mol_inf',
+    'umbrella_mode': 'mess_io.writer._mol_inf',
+    'tunnel_eckart': 'mess_io.writer._mol_inf',
+    'tunnel_read': 'mess_io.writer._mol_inf',
+    # monte carlo
+    'monte_carlo_species': 'mess_io.writer._monte_carlo',
+    'monte_carlo_data': 'mess_io.writer._monte_carlo',
+    'fluxional_mode': 'mess_io.writer._monte_carlo',
+    # section library
+    'SPC_SEP_STR': 'mess_io.writer._sec',
+})
@@ -2,6 +2,7 @@
   Additional functions for formatting information for MESS strings
 """
 
+import itertools
 import numpy
 from ioformat import indent
 
@@ -23,6 +24,43 @@ def mess_label_format(spc_label, aux_id_label=None, calc_dens=False):
     return lbl
 
 
+# Format blocks of data, one line per row
+def block_format(row_fmt, rows):
+    """ Formats a block of rows of values into lines, using a single
+        %-style format for each row, e.g. '%6d%15f'. The whole block
+        is formatted in one operation, rather than by appending to a
+        string row by row, which matters for large grids of data.
+
+        :param row_fmt: %-style format for one row, without the newline
+        :type row_fmt: str
+        :param rows: values for each row of the block
+        :type rows: iterable(tuple) or numpy.ndarray
+        :return block_str: one line for each row, each ending in a newline
+        :rtype: str
+    """
+
+    if isinstance(rows, numpy.ndarray):
+        rows = rows.tolist()
+    rows = tuple(rows)
+    vals = tuple(itertools.chain.from_iterable(rows))
+
+    return ((row_fmt + '\n') * len(rows)) % vals
+
+
+def matrix_format(mat, val_fmt='%16.12f'):
+    """ Formats a matrix into a block of lines, one line per row,
+        with no separation between the right-aligned values.
+
+        :param mat: matrix to format
+        :type mat: tuple(tuple(float)) or numpy.ndarray
+        :param val_fmt: %-style format for each value of the matrix
+        :type val_fmt: str
+        :rtype: str
+    """
+    mat = numpy.array(mat, dtype=float, ndmin=2)
+    return block_format(val_fmt * mat.shape[1], mat)
+
+
 # Format various pieces of data into strings for MESS input files
 def zero_energy_format(zero_ene):
     """ Formats the zero point energy into a string that
@@ -50,11 +88,8 @@ def elec_levels_format(elec_levels):
     nlevels = len(elec_levels)
 
     # Build elec levels string
-    elec_levels_str = ''
-    for i, level in enumerate(elec_levels):
-        elec_levels_str += '  '.join(map(str, level))
-        if (i+1) != len(elec_levels):
-            elec_levels_str += '\n'
+    elec_levels_str = '\n'.join(
+        '  '.join(map(str, level)) for level in elec_levels)
 
     # Indent the lines
     elec_levels_str = indent(elec_levels_str, 4)
@@ -79,9 +114,12 @@ def geometry_format(geo, indent_lines=True):
 
     # Build geom string; converting the coordinates to angstrom
     gstr = ''
-    for (symb, xyz) in geo:
-        xyzc = tuple(val*0.529177 for val in xyz)
-        gstr += f'{symb:<4s}{xyzc[0]:>14.5f}{xyzc[1]:>14.5f}{xyzc[2]:>14.5f}\n'
+    if natoms:
+        symbs, xyzs = zip(*geo)
+        xyzs = (numpy.array(xyzs, dtype=float) * 0.529177).tolist()
+        gstr = block_format(
+            '%-4s%14.5f%14.5f%14.5f',
+            ((symb, *xyz) for symb, xyz in zip(symbs, xyzs)))
 
     # Remove final newline character and indent the lines
     if indent_lines:
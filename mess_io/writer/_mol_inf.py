@@ -2,6 +2,7 @@
 Writes MESS input for a molecule
 """
 
+import io
 import os
 import automol._deprecated
 from ioformat import build_mako_str
@@ -339,15 +340,21 @@ def rotor_internal(group, axis, symmetry, grid_size, mass_exp_size,
         template_keys=rotor_keys)
 
 
-def mdhr_data(pot_dct, freqs=None, nrot=0):
+def mdhr_data(pot_dct, freqs=None, nrot=0, sink=None):
     """ Writes the string for an auxiliary data file for MESS containing
         potentials and vibrational frequencies of a
         multidimensional hindered rotor, up to four dimensions.
 
+        The grid is formatted as a single block, which can be written
+        straight into an open file by passing it as the sink, in which
+        case nothing is returned.
+
         :param pots: potential values along torsional modes of rotor
         :type pots: list(list(float))
         :param freqs: vibrational frequenciess along torsional modes of rotor
         :type freqs: list(list(float))
+        :param sink: open text file (or io.StringIO) to write the data to
+        :type sink: io.TextIOBase
         :rtype: str
     """
 
@@ -401,28 +408,26 @@ def mdhr_data(pot_dct, freqs=None, nrot=0):
         freq_str = '\n'
         head_str += '\n'
 
-    # Build the lines for each point on the potential
-    dat_str = num_str + freq_str + head_str
+    # Build the lines for each point on the potential: the idxs for the
+    # rotors, the potential value, and any frequencies at the point
+    pt_fmt = '%6d' * ndims + '%15f'
+    row_fmts, rows = [], []
     for idxs, val in pots_byidx.items():
-
         if val is not None:
+            pt_freqs = tuple(freqs[idxs]) if (
+                freqs is not None and idxs in freqs) else ()
+            row_fmts.append(pt_fmt + '%8.1f' * len(pt_freqs))
+            rows.append(tuple(idx+1 for idx in idxs) + (val,) + pt_freqs)
+
+    out = io.StringIO() if sink is None else sink
+    out.write(num_str + freq_str + head_str)
+    if len(set(row_fmts)) == 1:
+        out.write(messformat.block_format(row_fmts[0], rows))
+    else:
+        for row_fmt, row in zip(row_fmts, rows):
+            out.write(messformat.block_format(row_fmt, (row,)))
 
-            # Add the idxs for the rotors
-            for idx in idxs:
-                dat_str += f'{idx+1:>6d}'
-
-            # Add the potential value
-            dat_str += f'{val:>15f}'
-
-            # Add any frequencies if necessary
-            if freqs is not None:
-                if idxs in freqs:
-                    for freq in freqs[idxs]:
-                        dat_str += f'{freq:>8.1f}'
-
-            dat_str += '\n'
-
-    return dat_str
+    return out.getvalue() if sink is None else None
 
 
 def umbrella_mode(group, plane, ref_atom, potential,
@@ -2,12 +2,11 @@
 Writes MESS input for a monte carlo partition function calculation
 """
 
+import io
 import os
 from phydat import phycon
 import automol.geom
-import automol.util.matrix
 from ioformat import build_mako_str
-from ioformat import remove_trail_whitespace
 from ioformat import indent
 from mess_io.writer import _format as messformat
 
@@ -96,12 +95,16 @@ def monte_carlo_species(geo, sym_factor, elec_levels,
         template_keys=monte_carlo_keys)
 
 
-def monte_carlo_data(geos, enes, grads=(), hessians=()):
+def monte_carlo_data(geos, enes, grads=(), hessians=(), sink=None):
     """ Writes the string for an auxliary data file required for
         Monte Carlo calculations in MESS that contains the
         geoetries, energies, gradients, and Hessians obtained
         from Monte Carlo sampling of the fluxional modes.
 
+        The data for each sampling point is written incrementally,
+        so a large data file can be written straight into an open file
+        by passing it as the sink, in which case nothing is returned.
+
         :param geos: geometries from sampling
         :type geos: list
         :param enes: energies from energies
@@ -110,6 +113,8 @@ def monte_carlo_data(geos, enes, grads=(), hessians=()):
         :type grads: list
         :param hessians: Hessians from sampling
         :type hessians: list
+        :param sink: open text file (or io.StringIO) to write the data to
+        :type sink: io.TextIOBase
         :rtype: str
     """
 
@@ -119,32 +124,25 @@ def monte_carlo_data(geos, enes, grads=(), hessians=()):
         assert grads and hessians
         assert len(geos) == len(enes) == len(grads) == len(hessians)
 
-    dat_str = ''
-    for idx, _ in enumerate(geos):
-        dat_str += 'Sampling point' + str(idx+1) + '\n'
-        dat_str += 'Energy' + '\n'
-        dat_str += f'{enes[idx]:.8f}\n'
-        dat_str += 'Geometry' + '\n'
-        dat_str += messformat.mc_geometry_format(geos[idx]) + '\n'
+    out = io.StringIO() if sink is None else sink
+
+    out.write('\n')
+    for idx, geo in enumerate(geos):
+        out.write(f'Sampling point{idx+1}\n'
+                  f'Energy\n{enes[idx]:.8f}\n'
+                  f'Geometry\n{messformat.mc_geometry_format(geo)}\n')
         if grads:
-            grad_str = automol.util.matrix.string(
-                grads[idx], val_format='{0:>16.12f}')
-            dat_str += 'Gradient'+'\n'
-            dat_str += grad_str + '\n'
+            out.write('Gradient\n')
+            out.write(messformat.matrix_format(grads[idx]))
         if hessians:
-            hess_str = automol.util.matrix.string(
-                hessians[idx], val_format='{0:>16.12f}')
-            dat_str += 'Hessian'+'\n'
-            dat_str += hess_str+'\n'
+            out.write('Hessian\n')
+            out.write(messformat.matrix_format(hessians[idx]))
 
-        dat_str += '\n'
-
-    # Format string as needed
-    if not grads and not hessians:
-        dat_str = remove_trail_whitespace(dat_str)
-    dat_str = '\n' + dat_str
+        # Points are only separated by blank lines if there are gradients
+        if grads or hessians:
+            out.write('\n')
 
-    return dat_str
+    return out.getvalue() if sink is None else None
 
 
 def fluxional_mode(atom_indices, span=6.28319):
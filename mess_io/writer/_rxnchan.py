@@ -250,15 +250,10 @@ def ts_variational(ts_label, reac_label, prod_label, rpath_strs,
         rxn_label, aux_id_label=aux_id_label, calc_dens=False)
 
     # Build the zero energy strings and add them to the rpath strings
-    full_rpath_str = ''
-    for rpath_str, zero_ene in zip(rpath_strs, zero_enes):
-        zero_ene_str = messformat.zero_energy_format(zero_ene)
-        zero_ene_str = messformat.indent(zero_ene_str, 2)
-
-        full_rpath_str += rpath_str
-        full_rpath_str += zero_ene_str
-        full_rpath_str += '\n\n'
-        full_rpath_str += 'End  ! RPATH PT\n'
+    full_rpath_str = ''.join(
+        f'{rpath_str}  {messformat.zero_energy_format(zero_ene)}\n\n'
+        'End  ! RPATH PT\n'
+        for rpath_str, zero_ene in zip(rpath_strs, zero_enes))
 
     # Concatenate all of the variational point strings and indent them
     ts_data = messformat.indent(full_rpath_str, 4)
@@ -320,18 +315,15 @@ def configs_union(mol_data_strs, zero_enes, tunnel_strs=None):
     """
 
     # Build the zero energy strings and add them to the union strings
-    union_data = ''
+    union_strs = []
     for idx, (union_str, zero_ene) in enumerate(zip(mol_data_strs, zero_enes)):
-        zero_ene_str = messformat.zero_energy_format(zero_ene)
-        zero_ene_str = messformat.indent(zero_ene_str, 2)
-
-        union_data += union_str
-        union_data += zero_ene_str
+        union_strs.append(union_str)
+        union_strs.append(f'  {messformat.zero_energy_format(zero_ene)}')
         if tunnel_strs is not None:
             _tunnel_str = f'\n{tunnel_strs[idx]}\nEnd  ! Tunnel\n'
-            union_data += messformat.indent(_tunnel_str, 2)
-        union_data += '\n\n'
-        union_data += f'End  ! Union{idx+1}\n'
+            union_strs.append(messformat.indent(_tunnel_str, 2))
+        union_strs.append(f'\n\nEnd  ! Union{idx+1}\n')
+    union_data = ''.join(union_strs)
 
     # Concatenate all of the molecule strings
     union_data = messformat.indent(union_data, 2)